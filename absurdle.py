@@ -0,0 +1,60 @@
+# absurdle.py
+
+import numpy as np
+
+from game    import Game
+from scoring import all_correct_code, decode_pattern, score_codes
+
+
+def partition(bank, guess_id, ids, matrix=None):
+    """
+    Split candidate IDs `ids` by the pattern `guess_id` would get against
+    each of them. Returns (codes per candidate, bucket sizes per code),
+    both computed vectorized: one row gather (or score_codes call) and
+    one bincount.
+    """
+    if matrix is not None:
+        codes = matrix.codes[guess_id, ids]
+    else:
+        enc   = bank.encoded
+        codes = score_codes(enc[guess_id], enc[ids])
+    sizes = np.bincount(codes, minlength=3 ** bank.word_length)
+    return codes, sizes
+
+
+def largest_bucket(sizes, word_length):
+    """
+    Code of the biggest bucket. Ties go to the lowest code (fewest/least
+    helpful hints), and the all-green bucket only wins when it's the
+    only one left.
+    """
+    sizes = sizes.copy()
+    solved = all_correct_code(word_length)
+    if sizes.sum() > sizes[solved]:
+        sizes[solved] = 0
+    return int(np.argmax(sizes))
+
+
+class AbsurdleGame(Game):
+    """
+    Adversarial Wordle: there is no fixed target. Each guess partitions
+    the surviving candidates by feedback pattern and the game keeps the
+    largest bucket, so the player only wins once they've pinned the
+    answer down to a single word and guessed it. `target` always holds
+    one word consistent with the feedback so far (shown on a loss).
+    """
+    def _score(self, guess):
+        ids = self.candidates.ids
+        codes, sizes = partition(self.bank, self.bank.id_of(guess), ids, self.patterns)
+        code = largest_bucket(sizes, self.word_length)
+
+        # any survivor of the kept bucket is a valid "answer so far"
+        self.target = self.bank[int(ids[np.argmax(codes == code)])]
+        return decode_pattern(code, self.word_length)
+
+    def reveal_letter(self):
+        # the answer isn't decided yet; Shop.use won't consume the boost
+        raise NotImplementedError("Absurdle has no fixed target to reveal")
+
+    def reveal_one_letter(self):
+        raise NotImplementedError("Absurdle has no fixed target to reveal")
@@ -0,0 +1,59 @@
+# bench_scoring.py
+#
+# Throughput of the vectorized score_batch kernel vs. the per-guess
+# reference scorer that Game.submit_guess used to run inline.
+#
+#   python bench_scoring.py [--guesses 200] [--targets 2000]
+
+import argparse
+import random
+import time
+
+from scoring  import decode_pattern, score_batch, score_guess
+from wordbank import get_word_bank
+
+
+def _bench_reference(guesses, targets):
+    start = time.perf_counter()
+    for g in guesses:
+        for t in targets:
+            score_guess(g, t)
+    return time.perf_counter() - start
+
+
+def _bench_batch(guesses, targets):
+    start = time.perf_counter()
+    for _ in score_batch(guesses, targets):
+        pass
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="score_batch vs. per-guess scoring throughput")
+    parser.add_argument('--guesses', type=int, default=200)
+    parser.add_argument('--targets', type=int, default=2000)
+    parser.add_argument('--seed',    type=int, default=0)
+    args = parser.parse_args()
+
+    bank = get_word_bank()
+    rng  = random.Random(args.seed)
+    guesses = [bank.random_word(rng) for _ in range(args.guesses)]
+    targets = [bank.random_word(rng) for _ in range(args.targets)]
+    pairs   = len(guesses) * len(targets)
+
+    # sanity: both paths agree before we time them
+    for rows, cols, codes in score_batch(guesses[:20], targets[:200]):
+        for i, g in enumerate(guesses[rows]):
+            for j, t in enumerate(targets[cols]):
+                assert decode_pattern(codes[i, j], bank.word_length) == score_guess(g, t)
+
+    ref   = _bench_reference(guesses, targets)
+    batch = _bench_batch(guesses, targets)
+    print(f"pairs:          {pairs:,}")
+    print(f"reference loop: {pairs / ref:14,.0f} pairs/s  ({ref:.3f}s)")
+    print(f"score_batch:    {pairs / batch:14,.0f} pairs/s  ({batch:.3f}s)")
+    print(f"speedup:        {ref / batch:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
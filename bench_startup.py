@@ -0,0 +1,80 @@
+# bench_startup.py
+#
+# Cold-start time: launches the game in fresh interpreters and measures
+# time-to-first-frame (process spawn -> main menu on screen) and how
+# long the background dictionary/index preload takes on top of that.
+#
+#   python bench_startup.py [--runs 10] [--window]
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Run inside the child: main() with a scheduler that lets one frame draw,
+# notes the time, waits for the preload thread and quits.
+_CHILD = r"""
+import json, sys, time
+t_start = time.time()
+import pygame
+import main, preload
+
+class FirstFrame:
+    calls = 0
+    def wait(self, wake_at=None, animating=False):
+        FirstFrame.calls += 1
+        if FirstFrame.calls == 1:
+            return []                              # let the menu draw once
+        first = time.time()
+        preload.start_preload().join()
+        FirstFrame.times = (first, time.time())
+        return [pygame.event.Event(pygame.QUIT)]
+
+main.main(scheduler=FirstFrame())
+first, ready = FirstFrame.times
+print(json.dumps({'start': t_start, 'first': first, 'ready': ready}))
+"""
+
+
+def run_once(headless: bool) -> dict:
+    env = dict(os.environ)
+    if headless:
+        env['SDL_VIDEODRIVER'] = 'dummy'
+    env['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+
+    spawned = time.time()
+    out = subprocess.run(
+        [sys.executable, '-c', _CHILD],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    times = json.loads(out.strip().splitlines()[-1])
+    return {
+        'interpreter': (times['start'] - spawned) * 1000,
+        'first_frame': (times['first'] - spawned) * 1000,
+        'ready':       (times['ready'] - spawned) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time-to-first-frame benchmark")
+    parser.add_argument('--runs',   type=int, default=10)
+    parser.add_argument('--window', action='store_true',
+                        help="open a real window instead of SDL's dummy driver")
+    args = parser.parse_args()
+
+    runs = [run_once(not args.window) for _ in range(args.runs)]
+    print(f"runs: {args.runs}  (ms since process spawn)")
+    for key, label in (('interpreter', 'python started'),
+                       ('first_frame', 'first frame'),
+                       ('ready',       'dictionary ready')):
+        samples = [r[key] for r in runs]
+        print(f"{label:<17} median {statistics.median(samples):8.1f}  "
+              f"min {min(samples):8.1f}  max {max(samples):8.1f}")
+
+
+if __name__ == "__main__":
+    main()
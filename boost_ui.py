@@ -1,7 +1,9 @@
 # boost_ui.py
 
 import pygame
-from config import WIDTH, HEIGHT, COLORS, FONT_NAME
+from config import WIDTH, HEIGHT, COLORS
+from fonts import get_font
+from text_cache import render_text
 from shop import CATALOG
 
 class BoostUI:
@@ -14,7 +16,7 @@ class BoostUI:
         self.shop   = shop
 
         # common font
-        self.font = pygame.font.SysFont(FONT_NAME, 24, bold=True)
+        self.font = get_font(24, bold=True)
 
         # build one entry per catalog item
         self.boosts = []
@@ -27,18 +29,32 @@ class BoostUI:
         for idx, (item_id, item) in enumerate(CATALOG.items()):
             x = start_x + idx * (btn_w + spacing)
             rect = pygame.Rect(x, y_pos, btn_w, btn_h)
-            label_surf = self.font.render(item.name, True, COLORS['text'])
+            label_surf = render_text(self.font, item.name, COLORS['text'])
             self.boosts.append({
                 'id':     item_id,
                 'rect':   rect,
                 'label':  label_surf
             })
 
+        # count each button was last drawn with (retained-mode redraws)
+        self._drawn = {}
+
+    def invalidate(self):
+        """Force a full repaint on the next draw()."""
+        self._drawn.clear()
+
     def draw(self):
-        inv = self.shop.get_inventory()
+        """Repaint buttons whose count changed; returns the dirty rects."""
+        inv   = self.shop.get_inventory()
+        dirty = []
 
         for b in self.boosts:
-            rect = b['rect']
+            rect  = b['rect']
+            count = inv.get(b['id'], 0)
+            if self._drawn.get(b['id']) == count:
+                continue
+            self._drawn[b['id']] = count
+            dirty.append(rect)
 
             # outer & inner boxes
             pygame.draw.rect(self.screen, COLORS['text'], rect, border_radius=6)
@@ -51,12 +67,13 @@ class BoostUI:
             self.screen.blit(b['label'], (lx, ly))
 
             # draw count below
-            count = inv.get(b['id'], 0)
-            cnt_surf = self.font.render(f"x{count}", True, COLORS['text'])
+            cnt_surf = render_text(self.font, f"x{count}", COLORS['text'])
             cx = rect.x + (rect.w - cnt_surf.get_width()) // 2
             cy = ly + b['label'].get_height() + 2
             self.screen.blit(cnt_surf, (cx, cy))
 
+        return dirty
+
     def handle_event(self, event):
         if event.type != pygame.MOUSEBUTTONDOWN:
             return None
@@ -0,0 +1,71 @@
+# candidates.py
+
+from typing import Iterator, Optional, Sequence
+
+import numpy as np
+
+from letter_index import Query, get_letter_index
+from patterns import PatternMatrix
+from scoring  import encode_status, score_codes
+from wordbank import WordBank
+
+
+class CandidateSet:
+    """
+    The targets still consistent with a game's feedback, as a sorted
+    array of WordBank IDs. Starts as the whole bank and is narrowed in
+    place after each guess, looking only at the current survivors: a
+    pattern-matrix row gather, or without a matrix a LetterIndex query
+    for the first guess (every word survives) and score_codes over the
+    survivors after that. `query` accumulates everything learned.
+    """
+    def __init__(self, bank: WordBank, matrix: Optional[PatternMatrix] = None):
+        self.bank   = bank
+        self.matrix = matrix
+        self.query  = Query(bank.word_length)    # everything learned so far
+        self._ids: Optional[np.ndarray] = None   # None = every word survives
+
+    @property
+    def ids(self) -> np.ndarray:
+        """Surviving word IDs, ascending."""
+        if self._ids is None:
+            self._ids = np.arange(len(self.bank))
+        return self._ids
+
+    @property
+    def mask(self) -> np.ndarray:
+        """Bool mask over all word IDs (built on demand)."""
+        mask = np.zeros(len(self.bank), dtype=bool)
+        mask[self.ids] = True
+        return mask
+
+    def __len__(self) -> int:
+        return len(self.bank) if self._ids is None else len(self._ids)
+
+    def __iter__(self) -> Iterator[str]:
+        words = self.bank.words
+        return (words[i] for i in self.ids)
+
+    def __contains__(self, word) -> bool:
+        word_id = self.bank.id_of(word)
+        if word_id is None:
+            return False
+        if self._ids is None:
+            return True
+        pos = np.searchsorted(self._ids, word_id)
+        return pos < len(self._ids) and self._ids[pos] == word_id
+
+    def narrow(self, guess: str, status: Sequence[str]):
+        """Drop every survivor that wouldn't have produced `status` for `guess`."""
+        self.query.add_feedback(guess, status)
+        if self.matrix is not None:
+            ids   = self.ids
+            codes = self.matrix.codes[self.bank.id_of(guess), ids]
+            self._ids = ids[codes == encode_status(status)]
+        elif self._ids is None:
+            index = get_letter_index(self.bank)
+            self._ids = index.ids(index.match(self.query))
+        else:
+            enc   = self.bank.encoded
+            codes = score_codes(enc[self.bank.id_of(guess)], enc[self._ids])
+            self._ids = self._ids[codes == encode_status(status)]
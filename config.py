@@ -4,6 +4,16 @@ HEIGHT       = 1100
 GRID_SIZE    = 6
 WORD_LENGTH  = 5
 
+# per-game choices offered in the menu (defaults above)
+WORD_LENGTHS = (4, 5, 6, 7, 8)
+ROW_CHOICES  = (4, 5, 6, 7, 8, 9, 10)
+
+# boards played at once; 1 is a normal game
+BOARD_CHOICES = (1, 4, 8, 16, 32)
+
+# target difficulty tiers, easiest first (see difficulty.py)
+TIERS = ('Easy', 'Normal', 'Hard')
+
 COLORS = {
     'correct': (106, 170, 100),
     'present': (201, 180,  88),
@@ -0,0 +1,380 @@
+# dawg.py
+#
+# Compact word store for large lexicons: a minimized acyclic word graph
+# (DAWG) in one memory-mapped file, built from a compiled word pack.
+# Large means many words, not other alphabets: like packs, scoring and
+# the keyboard, labels are A-Z only, so accented words never get this far
+# (wordpack.ingest rejects them).
+#
+#   python dawg.py build words.txt --lengths 5      # -> words.5.dawg
+#   python dawg.py info words.5.dawg
+#   python dawg.py prefix words.5.dawg CR --limit 20
+#
+# File layout (little endian): a 64-byte header (magic, version, word
+# length, word/node/edge counts, root node, CRC-32 of the payload,
+# WordBank digest) followed by
+#   first   u32[nodes + 1]  edges of node n are first[n] .. first[n+1]
+#   target  u32[edges]      node an edge leads to
+#   rank    u32[edges]      words under the node's earlier edges
+#   count   u32[nodes]      words reachable from the node
+#   label   u8[edges]       edge letter (A=0), ascending within a node
+# Counts are a property of the node's suffix language, so they survive
+# minimization: word IDs (= rank in sorted order, the same IDs WordBank
+# uses) follow from summing `rank` along a path.
+
+import argparse
+import bisect
+import mmap
+import operator
+import os
+import random
+import struct
+import tempfile
+import time
+import zlib
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from wordbank import WORDS_FILE, WordBank
+from wordpack import default_stem, ensure_pack, is_fresh, load_pack
+
+MAGIC       = b'DAWG'
+VERSION     = 1
+HEADER      = struct.Struct('<4sHBxIIIII16s')
+HEADER_SIZE = 64
+
+_A = ord('A')
+
+
+def dawg_path(stem: str, word_length: int) -> str:
+    """`<stem>.<word_length>.dawg`, next to the pack."""
+    return f"{stem}.{word_length}.dawg"
+
+# ————————————————————————————————————————————————————————————————
+# Building
+# ————————————————————————————————————————————————————————————————
+
+def compile_dawg(letters: np.ndarray) -> Tuple[Dict[str, np.ndarray], int]:
+    """
+    Minimal DAWG for sorted, unique (N, L) letter rows (a pack payload).
+    Returns the arrays of the file layout and the root node.
+
+    Works bottom-up over the implicit trie of the rows: depth-d trie
+    nodes are the distinct length-d prefixes, and two nodes merge when
+    they have the same (label, merged child) edges. Node 0 is the final
+    node every word ends in.
+    """
+    n, L = letters.shape
+    # starts[d]: first row of each distinct length-(d+1) prefix
+    starts, new = [], np.zeros(n, dtype=bool)
+    for d in range(L):
+        col  = letters[:, d]
+        new |= np.r_[n > 0, col[1:] != col[:-1]][:n]
+        starts.append(np.flatnonzero(new))
+
+    labels:  List[int] = []
+    targets: List[int] = []
+    first   = [0, 0]                 # node 0: final, no edges
+    count   = [1] if n else [0]
+    registry: Dict[tuple, int] = {}
+
+    canon = np.zeros(len(starts[-1]) if L else 0, dtype=np.int64)   # depth L -> node 0
+    for d in range(L - 1, -1, -1):
+        rows   = starts[d]
+        lbl    = letters[rows, d].tolist()
+        child  = canon.tolist()
+        parent = (np.searchsorted(starts[d - 1], rows, 'right') - 1) if d else np.zeros(len(rows), int)
+        bounds = np.flatnonzero(np.r_[True, parent[1:] != parent[:-1]]).tolist() + [len(rows)]
+
+        canon = np.empty(len(bounds) - 1, dtype=np.int64)
+        for p, (lo, hi) in enumerate(zip(bounds, bounds[1:])):
+            key  = (tuple(lbl[lo:hi]), tuple(child[lo:hi]))
+            node = registry.get(key)
+            if node is None:
+                node = registry[key] = len(count)
+                labels  += key[0]
+                targets += key[1]
+                first.append(len(labels))
+                count.append(sum(count[c] for c in key[1]))
+            canon[p] = node
+
+    root = int(canon[0]) if n else 0
+    if L == 0 or n == 0:
+        root = 0
+
+    first_a  = np.array(first, dtype='<u4')
+    target_a = np.array(targets, dtype='<u4')
+    count_a  = np.array(count, dtype='<u4')
+    # rank: words under earlier siblings (exclusive prefix sum within each node)
+    rank_a   = np.zeros(len(targets), dtype='<u4')
+    if len(targets):
+        under  = count_a[target_a].astype(np.int64)
+        cum    = np.cumsum(under) - under
+        owner  = np.repeat(np.arange(len(count)), np.diff(first_a))
+        rank_a = (cum - cum[first_a[owner]]).astype('<u4')
+    arrays = dict(first=first_a, target=target_a, rank=rank_a, count=count_a,
+                  label=np.array(labels, dtype=np.uint8))
+    return arrays, root
+
+
+def dawg_bytes(letters: np.ndarray, digest: str) -> bytes:
+    """The whole file for `letters` (see the layout above)."""
+    arrays, root = compile_dawg(letters)
+    payload = b''.join(arrays[k].tobytes() for k in ('first', 'target', 'rank', 'count', 'label'))
+    header  = HEADER.pack(
+        MAGIC, VERSION, letters.shape[1], len(letters), len(arrays['count']),
+        len(arrays['label']), root, zlib.crc32(payload), digest.encode('ascii')
+    )
+    return header.ljust(HEADER_SIZE, b'\0') + payload
+
+
+def write_dawg(path: str, letters: np.ndarray, digest: str):
+    data = dawg_bytes(letters, digest)
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp',
+                               dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, 'wb') as fp:
+            fp.write(data)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+# ————————————————————————————————————————————————————————————————
+# The store
+# ————————————————————————————————————————————————————————————————
+
+class Dawg:
+    """
+    Read-only word store over a DAWG buffer (usually an mmap). Behaves
+    like the sorted word tuple of a WordBank: len(), indexing by word
+    ID, iteration in order and `in`, plus index(), with_prefix(),
+    prefix_range() and sample(). Every lookup walks at most L nodes and
+    scans at most 26 edges per node; nothing per word is held in memory.
+    """
+    def __init__(self, buf, verify: bool = True):
+        if len(buf) < HEADER_SIZE:
+            raise ValueError("truncated DAWG header")
+        magic, version, L, n, nodes, edges, root, crc, digest = HEADER.unpack_from(buf)
+        if magic != MAGIC:
+            raise ValueError("not a DAWG file")
+        if version != VERSION:
+            raise ValueError(f"unsupported DAWG version {version}")
+        size = HEADER_SIZE + 4 * (2 * nodes + 1 + 2 * edges) + edges
+        if len(buf) != size:
+            raise ValueError("DAWG size doesn't match header")
+        if verify and zlib.crc32(memoryview(buf)[HEADER_SIZE:]) != crc:
+            raise ValueError("DAWG checksum mismatch")
+
+        self.word_length = L
+        self.digest      = digest.decode('ascii')
+        self._n, self._root, self._buf = n, root, buf
+
+        def u32(offset, length):
+            # python-int element access (native order == little endian here)
+            arr = np.frombuffer(buf, dtype='<u4', count=length, offset=offset)
+            return memoryview(arr.astype('=u4', copy=False)), offset + 4 * length
+        off = HEADER_SIZE
+        self._first,  off = u32(off, nodes + 1)
+        self._target, off = u32(off, edges)
+        self._rank,   off = u32(off, edges)
+        self._count,  off = u32(off, nodes)
+        self._label = off               # labels are searched in place with buf.find()
+
+    @classmethod
+    def load(cls, path: str, verify: bool = True) -> 'Dawg':
+        with open(path, 'rb') as fp:
+            buf = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buf, verify)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._buf)
+
+    def __len__(self) -> int:
+        return self._n
+
+    # ─── walking ─────────────────────────────────────────────────────
+
+    def _edge(self, node: int, ch: str) -> int:
+        """Edge out of `node` labelled `ch`, or -1."""
+        x = ord(ch) - _A
+        if not 0 <= x < 26:
+            return -1
+        base = self._label
+        k = self._buf.find(bytes((x,)), base + self._first[node], base + self._first[node + 1])
+        return k - base if k >= 0 else -1
+
+    def _walk(self, prefix: str) -> Tuple[int, int]:
+        """(node reached by `prefix`, ID of its first word), node -1 if absent."""
+        node, rank = self._root, 0
+        for ch in prefix:
+            e = self._edge(node, ch)
+            if e < 0:
+                return -1, 0
+            rank += self._rank[e]
+            node  = self._target[e]
+        return node, rank
+
+    def index(self, word: str) -> Optional[int]:
+        """Word ID of `word` (its rank in sorted order), or None."""
+        if not isinstance(word, str) or len(word) != self.word_length or not self._n:
+            return None
+        node, rank = self._walk(word)
+        return rank if node >= 0 else None
+
+    def __contains__(self, word) -> bool:
+        return self.index(word) is not None
+
+    def __getitem__(self, word_id) -> str:
+        i = operator.index(word_id)
+        if i < 0:
+            i += self._n
+        if not 0 <= i < self._n:
+            raise IndexError("word ID out of range")
+        node, out = self._root, []
+        first, rank, base = self._first, self._rank, self._label
+        for _ in range(self.word_length):
+            # last edge whose rank <= i
+            e  = bisect.bisect_right(rank, i, first[node], first[node + 1]) - 1
+            i -= rank[e]
+            out.append(chr(self._buf[base + e] + _A))
+            node = self._target[e]
+        return ''.join(out)
+
+    def sample(self, rng: Optional[random.Random] = None) -> str:
+        """Uniformly random word, O(word_length)."""
+        return self[(rng or random).randrange(self._n)]
+
+    # ─── enumeration ─────────────────────────────────────────────────
+
+    def prefix_range(self, prefix: str) -> Tuple[int, int]:
+        """(first ID, number of words) for words starting with `prefix`."""
+        node, rank = self._walk(prefix.upper())
+        if node < 0 or not self._n or len(prefix) > self.word_length:
+            return 0, 0
+        return rank, self._count[node]
+
+    def with_prefix(self, prefix: str = "", limit: Optional[int] = None) -> Iterator[str]:
+        """Words starting with `prefix`, in ID order (depth-first, no lookups)."""
+        prefix = prefix.upper()
+        node, _ = self._walk(prefix)
+        if node < 0 or not self._n or len(prefix) > self.word_length:
+            return
+        first, target, buf, base = self._first, self._target, self._buf, self._label
+        stack, left = [(node, prefix)], limit
+        while stack:
+            node, word = stack.pop()
+            if len(word) == self.word_length:
+                yield word
+                if left is not None:
+                    left -= 1
+                    if left <= 0:
+                        return
+                continue
+            for e in range(first[node + 1] - 1, first[node] - 1, -1):
+                stack.append((target[e], word + chr(buf[base + e] + _A)))
+
+    def __iter__(self) -> Iterator[str]:
+        return self.with_prefix()
+
+# ————————————————————————————————————————————————————————————————
+# WordBank over a Dawg
+# ————————————————————————————————————————————————————————————————
+
+class CompactWordBank(WordBank):
+    """
+    WordBank whose `words` is a Dawg instead of a tuple of str plus
+    dict/frozenset indexes, so a large lexicon costs its mapped file
+    pages rather than tens of MB of Python objects per process. IDs,
+    digest and `encoded` (the pack's mapped letters) are the same as a
+    plain WordBank of the same words, so matrices, indexes and the
+    solver work unchanged. get_word_bank() picks this for big banks.
+    """
+    def __init__(self, dawg: Dawg, source: Optional[str] = None, encoded=None):
+        self.dawg        = dawg
+        self.words       = dawg
+        self.word_length = dawg.word_length
+        self.source      = source
+        self.digest      = dawg.digest
+        self._encoded    = encoded
+
+    @classmethod
+    def from_pack(cls, path: str, source: Optional[str] = None) -> 'CompactWordBank':
+        """Bank for a compiled pack, building/refreshing its .dawg beside it."""
+        header, letters = load_pack(path)
+        dpath = os.path.splitext(path)[0] + '.dawg'           # words.5.pack -> words.5.dawg
+        try:
+            if not is_fresh(dpath, path):
+                write_dawg(dpath, letters, header.digest)
+            try:
+                dawg = Dawg.load(dpath)
+            except ValueError:
+                write_dawg(dpath, letters, header.digest)     # damaged: rebuild once
+                dawg = Dawg.load(dpath)
+        except OSError:
+            # read-only install: same structure, held in memory
+            dawg = Dawg(dawg_bytes(letters, header.digest), verify=False)
+        return cls(dawg, source or path, encoded=letters.view(np.ndarray))
+
+    def __contains__(self, word) -> bool:
+        return word in self.dawg
+
+    def id_of(self, word: str) -> Optional[int]:
+        return self.dawg.index(word)
+
+
+def ensure_dawg(source: str, word_length: int) -> str:
+    """Path of the .dawg for `source` at `word_length`, (re)built if stale."""
+    pack  = ensure_pack(source, word_length)
+    dpath = dawg_path(default_stem(source), word_length)
+    if not is_fresh(dpath, pack):
+        header, letters = load_pack(pack)
+        write_dawg(dpath, letters, header.digest)
+    return dpath
+
+# ————————————————————————————————————————————————————————————————
+# CLI
+# ————————————————————————————————————————————————————————————————
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and query DAWG word stores")
+    sub = parser.add_subparsers(dest='cmd', required=True)
+
+    bld = sub.add_parser('build', help="compile <source>.<L>.dawg from a word list")
+    bld.add_argument('source', nargs='?', default=WORDS_FILE)
+    bld.add_argument('--lengths', default='5', help="e.g. 5 or 4-8")
+
+    inf = sub.add_parser('info', help="print and verify a .dawg header")
+    inf.add_argument('paths', nargs='+')
+
+    pre = sub.add_parser('prefix', help="list words starting with a prefix")
+    pre.add_argument('path')
+    pre.add_argument('prefix')
+    pre.add_argument('--limit', type=int, default=30)
+    args = parser.parse_args()
+
+    if args.cmd == 'build':
+        lo, _, hi = args.lengths.partition('-')
+        for L in range(int(lo), int(hi or lo) + 1):
+            start = time.perf_counter()
+            path  = ensure_dawg(args.source, L)
+            print(f"{path}: built in {time.perf_counter() - start:.2f}s")
+    elif args.cmd == 'info':
+        for path in args.paths:
+            dawg  = Dawg.load(path)
+            words = len(dawg) * dawg.word_length
+            print(f"{path}: {len(dawg)} words of length {dawg.word_length}, "
+                  f"{dawg.nbytes} bytes ({dawg.nbytes / max(1, words):.2f} per letter), "
+                  f"digest {dawg.digest} (ok)")
+    else:
+        dawg = Dawg.load(args.path)
+        start, n = dawg.prefix_range(args.prefix)
+        print(f"{n} words start with {args.prefix.upper()} (IDs {start}..{start + n - 1})")
+        for word in dawg.with_prefix(args.prefix, args.limit):
+            print(f"  {word}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+# difficulty.py
+#
+# Per-target difficulty: how many guesses the reference (entropy) solver
+# needs for each word, computed once per dictionary over a process pool
+# and saved as a compact table that Game samples targets from by tier.
+#
+#   python difficulty.py                          # words.txt, 5 letters
+#   python difficulty.py --words big.txt --workers 8
+
+import argparse
+import multiprocessing
+import os
+import random
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from config   import TIERS, WORD_LENGTH
+from patterns import cache_path, get_pattern_matrix
+from wordbank import WORDS_FILE, WordBank, get_word_bank
+
+# The solver gets this many rows while rating (it never needs them all)
+RATING_GUESSES = 12
+
+# Targets per pool task
+CHUNK_TARGETS = 256
+
+
+class Ratings:
+    """
+    Difficulty table for one dictionary, indexed by word ID:
+      guesses – rows the reference solver needs (uint8)
+      left    – candidates still open after its opener (uint32), which
+                breaks ties: of two words solved in as many guesses, the
+                one the opener narrowed down less is rated harder
+    `order` lists word IDs easiest first and `bounds` splits it into
+    config.TIERS (equal shares), so sampling a tier is one randrange.
+    """
+    def __init__(self, bank: WordBank, guesses: np.ndarray, left: np.ndarray):
+        self.bank    = bank
+        self.guesses = guesses
+        self.left    = left
+        self.order   = np.lexsort((left, guesses)).astype(np.uint32)
+        n = len(self.order)
+        self.bounds  = [n * i // len(TIERS) for i in range(len(TIERS) + 1)]
+
+    def tier_ids(self, tier: str) -> np.ndarray:
+        """Word IDs in `tier`, easiest first (a view, no copy)."""
+        i = TIERS.index(tier)
+        return self.order[self.bounds[i]:self.bounds[i + 1]]
+
+    def sample(self, tier: str, rng: Optional[random.Random] = None) -> str:
+        """A uniformly random word from `tier`, O(1); any word if the tier is empty."""
+        ids = self.tier_ids(tier)
+        if not len(ids):
+            return self.bank.random_word(rng)
+        return self.bank[int(ids[(rng or random).randrange(len(ids))])]
+
+    def tier_of(self, word: str) -> str:
+        rank = int(np.flatnonzero(self.order == self.bank.id_of(word))[0])
+        return TIERS[min(len(TIERS) - 1, rank * len(TIERS) // len(self.order))]
+
+    def save(self, path: str):
+        tmp = f"{path}.{os.getpid()}.tmp.npz"
+        try:
+            np.savez(tmp, digest=np.array(self.bank.digest), guesses=self.guesses, left=self.left)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    @classmethod
+    def load(cls, bank: WordBank, path: str) -> 'Ratings':
+        with np.load(path) as data:
+            if str(data['digest']) != bank.digest:
+                raise ValueError(f"{path}: built for another dictionary")
+            if data['guesses'].shape != (len(bank),):
+                raise ValueError(f"{path}: wrong number of words")
+            return cls(bank, data['guesses'], data['left'])
+
+# ————————————————————————————————————————————————————————————————
+# Rating: play the reference solver against every target
+# ————————————————————————————————————————————————————————————————
+
+def rate_targets(bank: WordBank, target_ids: Sequence[int]):
+    """(guesses, left-after-opener) arrays for `target_ids`, solved in this process."""
+    from game   import Game
+    from solver import best_guess_for
+
+    guesses = np.empty(len(target_ids), dtype=np.uint8)
+    left    = np.empty(len(target_ids), dtype=np.uint32)
+    for i, target_id in enumerate(target_ids):
+        game = Game(bank=bank, target=bank[int(target_id)],
+                    max_guesses=RATING_GUESSES, record_stats=False)
+        while not game.is_over():
+            game.current_guess = best_guess_for(game)
+            game.submit_guess()
+            if len(game.guesses) == 1:
+                left[i] = len(game.candidates)
+        guesses[i] = len(game.guesses) if game.is_won() else RATING_GUESSES + 1
+    return guesses, left
+
+
+_worker_bank = None
+
+
+def _pool_init(words_file, word_length):
+    global _worker_bank
+    _worker_bank = get_word_bank(words_file, word_length)
+    get_pattern_matrix(_worker_bank)
+
+
+def _pool_task(target_ids):
+    return rate_targets(_worker_bank, target_ids)
+
+
+def build_ratings(bank: WordBank, workers: Optional[int] = None) -> Ratings:
+    """Rate every word of `bank`, chunks of targets spread over `workers` processes."""
+    ids    = np.arange(len(bank))
+    chunks = [ids[i:i + CHUNK_TARGETS] for i in range(0, len(ids), CHUNK_TARGETS)]
+    if bank.source is None or (workers or os.cpu_count() or 1) < 2:
+        parts = [rate_targets(bank, chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_pool_init,
+            initargs=(bank.source, bank.word_length),
+            mp_context=multiprocessing.get_context('spawn')
+        ) as pool:
+            parts = list(pool.map(_pool_task, chunks))
+    guesses = np.concatenate([p[0] for p in parts]) if parts else np.empty(0, np.uint8)
+    left    = np.concatenate([p[1] for p in parts]) if parts else np.empty(0, np.uint32)
+    return Ratings(bank, guesses, left)
+
+# ————————————————————————————————————————————————————————————————
+# Shared instances: loaded from disk once per dictionary
+# ————————————————————————————————————————————————————————————————
+
+_RATINGS: Dict[str, Optional[Ratings]] = {}
+_RATINGS_LOCK = threading.Lock()
+
+
+def ratings_path(bank: WordBank) -> Optional[str]:
+    """`words.<digest>.ratings.npz` next to the bank's source file."""
+    return cache_path(bank, 'ratings.npz')
+
+
+def get_ratings(bank: Optional[WordBank] = None) -> Optional[Ratings]:
+    """
+    The saved ratings for `bank` (default: the shared bank), or None if
+    they haven't been built for this exact word list. Never builds them.
+    """
+    bank = bank or get_word_bank()
+    if bank.digest in _RATINGS:
+        return _RATINGS[bank.digest]
+    with _RATINGS_LOCK:
+        if bank.digest not in _RATINGS:
+            path, ratings = ratings_path(bank), None
+            if path and os.path.exists(path):
+                try:
+                    ratings = Ratings.load(bank, path)
+                except (OSError, ValueError, KeyError):
+                    ratings = None      # stale or damaged: rebuild with the CLI
+            _RATINGS[bank.digest] = ratings
+        return _RATINGS[bank.digest]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rate every target by solver difficulty")
+    parser.add_argument('--words',   default=WORDS_FILE)
+    parser.add_argument('--length',  type=int, default=WORD_LENGTH)
+    parser.add_argument('--workers', type=int, default=None, help="processes (default: all cores)")
+    args = parser.parse_args()
+
+    bank  = get_word_bank(args.words, args.length)
+    start = time.perf_counter()
+    ratings = build_ratings(bank, args.workers)
+    took  = time.perf_counter() - start
+
+    path = ratings_path(bank)
+    ratings.save(path)
+    with _RATINGS_LOCK:
+        _RATINGS[bank.digest] = ratings
+    print(f"rated {len(bank)} targets in {took:.1f}s -> {path}")
+    for tier in TIERS:
+        ids = ratings.tier_ids(tier)
+        g   = ratings.guesses[ids]
+        print(f"  {tier:<7} {len(ids):>6} words, {g.mean():.2f} guesses on average "
+              f"({g.min()}-{g.max()}), e.g. {', '.join(ratings.bank[int(i)] for i in ids[:: max(1, len(ids) // 4)][:4])}")
+
+
+if __name__ == "__main__":
+    main()
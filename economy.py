@@ -0,0 +1,182 @@
+# economy.py
+#
+# Monte Carlo model of the coin/shop economy: simulates many player
+# careers at once with NumPy, reading prices from the live shop.CATALOG
+# and the win payout from game.COINS_PER_WIN.
+#
+#   python economy.py --players 1000000 --games 200 --win-prob 0.8
+#   python economy.py --buy best_guess,extra_guess --effect extra_guess=0.15
+
+import argparse
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from game import COINS_PER_WIN
+from shop import CATALOG
+
+# Assumed win-probability bonus when a boost is spent on a game.
+# Placeholder numbers: override with --effect once real data exists.
+DEFAULT_EFFECTS: Dict[str, float] = {
+    'extra_guess':   0.10,
+    'reveal_random': 0.05,
+    'reveal_one':    0.07,
+    'best_guess':    0.12,
+    'matches_left':  0.03,
+}
+
+
+def cheapest_first() -> Sequence[str]:
+    """Default purchase priority: catalog items by ascending cost."""
+    return [item.id for item in sorted(CATALOG.values(), key=lambda i: i.cost)]
+
+
+def simulate_economy(
+    players: int = 100_000,
+    games: int = 100,
+    win_prob: float = 0.8,
+    skill_spread: float = 0.1,
+    coins_per_win: int = COINS_PER_WIN,
+    coins_per_loss: int = 0,
+    buy_priority: Optional[Sequence[str]] = None,
+    buys_per_game: int = 1,
+    uses_per_game: int = 1,
+    effects: Optional[Dict[str, float]] = None,
+    start_coins: int = 0,
+    seed: int = 0
+) -> Dict[str, np.ndarray]:
+    """
+    Simulate `players` careers of `games` games each.
+
+    Each game a player spends up to `uses_per_game` owned boosts (largest
+    effect first), wins with their base probability plus the boosts'
+    bonus, earns coins, then buys up to `buys_per_game` items in
+    `buy_priority` order while they can afford them.
+
+    Returns per-game time series (balance percentiles, mean inventory,
+    win rate) and final per-player balance/inventory/boost-use arrays.
+    """
+    rng     = np.random.default_rng(seed)
+    effects = {**DEFAULT_EFFECTS, **(effects or {})}
+    items   = list(CATALOG.values())
+    ids     = [item.id for item in items]
+    costs   = np.array([item.cost for item in items])
+    bonus   = np.array([effects.get(i, 0.0) for i in ids])
+    buy_order = [ids.index(i) for i in (cheapest_first() if buy_priority is None else buy_priority)]
+    use_order = list(np.argsort(-bonus, kind='stable'))
+
+    # per-player skill
+    base = np.clip(rng.normal(win_prob, skill_spread, players), 0.0, 1.0)
+
+    balance   = np.full(players, start_coins, dtype=np.int64)
+    inventory = np.zeros((players, len(items)), dtype=np.int32)
+    used_tot  = np.zeros((players, len(items)), dtype=np.int32)
+
+    pct_levels   = (10, 50, 90)
+    balance_pcts = np.empty((games, len(pct_levels)))
+    inv_mean     = np.empty((games, len(items)))
+    win_rate     = np.empty(games)
+
+    for g in range(games):
+        # 1) spend boosts
+        p = base.copy()
+        n_used = np.zeros(players, dtype=np.int32)
+        for k in use_order:
+            if bonus[k] <= 0:
+                continue
+            use = (inventory[:, k] > 0) & (n_used < uses_per_game)
+            inventory[:, k] -= use
+            used_tot[:, k]  += use
+            n_used          += use
+            p += use * bonus[k]
+
+        # 2) play and get paid
+        won = rng.random(players) < np.minimum(p, 1.0)
+        balance += np.where(won, coins_per_win, coins_per_loss)
+
+        # 3) shop
+        n_bought = np.zeros(players, dtype=np.int32)
+        for k in buy_order:
+            buy = (balance >= costs[k]) & (n_bought < buys_per_game)
+            balance         -= buy * costs[k]
+            inventory[:, k] += buy
+            n_bought        += buy
+
+        balance_pcts[g] = np.percentile(balance, pct_levels)
+        inv_mean[g]     = inventory.mean(axis=0)
+        win_rate[g]     = won.mean()
+
+    return {
+        'items':          np.array(ids),
+        'balance_pcts':   balance_pcts,     # (games, 3): p10/p50/p90
+        'inventory_mean': inv_mean,         # (games, items)
+        'win_rate':       win_rate,         # (games,)
+        'final_balance':  balance,          # (players,)
+        'final_inventory': inventory,       # (players, items)
+        'boosts_used':    used_tot,         # (players, items)
+    }
+
+
+def _parse_effects(pairs):
+    effects = {}
+    for pair in pairs or []:
+        key, _, value = pair.partition('=')
+        if key not in CATALOG:
+            raise SystemExit(f"unknown item {key!r}; known: {', '.join(CATALOG)}")
+        effects[key] = float(value)
+    return effects
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Coin/shop economy Monte Carlo")
+    parser.add_argument('--players',  type=int,   default=100_000)
+    parser.add_argument('--games',    type=int,   default=100)
+    parser.add_argument('--win-prob', type=float, default=0.8)
+    parser.add_argument('--skill-spread',   type=float, default=0.1)
+    parser.add_argument('--coins-per-win',  type=int,   default=COINS_PER_WIN)
+    parser.add_argument('--coins-per-loss', type=int,   default=0)
+    parser.add_argument('--buy', default=None,
+                        help="comma-separated purchase priority, 'none', "
+                             "or omit for cheapest-first")
+    parser.add_argument('--buys-per-game', type=int, default=1)
+    parser.add_argument('--uses-per-game', type=int, default=1)
+    parser.add_argument('--effect', action='append',
+                        help="item_id=win_prob_bonus (repeatable)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    if args.buy is None:
+        priority = None
+    elif args.buy == 'none':
+        priority = []
+    else:
+        priority = args.buy.split(',')
+        for key in priority:
+            if key not in CATALOG:
+                raise SystemExit(f"unknown item {key!r}; known: {', '.join(CATALOG)}")
+
+    res = simulate_economy(
+        args.players, args.games, args.win_prob, args.skill_spread,
+        args.coins_per_win, args.coins_per_loss, priority,
+        args.buys_per_game, args.uses_per_game, _parse_effects(args.effect),
+        seed=args.seed
+    )
+
+    items = list(res['items'])
+    print("prices: " + ", ".join(f"{i}={CATALOG[i].cost}" for i in items))
+    print(f"{'game':>6} {'win%':>6} {'p10':>6} {'p50':>6} {'p90':>6}  "
+          + " ".join(f"{i[:12]:>12}" for i in items))
+    step = max(1, args.games // 10)
+    for g in list(range(step - 1, args.games, step)):
+        p10, p50, p90 = res['balance_pcts'][g]
+        inv = " ".join(f"{v:12.2f}" for v in res['inventory_mean'][g])
+        print(f"{g + 1:>6} {res['win_rate'][g] * 100:6.1f} {p10:6.0f} {p50:6.0f} {p90:6.0f}  {inv}")
+
+    used = res['boosts_used'].mean(axis=0)
+    print("boosts used per player: " + ", ".join(
+        f"{i}={u:.2f}" for i, u in zip(items, used)
+    ))
+
+
+if __name__ == "__main__":
+    main()
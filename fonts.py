@@ -0,0 +1,29 @@
+# fonts.py
+
+from typing import Dict, Tuple
+
+import pygame
+
+from config import FONT_NAME
+
+_FONTS: Dict[Tuple[str, int, bool], pygame.font.Font] = {}
+
+
+def get_font(size: int, bold: bool = False, name: str = FONT_NAME) -> pygame.font.Font:
+    """
+    Shared font for (name, size, bold). pygame.font.SysFont does a
+    system font lookup on every call, so each combination is resolved
+    once per process and every screen reuses the same Font object
+    (which also keeps the text cache's per-font keys hitting).
+    """
+    key  = (name, size, bold)
+    font = _FONTS.get(key)
+    if font is None:
+        font = pygame.font.SysFont(name, size, bold=bold)
+        _FONTS[key] = font
+    return font
+
+
+def clear_fonts():
+    """Forget all fonts (they are invalid after pygame.quit())."""
+    _FONTS.clear()
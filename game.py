@@ -1,25 +1,64 @@
 # game.py
 
 import random
-import json
-import os
-from config import WORD_LENGTH, GRID_SIZE
+import sqlite3
+import time
+from config import GRID_SIZE
+from wordbank import get_word_bank, is_letter
+from patterns import get_pattern_matrix
+from scoring  import score_guess
+from solver   import request_best_guess
+from candidates import CandidateSet
+from letter_index import get_letter_index
+from hard_mode import HardModeRules
+from stats_store import get_stats_store
+from difficulty import get_ratings
+
+# Coins awarded for a win (see economy.py for balance modelling)
+COINS_PER_WIN = 25
+
+
+def merge_key_states(key_states, guess, status):
+    """Fold one guess's colours into a {letter: status} keyboard map."""
+    for i, ch in enumerate(guess):
+        prev = key_states.get(ch.lower())
+        # don't override a correct with a lesser state
+        if prev == 'correct':
+            continue
+        key_states[ch.lower()] = status[i]
+
+
+def pick_target(bank, difficulty=None, rng=None):
+    """
+    A random target, from the `difficulty` tier ('Easy' / 'Normal' /
+    'Hard') when the dictionary has been rated; uniform otherwise.
+    """
+    ratings = get_ratings(bank) if difficulty else None
+    if ratings is None:
+        return bank.random_word(rng)
+    return ratings.sample(difficulty, rng)
 
-# Where stats are persisted
-STATS_FILE = 'stats.json'
 
 class Game:
-    def __init__(self):
-        # load valid words
-        with open('words.txt') as f:
-            self.words = [
-                w.strip().upper()
-                for w in f
-                if len(w.strip()) == WORD_LENGTH
-            ]
-
-        # pick a target
-        self.target = random.choice(self.words)
+    def __init__(self, bank=None, target=None, max_guesses=GRID_SIZE,
+                 record_stats=True, rng=None, hard_mode=False, difficulty=None):
+        # valid words: one shared, indexed bank per process
+        self.bank  = bank or get_word_bank()
+        self.words = self.bank.words
+        self.word_length = self.bank.word_length
+
+        # precomputed feedback table (None for very large dictionaries)
+        self.patterns = get_pattern_matrix(self.bank)
+
+        # targets still consistent with the feedback, narrowed per guess
+        self.candidates = CandidateSet(self.bank, self.patterns)
+
+        # pick a target (from a difficulty tier, see difficulty.py)
+        self.target = target or pick_target(self.bank, difficulty, rng)
+
+        # headless runs (e.g. simulate.py) leave the stats store alone
+        self.record_stats = record_stats
+        self.started_at   = time.monotonic()
 
         # game state
         self.guesses        = []     # list of submitted guesses
@@ -28,16 +67,36 @@ class Game:
         self.key_states     = {}     # for coloring the on-screen keyboard
 
         # boost‐related state
-        self.max_guesses    = GRID_SIZE   # can be bumped by Extra Try
+        self.max_guesses    = max_guesses # can be bumped by Extra Try
+        self.boosts_used    = 0
+        self.hint           = None        # last Best Guess suggestion
+        self._hint_future   = None        # solver job still running
+        self.notice         = None        # one-off boost message for the UI
+
+        # hard mode: guesses must reuse revealed hints (None = off)
+        self.rules      = HardModeRules(self.word_length) if hard_mode else None
+        self.last_error = None           # why the last submit_guess() failed
 
 
     def add_letter(self, ch):
-        if len(self.current_guess) < WORD_LENGTH and ch.isalpha():
+        if len(self.current_guess) < self.word_length and is_letter(ch):
             self.current_guess += ch.upper()
+            if self.rules:
+                self.rules.push(ch.upper())
 
     def remove_letter(self):
+        if self.current_guess and self.rules:
+            self.rules.pop()
         self.current_guess = self.current_guess[:-1]
 
+    def typing_error(self):
+        """Hard mode: why the row being typed can't be submitted, else None."""
+        if self.rules is None:
+            return None
+        if self.rules.typed != self.current_guess:
+            self.rules.reset(self.current_guess)
+        return self.rules.error()
+
     def is_won(self):
         return any(
             guess == self.target
@@ -50,78 +109,64 @@ class Game:
 
     def submit_guess(self):
         # must be full length and in word list
-        if len(self.current_guess) != WORD_LENGTH:
+        self.last_error = None
+        if len(self.current_guess) != self.word_length:
             return False
-        if self.current_guess not in self.words:
+        if self.current_guess not in self.bank:
             return False
 
+        # hard mode: must reuse every revealed hint
+        if self.rules:
+            if self.rules.typed != self.current_guess:
+                self.rules.reset(self.current_guess)
+            self.last_error = self.rules.check()
+            if self.last_error:
+                return False
+
         # commit the guess
         guess = self.current_guess
         self.guesses.append(guess)
 
         # evaluate result
-        status = []
-        target_chars = list(self.target)
-        # first pass: correct spots
-        for i, ch in enumerate(guess):
-            if ch == target_chars[i]:
-                status.append('correct')
-                target_chars[i] = None
-            else:
-                status.append(None)
-
-        # second pass: present vs absent
-        for i, ch in enumerate(guess):
-            if status[i] is None:
-                if ch in target_chars:
-                    status[i] = 'present'
-                    target_chars[target_chars.index(ch)] = None
-                else:
-                    status[i] = 'absent'
+        status = self._score(guess)
         self.results.append(status)
+        self.candidates.narrow(guess, status)
+        if self.rules:
+            self.rules.add_feedback(guess, status)
 
         # update keyboard colors
-        for i, ch in enumerate(guess):
-            prev = self.key_states.get(ch.lower())
-            # don't override a correct with a lesser state
-            if prev == 'correct':
-                continue
-            self.key_states[ch.lower()] = status[i]
+        merge_key_states(self.key_states, guess, status)
 
         # reset current guess
         self.current_guess = ""
 
         # if the game just ended, bump stats
-        if self.is_over():
+        if self.is_over() and self.record_stats:
             self._update_stats(self.is_won())
 
         return True
 
+    def _score(self, guess):
+        """Colours for `guess` against the target (subclasses may pick the target)."""
+        if self.patterns is not None:
+            return self.patterns.statuses(guess, self.target)
+        return score_guess(guess, self.target)
+
     def _update_stats(self, won):
         """
-        Load stats.json (or create defaults), increment wins/losses,
-        and rewrite the file. Awards coins on win if a Shop has been injected.
+        Append this game to the stats store (aggregates update in the
+        same transaction). Awards coins on win if a Shop has been injected.
         """
-        data = {'wins': 0, 'losses': 0}
-        try:
-            if os.path.exists(STATS_FILE):
-                with open(STATS_FILE, 'r') as fp:
-                    data = json.load(fp)
-        except (json.JSONDecodeError, IOError):
-            data = {'wins': 0, 'losses': 0}
-
-        if won:
-            data['wins'] = data.get('wins', 0) + 1
-            # award coins if shop is attached
-            if hasattr(self, 'shop'):
-                self.shop.earn_coins(25)
-        else:
-            data['losses'] = data.get('losses', 0) + 1
+        if won and hasattr(self, 'shop'):
+            self.shop.earn_coins(COINS_PER_WIN)
 
         try:
-            with open(STATS_FILE, 'w') as fp:
-                json.dump(data, fp, indent=2)
-        except IOError:
+            get_stats_store().record_game(
+                self.target, len(self.guesses), won,
+                duration=time.monotonic() - self.started_at,
+                boosts=self.boosts_used,
+            )
+        except sqlite3.Error:
             pass
 
 
@@ -141,14 +186,87 @@ class Game:
 
         letter = random.choice(candidates)
         self.key_states[letter.lower()] = 'correct'
+        self.boosts_used += 1
         return letter
 
 
+    def reveal_one_letter(self):
+        """
+        Reveal the target's letter at the first position no guess has
+        turned green yet, and post it as a notice. Returns the position
+        (0-based), or None if every position is already solved.
+        """
+        solved = {
+            pos for guess, status in zip(self.guesses, self.results)
+            for pos, s in enumerate(status) if s == 'correct'
+        }
+        pos = next((i for i in range(self.word_length) if i not in solved), None)
+        if pos is None:
+            return None
+
+        letter = self.target[pos]
+        self.key_states[letter.lower()] = 'correct'
+        self.notice = f"Letter {pos + 1} is {letter}"
+        self.boosts_used += 1
+        return pos
+
+
     def grant_extra_guess(self):
         """
         Increase the number of allowed guesses by one.
         """
         self.max_guesses += 1
+        self.boosts_used += 1
+
+
+    def request_best_guess(self):
+        """
+        Start the solver on the current board in the background.
+        poll_hint() returns its suggestion once it's ready.
+        """
+        if self._hint_future is None:
+            self._hint_future = request_best_guess(self)
+            self.boosts_used += 1
+
+
+    def count_matches(self):
+        """
+        Count dictionary words that fit all feedback so far plus the
+        letters typed on the current row, and post it as a notice.
+        """
+        query = self.candidates.query.copy()
+        for pos, ch in enumerate(self.current_guess):
+            query.place(ch, pos)
+        count = get_letter_index(self.bank).count(query)
+
+        typed = self.current_guess.ljust(self.word_length, '_')
+        self.notice = f"{count} word{'s' if count != 1 else ''} fit {typed}"
+        self.boosts_used += 1
+        return count
+
+
+    def pop_notice(self):
+        """Return the pending boost notice once, then clear it."""
+        notice, self.notice = self.notice, None
+        return notice
+
+
+    def hint_pending(self):
+        """True while a Best Guess request is still being computed."""
+        return self._hint_future is not None
+
+
+    def poll_hint(self):
+        """
+        Return the Best Guess suggestion the first time it's available,
+        otherwise None. Never blocks.
+        """
+        future = self._hint_future
+        if future is None or not future.done():
+            return None
+        self._hint_future = None
+        self.hint = future.result()
+        return self.hint
 
 
     def freeze_timer(self):
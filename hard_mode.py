@@ -0,0 +1,125 @@
+# hard_mode.py
+
+from typing import List, Optional, Sequence
+
+_A = ord('A')
+
+
+def _index(ch: str) -> int:
+    """Letter index 0-25; ValueError for anything but a single A-Z letter."""
+    i = ord(ch) - _A if len(ch) == 1 else -1
+    if not 0 <= i < 26:
+        raise ValueError(f"not an A-Z letter: {ch!r}")
+    return i
+
+
+def _ordinal(n: int) -> str:
+    suffix = 'th' if 10 <= n % 100 <= 20 else {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
+    return f"{n}{suffix}"
+
+
+class HardModeRules:
+    """
+    Hard mode: every guess must reuse all revealed greens (in place) and
+    yellows (anywhere). `strict` also forbids letters known to be absent.
+
+    The revealed constraints are compiled into fixed-size state that
+    submit_guess() updates incrementally:
+      required  – letter index per position, -1 if free
+      min_count – 26 minimum letter counts
+      banned    – bitmask of letters ruled out entirely
+    and the row being typed is tracked one keystroke at a time (per-letter
+    counts plus the number of still-missing required letters), so
+    push()/pop()/error() are O(1) whatever the word length or row count.
+    """
+    def __init__(self, word_length: int, strict: bool = False):
+        self.word_length = word_length
+        self.strict      = strict
+
+        self.required:  List[int] = [-1] * word_length
+        self.min_count: List[int] = [0] * 26
+        self.banned = 0
+
+        # the row being typed
+        self.typed   = ""
+        self._counts = [0] * 26
+        self._short  = 0          # sum over letters of max(0, min_count - typed count)
+        self._errors: List[Optional[str]] = []   # first error after each keystroke
+
+    # ─── constraint state ────────────────────────────────────────────
+
+    def add_feedback(self, guess: str, status: Sequence[str]):
+        """Fold one scored guess into the constraints (O(word_length))."""
+        hits = [0] * 26
+        for pos, (ch, s) in enumerate(zip(guess, status)):
+            i = ord(ch) - _A
+            if s == 'correct':
+                self.required[pos] = i
+            if s != 'absent':
+                hits[i] += 1
+        for ch, s in zip(guess, status):
+            i = ord(ch) - _A
+            self.min_count[i] = max(self.min_count[i], hits[i])
+            if s == 'absent' and hits[i] == 0:
+                self.banned |= 1 << i
+        self.reset()
+
+    # ─── the row being typed ─────────────────────────────────────────
+
+    def reset(self, typed: str = ""):
+        """Re-derive the typing state for `typed` (e.g. after a direct assignment)."""
+        self.typed   = ""
+        self._counts = [0] * 26
+        self._short  = sum(self.min_count)
+        self._errors = []
+        for ch in typed[:self.word_length]:
+            if len(ch) == 1 and 0 <= ord(ch) - _A < 26:
+                self.push(ch)
+
+    def push(self, ch: str):
+        """One letter typed at the end of the row (A-Z only)."""
+        i   = _index(ch)
+        pos = len(self.typed)
+        if self._counts[i] < self.min_count[i]:
+            self._short -= 1
+        self._counts[i] += 1
+        self.typed += ch
+
+        error = self._errors[-1] if self._errors else None
+        if error is None:
+            need = self.required[pos]
+            if need >= 0 and need != i:
+                error = f"{_ordinal(pos + 1)} letter must be {chr(need + _A)}"
+            elif self.strict and self.banned >> i & 1:
+                error = f"{ch} is not in the word"
+            elif self._short > self.word_length - len(self.typed):
+                error = f"Guess must contain {self.missing_letter()}"
+        self._errors.append(error)
+
+    def pop(self):
+        """The last letter was deleted."""
+        if not self.typed:
+            return
+        i = _index(self.typed[-1])
+        self._counts[i] -= 1
+        if self._counts[i] < self.min_count[i]:
+            self._short += 1
+        self.typed = self.typed[:-1]
+        self._errors.pop()
+
+    def error(self) -> Optional[str]:
+        """Why the row typed so far can't become a valid guess, or None."""
+        return self._errors[-1] if self._errors else None
+
+    def missing_letter(self) -> Optional[str]:
+        """A revealed letter the typed row doesn't use enough (at most 26 checks)."""
+        for i, need in enumerate(self.min_count):
+            if self._counts[i] < need:
+                return chr(i + _A)
+        return None
+
+    def check(self) -> Optional[str]:
+        """Error for submitting the typed row as-is, or None if allowed."""
+        if self._short:
+            return self.error() or f"Guess must contain {self.missing_letter()}"
+        return self.error()
@@ -0,0 +1,39 @@
+# layers.py
+
+from typing import Callable, Dict, Hashable, Tuple
+
+import pygame
+
+from config import COLORS
+
+# name -> (signature it was built for, surface)
+_LAYERS: Dict[str, Tuple[Hashable, pygame.Surface]] = {}
+
+
+def static_layer(
+    name: str,
+    screen: pygame.Surface,
+    build: Callable[[pygame.Surface], None],
+    layout: Hashable = ()
+) -> pygame.Surface:
+    """
+    Off-screen surface holding a screen's invariant chrome.
+
+    build(surface) paints it once; the result is reused by every later
+    call (and every new UI instance) until the screen size, `layout` or
+    the COLORS palette changes, at which point it's rebuilt.
+    """
+    signature = (screen.get_size(), layout, tuple(sorted(COLORS.items())))
+    cached = _LAYERS.get(name)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    surface = pygame.Surface(screen.get_size(), 0, screen)
+    build(surface)
+    _LAYERS[name] = (signature, surface)
+    return surface
+
+
+def invalidate_layers():
+    """Drop every cached layer (e.g. after a theme change)."""
+    _LAYERS.clear()
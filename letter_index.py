@@ -0,0 +1,230 @@
+# letter_index.py
+#
+# Per-position / per-letter bitmaps over a WordBank for constraint queries.
+#
+#   python letter_index.py "A@2 E!5 -RST"        # A 2nd, E somewhere but not 5th, no R/S/T
+#   python letter_index.py "C@1 R@2 A" --limit 50
+#
+# Query tokens (positions are 1-based):
+#   A@2   A at position 2          E     E somewhere
+#   E!5   E somewhere, not at 5    -RST  no R, S or T
+
+import argparse
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Set
+
+import numpy as np
+
+from wordbank import WordBank, get_word_bank
+
+LETTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+
+class Query:
+    """
+    What is known about a word: letters fixed at positions, letters
+    ruled out at positions, and min/max count per letter. Built from
+    tokens (parse) or Wordle feedback (add_feedback), which it matches
+    exactly: a word satisfies the feedback constraints iff it would
+    have produced the same colours.
+    """
+    def __init__(self, word_length: int):
+        self.word_length = word_length
+        self.fixed:     Dict[int, str]      = {}   # pos -> letter
+        self.not_at:    Dict[int, Set[str]] = {}   # pos -> letters
+        self.min_count: Dict[str, int]      = {}
+        self.max_count: Dict[str, int]      = {}
+
+    def copy(self) -> 'Query':
+        q = Query(self.word_length)
+        q.fixed     = dict(self.fixed)
+        q.not_at    = {p: set(s) for p, s in self.not_at.items()}
+        q.min_count = dict(self.min_count)
+        q.max_count = dict(self.max_count)
+        return q
+
+    # ─── building ────────────────────────────────────────────────────
+
+    def place(self, letter: str, pos: int):
+        self.fixed[pos] = letter
+        self.min_count[letter] = max(self.min_count.get(letter, 0), 1)
+
+    def require(self, letter: str, count: int = 1, not_pos: Optional[int] = None):
+        self.min_count[letter] = max(self.min_count.get(letter, 0), count)
+        if not_pos is not None:
+            self.not_at.setdefault(not_pos, set()).add(letter)
+
+    def exclude(self, letter: str):
+        self.max_count[letter] = 0
+
+    def add_feedback(self, guess: str, status: Sequence[str]):
+        """Fold one guess's colours into the constraints."""
+        hits = Counter(ch for ch, s in zip(guess, status) if s != 'absent')
+        for pos, (ch, s) in enumerate(zip(guess, status)):
+            if s == 'correct':
+                self.fixed[pos] = ch
+            else:
+                self.not_at.setdefault(pos, set()).add(ch)
+        for ch in set(guess):
+            self.min_count[ch] = max(self.min_count.get(ch, 0), hits[ch])
+            if any(c == ch and s == 'absent' for c, s in zip(guess, status)):
+                # a grey copy caps the count at the coloured copies
+                self.max_count[ch] = min(self.max_count.get(ch, self.word_length), hits[ch])
+
+    @classmethod
+    def from_feedback(cls, word_length, guesses, results) -> 'Query':
+        q = cls(word_length)
+        for guess, status in zip(guesses, results):
+            q.add_feedback(guess, status)
+        return q
+
+    @classmethod
+    def parse(cls, text: str, word_length: int) -> 'Query':
+        """Build a query from CLI tokens (see module header); ValueError if malformed."""
+        q = cls(word_length)
+        for token in text.upper().split():
+            if token.startswith('-'):
+                for ch in token[1:]:
+                    if ch not in LETTERS:
+                        raise ValueError(f"bad letter {ch!r} in {token!r}: expected A-Z")
+                    q.exclude(ch)
+            elif '@' in token:
+                ch, pos = _letter_at(token, '@', word_length)
+                q.place(ch, pos)
+            elif '!' in token:
+                ch, pos = _letter_at(token, '!', word_length)
+                q.require(ch, not_pos=pos)
+            elif len(token) == 1 and token in LETTERS:
+                q.require(token)
+            else:
+                raise ValueError(f"bad query token: {token!r}")
+        return q
+
+
+def _letter_at(token: str, sep: str, word_length: int):
+    """'A@2' -> ('A', 1): an A-Z letter and a 0-based position inside the word."""
+    ch, _, pos = token.partition(sep)
+    if len(ch) != 1 or ch not in LETTERS:
+        raise ValueError(f"bad letter in {token!r}: expected one of A-Z")
+    if not pos.isdigit() or not 1 <= int(pos) <= word_length:
+        raise ValueError(f"bad position in {token!r}: expected 1-{word_length}")
+    return ch, int(pos) - 1
+
+
+class LetterIndex:
+    """
+    Bitmaps over word IDs (Python ints, bit i = word i): one per
+    (position, letter) and one per (letter, at-least-k copies).
+    A query is a handful of big-int ANDs, independent of how many
+    words the dictionary holds per test, so answers come back in
+    microseconds without touching the word list.
+    """
+    def __init__(self, bank: WordBank):
+        self.bank = bank
+        n, length = len(bank), bank.word_length
+        enc = bank.encoded
+
+        self.all = (1 << n) - 1
+        self._at = [
+            [self._bits(enc[:, pos] == letter) for letter in range(26)]
+            for pos in range(length)
+        ]
+        counts = np.zeros((n, 26), dtype=np.uint8)
+        for pos in range(length):
+            counts[np.arange(n), enc[:, pos]] += 1
+        self._at_least = [
+            [self._bits(counts[:, letter] >= k) for k in range(length + 2)]
+            for letter in range(26)
+        ]
+
+    @staticmethod
+    def _bits(mask: np.ndarray) -> int:
+        return int.from_bytes(np.packbits(mask, bitorder='little').tobytes(), 'little')
+
+    def at(self, letter: str, pos: int) -> int:
+        """Words with `letter` at `pos`."""
+        return self._at[pos][ord(letter) - 65]
+
+    def at_least(self, letter: str, count: int) -> int:
+        """Words containing `letter` at least `count` times."""
+        return self._at_least[ord(letter) - 65][min(count, self.bank.word_length + 1)]
+
+    def match(self, query: Query) -> int:
+        """Bitmap of every word satisfying `query`."""
+        bits = self.all
+        for pos, ch in query.fixed.items():
+            bits &= self.at(ch, pos)
+        for pos, letters in query.not_at.items():
+            for ch in letters:
+                bits &= ~self.at(ch, pos)
+        for ch, k in query.min_count.items():
+            if k:
+                bits &= self.at_least(ch, k)
+        for ch, k in query.max_count.items():
+            bits &= ~self.at_least(ch, k + 1)
+        return bits
+
+    def count(self, query: Query) -> int:
+        return self.match(query).bit_count()
+
+    def ids(self, bits: int) -> np.ndarray:
+        """Word IDs set in `bits`, ascending."""
+        n   = len(self.bank)
+        raw = np.frombuffer(bits.to_bytes((n + 7) // 8, 'little'), dtype=np.uint8)
+        return np.flatnonzero(np.unpackbits(raw, bitorder='little')[:n])
+
+    def words(self, query: Query, limit: Optional[int] = None) -> List[str]:
+        ids = self.ids(self.match(query))
+        return [self.bank[int(i)] for i in ids[:limit]]
+
+
+# ————————————————————————————————————————————————————————————————
+# Shared instances
+# ————————————————————————————————————————————————————————————————
+
+_INDEXES: Dict[str, LetterIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_letter_index(bank: Optional[WordBank] = None) -> LetterIndex:
+    """The LetterIndex for `bank` (default: the shared bank), built once."""
+    bank = bank or get_word_bank()
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(bank.digest)
+        if index is None:
+            index = _INDEXES[bank.digest] = LetterIndex(bank)
+        return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the dictionary by letter constraints")
+    parser.add_argument('query', help='e.g. "A@2 E!5 -RST"')
+    parser.add_argument('--limit', type=int, default=30, help="words to list")
+    args = parser.parse_args()
+
+    bank = get_word_bank()
+    start = time.perf_counter()
+    index = get_letter_index(bank)
+    built = time.perf_counter() - start
+
+    try:
+        query = Query.parse(args.query, bank.word_length)
+    except ValueError as e:
+        parser.error(str(e))
+    start = time.perf_counter()
+    bits  = index.match(query)
+    took  = time.perf_counter() - start
+
+    matches = bits.bit_count()
+    print(f"{matches} of {len(bank)} words match  "
+          f"(query {took * 1e6:.1f}us, index built in {built * 1000:.1f}ms)")
+    for word in index.words(query, args.limit):
+        print(f"  {word}")
+    if matches > args.limit:
+        print(f"  ... {matches - args.limit} more")
+
+
+if __name__ == "__main__":
+    main()
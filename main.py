@@ -1,26 +1,126 @@
 # main.py
 
+import os
+import time
+
 import pygame
-from config      import WIDTH, HEIGHT
+from config      import WIDTH, HEIGHT, GRID_SIZE, WORD_LENGTH
 from menu_ui     import MenuUI
-from stats_ui    import StatsUI
-from shop        import Shop
-from shop_ui     import ShopUI
-from game        import Game
-from ui          import GameUI
-from boost_ui    import BoostUI   # <-- new import
-
-def main():
+from scheduler   import FrameScheduler
+from profiler    import Profiler
+from preload     import start_preload
+from fonts       import clear_fonts
+# StatsUI, Shop, ShopUI, Game, GameUI and BoostUI are imported on first
+# use so the menu's first frame doesn't wait on them (see Screens)
+
+# Profiler hotkeys: toggle the live overlay / dump a Chrome trace
+PROFILER_KEY = pygame.K_F3
+TRACE_KEY    = pygame.K_F4
+
+# Refresh rate of the profiler overlay while it's visible
+OVERLAY_REFRESH_MS = 250
+
+
+class Screens:
+    """
+    Builds the secondary screens and their controllers on first visit,
+    importing their modules at the same time.
+    """
+    def __init__(self, screen, profiler):
+        self.screen   = screen
+        self.profiler = profiler
+        self._shop     = None
+        self._stats_ui = None
+        self._shop_ui  = None
+
+    @property
+    def shop(self):
+        if self._shop is None:
+            from shop       import Shop
+            from shop_store import ShopStore
+            # writes happen here now (flush on the writer thread, spend on purchase)
+            self.profiler.instrument(ShopStore, 'flush')
+            self.profiler.instrument(ShopStore, 'spend')
+            self._shop = Shop()           # loads coins & boost counts
+        return self._shop
+
+    def close(self):
+        """Flush the shop before main() returns (replay.py then leaves its scratch dir)."""
+        if self._shop is not None:
+            self._shop.close()
+
+    @property
+    def stats_ui(self):
+        if self._stats_ui is None:
+            from stats_ui import StatsUI
+            self._stats_ui = StatsUI(self.screen)
+        return self._stats_ui
+
+    @property
+    def shop_ui(self):
+        if self._shop_ui is None:
+            from shop_ui import ShopUI
+            self._shop_ui = ShopUI(self.screen, self.shop)
+        return self._shop_ui
+
+    def new_game(self, hard_mode=False, boards=1, absurdle=False,
+                 word_length=WORD_LENGTH, rows=GRID_SIZE, difficulty=None):
+        """
+        A fresh (game, game_ui, boost_ui) triple sharing the shop. The
+        bank, its indexes and the grid layout for `word_length` x `rows`
+        are cached, so only the first game of a shape pays to build them.
+        Multi-board games have no boosts, so their boost_ui is None.
+        """
+        from game     import Game
+        from ui       import GameUI
+        from boost_ui import BoostUI
+        from wordbank import get_word_bank
+        self.profiler.instrument(Game, 'submit_guess')
+        bank = get_word_bank(word_length=word_length)
+
+        if boards > 1:
+            from multi_game import MultiGame
+            from multi_ui   import MultiGameUI
+            self.profiler.instrument(MultiGame, 'submit_guess')
+            # one extra row per extra board: 6 rows -> Quordle 9, Octordle 13
+            game = MultiGame(boards, bank=bank, max_guesses=rows + boards - 1,
+                             hard_mode=hard_mode, difficulty=difficulty)
+            game.shop = self.shop
+            return game, MultiGameUI(self.screen, game), None
+
+        if absurdle:
+            from absurdle import AbsurdleGame
+            self.profiler.instrument(AbsurdleGame, '_score')
+            game, ui_cls = AbsurdleGame(bank, max_guesses=rows, hard_mode=hard_mode,
+                                 difficulty=difficulty), GameUI
+        else:
+            game, ui_cls = Game(bank, max_guesses=rows, hard_mode=hard_mode,
+                                 difficulty=difficulty), GameUI
+        game.shop = self.shop             # give game access to inventory
+        return game, ui_cls(self.screen, game), BoostUI(self.screen, self.shop)
+
+
+def main(scheduler=None, profiler=None):
+    """
+    Run the game. `scheduler` / `profiler` can be swapped out by tools
+    such as replay.py; by default input comes from the real event queue.
+    """
     pygame.init()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Practice Wordle")
-    clock = pygame.time.Clock()
+    if scheduler is None:
+        scheduler = FrameScheduler()  # blocks while idle, 60 fps while animating
+
+    # frame/hot-path profiler: F3 overlay, F4 trace; WORDLE_PROFILE=1 records from start
+    if profiler is None:
+        profiler = Profiler(enabled=bool(os.environ.get('WORDLE_PROFILE')))
 
-    # UI + data controllers
+    # dictionary + indexes load in the background while the menu is up
+    start_preload()
+
+    # UI + data controllers; only the menu is needed for the first frame
     menu_ui  = MenuUI(screen)
-    stats_ui = StatsUI(screen)
-    shop     = Shop()                 # loads coins & boost counts
-    shop_ui  = ShopUI(screen, shop)
+    screens  = Screens(screen, profiler)
 
     game     = None
     game_ui  = None
@@ -28,79 +128,116 @@ def main():
 
     state    = 'MAIN_MENU'
     running  = True
+    drawn_state = None                # state rendered last frame
 
     while running:
-        # 1) EVENT HANDLING
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-
-            # —— Main Menu
-            elif state == 'MAIN_MENU':
-                action = menu_ui.handle_event(event)
-                if action == 'PLAY':
-                    # start a fresh game
-                    game    = Game()
-                    game.shop = shop       # give game access to inventory
-                    game_ui   = GameUI(screen, game)
-                    boost_ui  = BoostUI(screen, shop)
-                    state     = 'GAME'
-
-                elif action == 'STATS':
-                    state = 'STATS'
-
-                elif action == 'SHOP':
-                    state = 'SHOP'
-
-            # —— Stats Screen
-            elif state == 'STATS':
-                action = stats_ui.handle_event(event)
-                if action == 'BACK':
-                    state = 'MAIN_MENU'
-
-            # —— Shop Screen
-            elif state == 'SHOP':
-                action = shop_ui.handle_event(event)
-                if action == 'BACK':
-                    state = 'MAIN_MENU'
+        # 0) WAIT for input, a screen deadline, or the next animation frame
+        wake_at, animating = None, False
+        if state == 'GAME' and drawn_state == 'GAME':
+            wake_at   = game_ui.next_wakeup()
+            animating = game_ui.is_animating()
+        elif state != drawn_state:
+            wake_at   = 0                 # just switched screens: draw now
+        if profiler.overlay:
+            refresh = pygame.time.get_ticks() + OVERLAY_REFRESH_MS
+            wake_at = refresh if wake_at is None else min(wake_at, refresh)
+        events = scheduler.wait(wake_at, animating)
+        profiler.frame_begin(state)
 
-            # —— In‐Game
-            elif state == 'GAME':
-                # 1a) Wordle input (letters, enter, backspace, menu, restart…)
-                action = game_ui.handle_input(event)
-                if action == 'RESTART':
-                    game    = Game()
-                    game.shop = shop
-                    game_ui   = GameUI(screen, game)
-                    boost_ui  = BoostUI(screen, shop)
-
-                elif action == 'MENU':
-                    state = 'MAIN_MENU'
-
-                boost_key = boost_ui.handle_event(event)
-                if boost_key:
-                    # Delegates inventory check, decrement, and effect application
-                    shop.use(boost_key, game)
+        # 1) EVENT HANDLING
+        with profiler.section('events'):
+            for event in events:
+                if event.type == pygame.QUIT:
+                    running = False
+
+                elif event.type == pygame.KEYDOWN and event.key == PROFILER_KEY:
+                    profiler.toggle_overlay()
+                    drawn_state = None        # repaint under the overlay
+
+                elif event.type == pygame.KEYDOWN and event.key == TRACE_KEY:
+                    profiler.export_chrome_trace(f"trace-{time.strftime('%Y%m%d-%H%M%S')}.json")
+
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    drawn_state = None        # window contents lost: full repaint
+
+                # —— Main Menu
+                elif state == 'MAIN_MENU':
+                    action = menu_ui.handle_event(event)
+                    if action == 'PLAY':
+                        # start a fresh game
+                        game, game_ui, boost_ui = screens.new_game(**menu_ui.options())
+                        state = 'GAME'
+
+                    elif action == 'STATS':
+                        state = 'STATS'
+
+                    elif action == 'SHOP':
+                        state = 'SHOP'
+
+                # —— Stats Screen
+                elif state == 'STATS':
+                    action = screens.stats_ui.handle_event(event)
+                    if action == 'BACK':
+                        state = 'MAIN_MENU'
+
+                # —— Shop Screen
+                elif state == 'SHOP':
+                    action = screens.shop_ui.handle_event(event)
+                    if action == 'BACK':
+                        state = 'MAIN_MENU'
+
+                # —— In‐Game
+                elif state == 'GAME':
+                    # 1a) Wordle input (letters, enter, backspace, menu, restart…)
+                    action = game_ui.handle_input(event)
+                    if action == 'RESTART':
+                        game, game_ui, boost_ui = screens.new_game(**menu_ui.options())
+
+                    elif action == 'MENU':
+                        state = 'MAIN_MENU'
+
+                    boost_key = boost_ui.handle_event(event) if boost_ui else None
+                    if boost_key:
+                        # Delegates inventory check, decrement, and effect application
+                        screens.shop.use(boost_key, game)
 
         # 2) DRAWING
-        if state == 'MAIN_MENU':
-            menu_ui.draw()
-
-        elif state == 'STATS':
-            stats_ui.draw()
-
-        elif state == 'SHOP':
-            shop_ui.draw()
+        with profiler.section('draw'):
+            dirty = None                      # None = whole screen changed
+            if state == 'MAIN_MENU':
+                menu_ui.draw()
 
-        elif state == 'GAME':
-            game_ui.draw()      # draws board + keyboard
-            boost_ui.draw()     # draws your new buttons below the keyboard
+            elif state == 'STATS':
+                screens.stats_ui.draw()
 
-        # 3) FLIP + FRAME RATE
-        pygame.display.flip()
-        clock.tick(60)
+            elif state == 'SHOP':
+                screens.shop_ui.draw()
 
+            elif state == 'GAME':
+                if state != drawn_state:
+                    game_ui.invalidate()
+                    if boost_ui:
+                        boost_ui.invalidate()
+                dirty = game_ui.draw()       # board + keyboard, only what changed
+                if boost_ui:
+                    dirty += boost_ui.draw() # boost buttons below the keyboard
+            drawn_state = state
+
+        panel = profiler.draw_overlay(screen)
+        if panel and dirty is not None:
+            dirty.append(panel)
+
+        # 3) FLIP
+        with profiler.section('flip'):
+            if dirty is None:
+                pygame.display.flip()
+            elif dirty:
+                pygame.display.update(dirty)
+        profiler.frame_end()
+
+    screens.close()
     pygame.quit()
+    clear_fonts()
 
 if __name__ == "__main__":
     main()
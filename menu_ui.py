@@ -1,15 +1,21 @@
 # menu_ui.py
 
 import pygame
-from config import WIDTH, HEIGHT, COLORS, FONT_NAME
+from config import (WIDTH, HEIGHT, COLORS, GRID_SIZE, WORD_LENGTH, WORD_LENGTHS, ROW_CHOICES,
+                    BOARD_CHOICES, TIERS)
+from fonts import get_font
+from text_cache import render_text
+from layers import static_layer
+from preload import preload_done
+
 
 class MenuUI:
     def __init__(self, screen):
         self.screen      = screen
 
         # Fonts
-        self.title_font  = pygame.font.SysFont(FONT_NAME, 72, bold=True)
-        self.button_font = pygame.font.SysFont(FONT_NAME, 36, bold=True)
+        self.title_font  = get_font(72, bold=True)
+        self.button_font = get_font(36, bold=True)
 
         # Play button
         self.btn_w       = 200
@@ -21,13 +27,43 @@ class MenuUI:
             self.btn_h
         )
 
+        # Hard mode toggle (under Play)
+        self.hard_mode = False
+        self.hard_rect = pygame.Rect(
+            (WIDTH - 300) // 2,
+            self.play_rect.bottom + 30,
+            300,
+            self.btn_h
+        )
+
+        # Board count (cycles through config.BOARD_CHOICES)
+        self.boards      = 1
+        self.boards_rect = self.hard_rect.move(0, self.btn_h + 20)
+
+        # Classic / Absurdle (adversarial, single board only)
+        self.absurdle    = False
+        self.mode_rect   = self.boards_rect.move(0, self.btn_h + 20)
+
+        # Word length and rows, side by side (lengths without words are skipped)
+        self.word_length  = WORD_LENGTH
+        self.rows         = GRID_SIZE
+        self._lengths     = None     # available_lengths(), read on first click
+        self.length_rect  = pygame.Rect(WIDTH // 2 - 250, self.mode_rect.bottom + 20, 240, self.btn_h)
+        self.rows_rect    = self.length_rect.move(260, 0)
+
+        # Target difficulty (None = any word; tiers need difficulty.py's ratings,
+        # so the cycler is greyed out for word lengths that haven't been rated)
+        self.difficulty      = None
+        self._rated          = {}    # word length -> ratings exist, checked lazily
+        self.difficulty_rect = pygame.Rect((WIDTH - 400) // 2, self.length_rect.bottom + 20, 400, self.btn_h)
+
         # Padding for dynamic buttons
         padding_x = 20
         padding_y = 10
 
         # Stats button (top-right)
         stats_text      = "View Stats"
-        self.stats_surf = self.button_font.render(stats_text, True, COLORS['text'])
+        self.stats_surf = render_text(self.button_font, stats_text, COLORS['text'])
         stats_w         = self.stats_surf.get_width() + padding_x * 2
         stats_h         = self.stats_surf.get_height() + padding_y * 2
         stats_x         = WIDTH - stats_w - 20   # right margin
@@ -36,7 +72,7 @@ class MenuUI:
 
         # Shop button (top-left, mirrored)
         shop_text      = "Shop"
-        self.shop_surf = self.button_font.render(shop_text, True, COLORS['text'])
+        self.shop_surf = render_text(self.button_font, shop_text, COLORS['text'])
         shop_w         = self.shop_surf.get_width() + padding_x * 2
         shop_h         = self.shop_surf.get_height() + padding_y * 2
         shop_x         = 20                      # left margin
@@ -44,38 +80,92 @@ class MenuUI:
         self.shop_rect = pygame.Rect(shop_x, shop_y, shop_w, shop_h)
 
     def draw(self):
-        self.screen.fill(COLORS['bg'])
+        if self.word_length == WORD_LENGTH and WORD_LENGTH not in self._rated and preload_done():
+            self._is_rated()         # the preload thread has loaded this bank already
+        layout = (self.play_rect, self.stats_rect, self.shop_rect, self.hard_mode, self.boards,
+                  self.absurdle, self.word_length, self.rows, self.difficulty,
+                  self._rated.get(self.word_length))
+        self.screen.blit(static_layer('menu', self.screen, self._build_static, layout), (0, 0))
+
+    def _build_static(self, surf):
+        """The whole menu is static: title, buttons and the hard mode toggle."""
+        surf.fill(COLORS['bg'])
 
         # Title
-        title_surf = self.title_font.render("Zay’s Wordle", True, COLORS['text'])
+        title_surf = render_text(self.title_font, "Zay’s Wordle", COLORS['text'])
         tx = (WIDTH - title_surf.get_width()) // 2
         ty = HEIGHT // 4 - title_surf.get_height() // 2
-        self.screen.blit(title_surf, (tx, ty))
+        surf.blit(title_surf, (tx, ty))
 
         # Play button
-        pygame.draw.rect(self.screen, COLORS['text'], self.play_rect, border_radius=8)
+        pygame.draw.rect(surf, COLORS['text'], self.play_rect, border_radius=8)
         inner_play = self.play_rect.inflate(-6, -6)
-        pygame.draw.rect(self.screen, COLORS['bg'], inner_play, border_radius=6)
-        play_surf = self.button_font.render("Play", True, COLORS['text'])
+        pygame.draw.rect(surf, COLORS['bg'], inner_play, border_radius=6)
+        play_surf = render_text(self.button_font, "Play", COLORS['text'])
         px = self.play_rect.x + (self.play_rect.width  - play_surf.get_width())  // 2
         py = self.play_rect.y + (self.play_rect.height - play_surf.get_height()) // 2
-        self.screen.blit(play_surf, (px, py))
+        surf.blit(play_surf, (px, py))
+
+        # Hard mode toggle
+        pygame.draw.rect(surf, COLORS['correct'] if self.hard_mode else COLORS['text'],
+                         self.hard_rect, border_radius=8)
+        pygame.draw.rect(surf, COLORS['bg'], self.hard_rect.inflate(-6, -6), border_radius=6)
+        hard_surf = render_text(
+            self.button_font, f"Hard Mode: {'On' if self.hard_mode else 'Off'}", COLORS['text']
+        )
+        hx = self.hard_rect.x + (self.hard_rect.width  - hard_surf.get_width())  // 2
+        hy = self.hard_rect.y + (self.hard_rect.height - hard_surf.get_height()) // 2
+        surf.blit(hard_surf, (hx, hy))
+
+        # Board count
+        pygame.draw.rect(surf, COLORS['text'], self.boards_rect, border_radius=8)
+        pygame.draw.rect(surf, COLORS['bg'], self.boards_rect.inflate(-6, -6), border_radius=6)
+        boards_surf = render_text(self.button_font, f"Boards: {self.boards}", COLORS['text'])
+        bx = self.boards_rect.x + (self.boards_rect.width  - boards_surf.get_width())  // 2
+        by = self.boards_rect.y + (self.boards_rect.height - boards_surf.get_height()) // 2
+        surf.blit(boards_surf, (bx, by))
+
+        # Game mode (greyed out for multi-board games, which are always Classic)
+        mode_color = COLORS['absent'] if self.boards > 1 else COLORS['text']
+        pygame.draw.rect(surf, mode_color, self.mode_rect, border_radius=8)
+        pygame.draw.rect(surf, COLORS['bg'], self.mode_rect.inflate(-6, -6), border_radius=6)
+        mode_surf = render_text(
+            self.button_font, f"Mode: {'Absurdle' if self.absurdle else 'Classic'}", mode_color
+        )
+        mx = self.mode_rect.x + (self.mode_rect.width  - mode_surf.get_width())  // 2
+        my = self.mode_rect.y + (self.mode_rect.height - mode_surf.get_height()) // 2
+        surf.blit(mode_surf, (mx, my))
+
+        # Word length / rows / difficulty (greyed out when unrated)
+        unrated = self._rated.get(self.word_length) is False
+        for rect, text, color in (
+            (self.length_rect, f"Letters: {self.word_length}", COLORS['text']),
+            (self.rows_rect, f"Rows: {self.rows}", COLORS['text']),
+            (self.difficulty_rect, "Difficulty: Unrated" if unrated else
+                                   f"Difficulty: {self.difficulty or 'Any'}",
+             COLORS['absent'] if unrated else COLORS['text']),
+        ):
+            pygame.draw.rect(surf, color, rect, border_radius=8)
+            pygame.draw.rect(surf, COLORS['bg'], rect.inflate(-6, -6), border_radius=6)
+            text_surf = render_text(self.button_font, text, color)
+            surf.blit(text_surf, (rect.x + (rect.width  - text_surf.get_width())  // 2,
+                                  rect.y + (rect.height - text_surf.get_height()) // 2))
 
         # Stats button
-        pygame.draw.rect(self.screen, COLORS['text'], self.stats_rect, border_radius=5)
+        pygame.draw.rect(surf, COLORS['text'], self.stats_rect, border_radius=5)
         inner_stats = self.stats_rect.inflate(-4, -4)
-        pygame.draw.rect(self.screen, COLORS['bg'], inner_stats, border_radius=5)
+        pygame.draw.rect(surf, COLORS['bg'], inner_stats, border_radius=5)
         sx = self.stats_rect.x + (self.stats_rect.width  - self.stats_surf.get_width())  // 2
         sy = self.stats_rect.y + (self.stats_rect.height - self.stats_surf.get_height()) // 2
-        self.screen.blit(self.stats_surf, (sx, sy))
+        surf.blit(self.stats_surf, (sx, sy))
 
         # Shop button
-        pygame.draw.rect(self.screen, COLORS['text'], self.shop_rect, border_radius=5)
+        pygame.draw.rect(surf, COLORS['text'], self.shop_rect, border_radius=5)
         inner_shop = self.shop_rect.inflate(-4, -4)
-        pygame.draw.rect(self.screen, COLORS['bg'], inner_shop, border_radius=5)
+        pygame.draw.rect(surf, COLORS['bg'], inner_shop, border_radius=5)
         bx = self.shop_rect.x + (self.shop_rect.width  - self.shop_surf.get_width())  // 2
         by = self.shop_rect.y + (self.shop_rect.height - self.shop_surf.get_height()) // 2
-        self.screen.blit(self.shop_surf, (bx, by))
+        surf.blit(self.shop_surf, (bx, by))
 
     def handle_event(self, event):
         if event.type == pygame.QUIT:
@@ -89,5 +179,53 @@ class MenuUI:
                 return 'STATS'
             if self.shop_rect.collidepoint(event.pos):
                 return 'SHOP'
+            if self.hard_rect.collidepoint(event.pos):
+                self.hard_mode = not self.hard_mode
+                return 'HARD_MODE'
+            if self.boards_rect.collidepoint(event.pos):
+                self.boards = _cycle(BOARD_CHOICES, self.boards)
+                return 'BOARDS'
+            if self.mode_rect.collidepoint(event.pos):
+                if self.boards > 1:
+                    return None          # greyed out: multi-board games are Classic
+                self.absurdle = not self.absurdle
+                return 'MODE'
+            if self.length_rect.collidepoint(event.pos):
+                if self._lengths is None:
+                    from wordbank import available_lengths
+                    self._lengths = available_lengths(WORD_LENGTHS) or [self.word_length]
+                self.word_length = _cycle(self._lengths, self.word_length)
+                if self.difficulty and not self._is_rated():
+                    self.difficulty = None
+                return 'LENGTH'
+            if self.rows_rect.collidepoint(event.pos):
+                self.rows = _cycle(ROW_CHOICES, self.rows)
+                return 'ROWS'
+            if self.difficulty_rect.collidepoint(event.pos):
+                if self._is_rated():
+                    self.difficulty = _cycle((None,) + TIERS, self.difficulty)
+                return 'DIFFICULTY'
 
         return None
+
+    def _is_rated(self):
+        """Whether the current word length's dictionary has difficulty ratings (cached)."""
+        if self.word_length not in self._rated:
+            from wordbank   import get_word_bank
+            from difficulty import get_ratings
+            bank = get_word_bank(word_length=self.word_length)
+            self._rated[self.word_length] = len(bank) > 0 and get_ratings(bank) is not None
+        return self._rated[self.word_length]
+
+    def options(self):
+        """Keyword arguments for Screens.new_game() from the current toggles."""
+        return dict(hard_mode=self.hard_mode, boards=self.boards, absurdle=self.absurdle,
+                    word_length=self.word_length, rows=self.rows, difficulty=self.difficulty)
+
+
+def _cycle(choices, current):
+    """The choice after `current` (the first one if `current` isn't offered)."""
+    choices = list(choices)
+    if current not in choices:
+        return choices[0]
+    return choices[(choices.index(current) + 1) % len(choices)]
@@ -0,0 +1,165 @@
+# multi_game.py
+
+import random
+import sqlite3
+import time
+from typing import List, Optional
+
+import numpy as np
+
+from difficulty import get_ratings
+from game     import COINS_PER_WIN, merge_key_states
+from hard_mode import HardModeRules
+from patterns import get_pattern_matrix
+from scoring  import all_correct_code, decode_pattern, score_one
+from stats_store import get_stats_store
+from wordbank import get_word_bank, is_letter
+
+# Extra rows on top of the board count (Quordle: 4 boards, 9 rows)
+EXTRA_ROWS = 5
+
+
+class MultiGame:
+    """
+    Quordle-style game: every guess is played on N boards at once, each
+    with its own target. A guess is scored against all unsolved targets
+    in one batched call (a pattern-matrix row gather, or score_one over
+    the encoded targets), using the same codes and colours as Game.
+    Boards stop taking feedback once solved. In hard mode every guess
+    must reuse the hints of each board still open.
+    """
+    def __init__(self, boards=4, bank=None, targets=None, max_guesses=None, rng=None,
+                 difficulty=None, hard_mode=False, record_stats=True):
+        self.bank  = bank or get_word_bank()
+        self.words = self.bank.words
+        self.word_length = self.bank.word_length
+        self.patterns = get_pattern_matrix(self.bank)
+
+        # distinct targets, from one difficulty tier if the bank is rated
+        if targets is None:
+            ratings = get_ratings(self.bank) if difficulty else None
+            pool    = ratings.tier_ids(difficulty) if ratings is not None else ()
+            if len(pool) < boards:
+                pool = range(len(self.bank))     # unrated, or too few words in the tier
+            ids     = (rng or random).sample(range(len(pool)), min(boards, len(pool)))
+            targets = [self.bank[int(pool[i])] for i in ids]
+        self.targets    = [t.upper() for t in targets]
+        self.n_boards   = len(self.targets)
+        self.target_ids = np.array([self.bank.id_of(t) for t in self.targets])
+
+        self.max_guesses = max_guesses or self.n_boards + EXTRA_ROWS
+
+        # headless runs leave the stats store alone
+        self.record_stats = record_stats
+        self.started_at   = time.monotonic()
+
+        # game state
+        self.guesses: List[str] = []
+        self.current_guess = ""
+        self.results: List[List[List[str]]] = [[] for _ in self.targets]   # per board, per row
+        self.solved_at: List[Optional[int]] = [None] * self.n_boards       # row index
+        self.key_states = [{} for _ in self.targets]                       # per board
+
+        # hard mode: one set of revealed constraints per board (None = off)
+        self.rules = [HardModeRules(self.word_length) for _ in self.targets] if hard_mode else None
+        self.last_error = None           # GameUI reads this when a submit fails
+
+    # ─── input ───────────────────────────────────────────────────────
+
+    def add_letter(self, ch):
+        if len(self.current_guess) < self.word_length and is_letter(ch):
+            self.current_guess += ch.upper()
+
+    def remove_letter(self):
+        self.current_guess = self.current_guess[:-1]
+
+    # ─── state ───────────────────────────────────────────────────────
+
+    def open_boards(self) -> List[int]:
+        return [b for b, row in enumerate(self.solved_at) if row is None]
+
+    def is_won(self):
+        return all(row is not None for row in self.solved_at)
+
+    def is_over(self):
+        return self.is_won() or len(self.guesses) >= self.max_guesses
+
+    def typing_error(self):
+        """Hard mode: the first open board whose hints the typed row breaks, else None."""
+        if self.rules is None:
+            return None
+        for b in self.open_boards():
+            rules = self.rules[b]
+            if rules.typed != self.current_guess:
+                rules.reset(self.current_guess)
+            error = rules.error()
+            if error:
+                return f"Board {b + 1}: {error}"
+        return None
+
+    def submit_guess(self):
+        self.last_error = None
+        if len(self.current_guess) != self.word_length:
+            return False
+        if self.current_guess not in self.bank:
+            return False
+
+        # hard mode: must reuse every open board's revealed hints
+        if self.rules:
+            for b in self.open_boards():
+                rules = self.rules[b]
+                if rules.typed != self.current_guess:
+                    rules.reset(self.current_guess)
+                error = rules.check()
+                if error:
+                    self.last_error = f"Board {b + 1}: {error}"
+                    return False
+
+        guess = self.current_guess
+        row   = len(self.guesses)
+        self.guesses.append(guess)
+
+        # one batched scoring call for every board still in play
+        open_ = self.open_boards()
+        ids   = self.target_ids[open_]
+        if self.patterns is not None:
+            codes = self.patterns.codes[self.bank.id_of(guess), ids]
+        else:
+            codes = score_one(guess, self.bank.encoded[ids])
+
+        solved = all_correct_code(self.word_length)
+        for b, code in zip(open_, codes):
+            status = decode_pattern(code, self.word_length)
+            self.results[b].append(status)
+            merge_key_states(self.key_states[b], guess, status)
+            if self.rules:
+                self.rules[b].add_feedback(guess, status)
+            if code == solved:
+                self.solved_at[b] = row
+
+        self.current_guess = ""
+        if self.is_over() and self.record_stats:
+            self._update_stats(self.is_won())
+        return True
+
+    def _update_stats(self, won):
+        """
+        Log the game like Game does (targets joined by spaces). It counts
+        towards wins and streaks but not the guess distribution, whose
+        rows are sized for single boards.
+        """
+        if won and hasattr(self, 'shop'):
+            self.shop.earn_coins(COINS_PER_WIN)
+
+        try:
+            get_stats_store().record_game(
+                ' '.join(self.targets), len(self.guesses), won,
+                duration=time.monotonic() - self.started_at,
+                distribution=False,
+            )
+        except sqlite3.Error:
+            pass
+
+    def hint_pending(self):
+        """No Best Guess support on multi-board games (GameUI asks)."""
+        return False
@@ -0,0 +1,244 @@
+# multi_ui.py
+
+import math
+from functools import lru_cache
+from typing import Dict, Tuple
+
+import pygame
+from config import WIDTH, HEIGHT, COLORS, KEYBOARD_ROWS
+from fonts import get_font
+from text_cache import render_text
+from layers import static_layer
+from ui import (
+    GameUI, PADDING, KEY_W, KEY_H, KEY_SPACING, KB_HEIGHT,
+    BUTTON_W, BUTTON_H, BUTTON_SPACE, EMPTY_TILE, BACK_KEY,
+)
+
+# Board area: under the header, above keyboard + end buttons + boost row
+BOARDS_TOP   = 80
+BUTTON_Y     = HEIGHT - 60 - 20 - BUTTON_H
+KEYBOARD_Y   = BUTTON_Y - 20 - KB_HEIGHT
+BOARDS_H     = KEYBOARD_Y - 20 - BOARDS_TOP
+BOARD_GAP    = 10
+
+# Tile size limits; below MIN_TILE we show only the latest rows per board
+MIN_TILE     = 18
+MAX_TILE     = 56
+MIN_VISIBLE  = 6
+
+
+@lru_cache(maxsize=None)
+def board_layout(boards: int, rows: int, word_length: int) -> Tuple[int, int, int]:
+    """
+    (columns, tile size, visible rows) for `boards` boards of `rows` rows.
+    Prefers showing every row at >= MIN_TILE px; otherwise the largest
+    tiles that still show MIN_VISIBLE rows (the window follows the
+    current row).
+    """
+    best = None
+    for cols in range(1, boards + 1):
+        brows  = math.ceil(boards / cols)
+        bw     = (WIDTH - (cols + 1) * BOARD_GAP) // cols
+        bh     = (BOARDS_H - (brows - 1) * BOARD_GAP) // brows
+        w_tile = min(bw // word_length, MAX_TILE)
+        full   = min(w_tile, bh // rows)
+        if full >= MIN_TILE:
+            option = (1, full, cols, rows)
+        else:
+            visible = min(rows, bh // max(w_tile, 1))
+            option  = (0 if visible >= min(rows, MIN_VISIBLE) else -1, w_tile, cols, visible)
+        if best is None or option[:2] > best[:2]:
+            best = option
+    _, tile, cols, visible = best
+    return cols, tile, visible
+
+
+# pre-rendered tiles shared by every board: (size, colour, letter) -> Surface
+_TILES: Dict[tuple, pygame.Surface] = {}
+
+
+def tile_surface(size: int, bg, letter: str) -> pygame.Surface:
+    key  = (size, bg, letter)
+    surf = _TILES.get(key)
+    if surf is None:
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        rect = surf.get_rect().inflate(-2, -2)
+        radius = max(2, size // 10)
+        pygame.draw.rect(surf, bg, rect, border_radius=radius)
+        pygame.draw.rect(surf, COLORS['text'], rect, 1 if size < 30 else 2, border_radius=radius)
+        if letter:
+            glyph = render_text(get_font(max(8, int(size * 0.6)), bold=True), letter, COLORS['text'])
+            surf.blit(glyph, ((size - glyph.get_width()) // 2, (size - glyph.get_height()) // 2))
+        _TILES[key] = surf
+    return surf
+
+
+class MultiGameUI(GameUI):
+    """
+    GameUI for MultiGame. Input handling and retained-mode redraws come
+    from GameUI; each board row is one retained element blitted from
+    cached tile surfaces, so typing repaints one row per open board and
+    32 boards stay far inside a 60 fps frame budget. Keys are split into
+    one cell per board, coloured by that board's feedback.
+    """
+    def __init__(self, screen, game):
+        super().__init__(screen, game)
+        n = game.n_boards
+        self.cols, self.tile, self.visible = board_layout(n, game.max_guesses, game.word_length)
+
+        # board origins, centred
+        brows   = math.ceil(n / self.cols)
+        board_w = self.tile * game.word_length
+        board_h = self.tile * self.visible
+        grid_w  = self.cols * board_w + (self.cols - 1) * BOARD_GAP
+        grid_h  = brows * board_h + (brows - 1) * BOARD_GAP
+        x0 = (WIDTH - grid_w) // 2
+        y0 = BOARDS_TOP + (BOARDS_H - grid_h) // 2
+        self.board_pos = [
+            (x0 + (b % self.cols) * (board_w + BOARD_GAP), y0 + (b // self.cols) * (board_h + BOARD_GAP))
+            for b in range(n)
+        ]
+
+        # keyboard moved down to make room; each key split into per-board cells
+        self.key_rects = []
+        for ri, row_keys in enumerate(KEYBOARD_ROWS):
+            keys = (['ENTER'] + list(row_keys) + ['BACK']) if ri == 2 else list(row_keys)
+            total_w = len(keys) * KEY_W + (len(keys) - 1) * KEY_SPACING
+            sx = (WIDTH - total_w) // 2
+            y  = KEYBOARD_Y + ri * (KEY_H + KEY_SPACING)
+            for key in keys:
+                self.key_rects.append((pygame.Rect(sx, y, KEY_W, KEY_H), key))
+                sx += KEY_W + KEY_SPACING
+        # split keys into the most square cells that tile the key exactly
+        self.key_rows = min(
+            (r for r in range(1, n + 1) if n % r == 0),
+            key=lambda r: abs(math.log((KEY_W * r) / (KEY_H * (n / r))))
+        )
+        self.key_cols = n // self.key_rows
+
+        cx = WIDTH // 2
+        self.play_again_rect = pygame.Rect(cx - BUTTON_W - BUTTON_SPACE // 2, BUTTON_Y, BUTTON_W, BUTTON_H)
+        self.menu_rect       = pygame.Rect(cx + BUTTON_SPACE // 2, BUTTON_Y, BUTTON_W, BUTTON_H)
+
+    def draw(self):
+        """Repaint what changed; returns dirty rects like GameUI.draw()."""
+        game = self.game
+        now  = pygame.time.get_ticks()
+        self._dirty = []
+
+        layout = ('multi', game.n_boards, game.max_guesses, game.word_length)
+        static = static_layer('multi', self.screen, self._build_static, layout)
+        if static is not self._static:
+            self._static = static
+            self._drawn.clear()
+        if not self._drawn:
+            self.screen.blit(static, (0, 0))
+            self._drawn['screen'] = True
+            self._dirty.append(self.screen.get_rect())
+
+        # solved count (top right) and message line
+        solved = game.n_boards - len(game.open_boards())
+        self._update('left', solved, self.left_rect,
+                     lambda: self._draw_solved(solved))
+        if self.message and now >= self.msg_timer:
+            self.message = ""
+        if game.is_won():
+            line = "You Win!"
+        elif game.is_over():
+            line = f"Game Over: {solved}/{game.n_boards} solved"
+        else:
+            line = self.message or game.typing_error() or ""
+        self._update('msg', line, self.msg_rect, lambda: self._draw_centered(line, self.msg_y))
+
+        # boards, one retained row at a time
+        for b, (bx, by) in enumerate(self.board_pos):
+            for i, row in enumerate(self._board_rows(b)):
+                rect = pygame.Rect(bx, by + i * self.tile, self.tile * game.word_length, self.tile)
+                self._update(('row', b, i), row, rect,
+                             lambda rect=rect, row=row: self._draw_row(rect, row))
+
+        # keyboard, one cell per board
+        for rect, key in self.key_rects:
+            state = self._key_state(key)
+            self._update(('key', key), state, rect,
+                         lambda rect=rect, key=key, state=state: self._draw_split_key(rect, key, state))
+
+        over = game.is_over()
+        if over:
+            self._update('btn_play', over, self.play_again_rect,
+                         lambda: self._draw_button(self.play_again_rect, "Play Again"))
+            self._update('btn_menu', over, self.menu_rect,
+                         lambda: self._draw_button(self.menu_rect, "Menu"))
+        return self._dirty
+
+    def _board_rows(self, b):
+        """(letters, colours) for each visible row of board `b`."""
+        game    = self.game
+        results = game.results[b]
+        missed  = game.solved_at[b] is None      # typing row, or the reveal once over
+        open_   = missed and not game.is_over()
+        used    = len(results) + (1 if missed else 0)
+        start   = max(0, used - self.visible)
+
+        rows = []
+        for r in range(start, start + self.visible):
+            if r < len(results):
+                rows.append((game.guesses[r], tuple(COLORS[s] for s in results[r])))
+            elif open_ and r == len(results):
+                rows.append((game.current_guess, ()))
+            elif missed and r == len(results):
+                # reveal the missed target in place
+                rows.append((game.targets[b], (COLORS['absent'],) * game.word_length))
+            else:
+                rows.append(("", ()))
+        return rows
+
+    def _draw_row(self, rect, row):
+        letters, colours = row
+        for col in range(self.game.word_length):
+            letter = letters[col] if col < len(letters) else ""
+            bg     = colours[col] if colours else EMPTY_TILE
+            self.screen.blit(tile_surface(self.tile, bg, letter), (rect.x + col * self.tile, rect.y))
+
+    def _key_state(self, key):
+        if key in ('ENTER', 'BACK'):
+            return key
+        letter = key.lower()
+        game   = self.game
+        return tuple(
+            'solved' if game.solved_at[b] is not None else game.key_states[b].get(letter)
+            for b in range(game.n_boards)
+        )
+
+    def _draw_split_key(self, rect, key, state):
+        if key in ('ENTER', 'BACK'):
+            self._draw_key(self.screen, rect, key, BACK_KEY if key == 'BACK' else EMPTY_TILE, force=True)
+            return
+        cw = rect.w / self.key_cols
+        ch = rect.h / self.key_rows
+        for b, status in enumerate(state):
+            cell = pygame.Rect(
+                rect.x + int((b % self.key_cols) * cw), rect.y + int((b // self.key_cols) * ch),
+                math.ceil(cw), math.ceil(ch)
+            )
+            fill = COLORS['bg'] if status == 'solved' else COLORS.get(status, EMPTY_TILE)
+            pygame.draw.rect(self.screen, fill, cell)
+        pygame.draw.rect(self.screen, COLORS['text'], rect, 2, border_radius=5)
+        sf = self.key_glyphs.glyph(key)
+        self.screen.blit(sf, (rect.x + (KEY_W - sf.get_width()) // 2, rect.y + (KEY_H - sf.get_height()) // 2))
+
+    def _draw_solved(self, solved):
+        sf = render_text(self.small_font, f"{solved}/{self.game.n_boards} solved", COLORS['text'])
+        self.screen.blit(sf, (WIDTH - sf.get_width() - PADDING, self.header_pos[1]))
+
+    def _build_static(self, surf):
+        """Background, header, empty boards and blank keys."""
+        surf.fill(COLORS['bg'])
+        surf.blit(self.header_surf, self.header_pos)
+        empty = tile_surface(self.tile, EMPTY_TILE, "")
+        for bx, by in self.board_pos:
+            for r in range(self.visible):
+                for c in range(self.game.word_length):
+                    surf.blit(empty, (bx + c * self.tile, by + r * self.tile))
+        for rect, key in self.key_rects:
+            self._draw_key(surf, rect, key, BACK_KEY if key == 'BACK' else EMPTY_TILE, force=True)
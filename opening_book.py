@@ -0,0 +1,180 @@
+# opening_book.py
+#
+# Precomputed first and second guesses. The solver's answer for the
+# first two turns depends only on the dictionary, so it's computed once
+# per word list, saved next to it keyed by the WordBank digest, and
+# looked up by solver.best_guess() (hint boosts, simulate.py) in O(1).
+#
+#   python opening_book.py                       # words.txt, 5 letters
+#   python opening_book.py --words big.txt --length 6 --workers 8
+
+import argparse
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from config   import WORD_LENGTH
+from patterns import cache_path, get_pattern_matrix
+from scoring  import decode_pattern, encode_status
+from solver   import _codes_for, search
+from wordbank import WORDS_FILE, WordBank, get_word_bank
+
+
+class OpeningBook:
+    """
+    The best opener for a dictionary plus the best reply to each
+    feedback pattern it can get: `replies[code]` is a word ID, or -1 if
+    no target produces that pattern.
+    """
+    def __init__(self, bank: WordBank, opener: int, replies: np.ndarray):
+        self.bank    = bank
+        self.opener  = bank[int(opener)]
+        self.replies = replies
+
+    def reply(self, status: Sequence[str]) -> Optional[str]:
+        """Best second guess after the opener scored `status`."""
+        word_id = int(self.replies[encode_status(status)])
+        return self.bank[word_id] if word_id >= 0 else None
+
+    def lookup(self, guesses: Sequence[str], results: Sequence[Sequence[str]]) -> Optional[str]:
+        """The book's move for this position, or None if it's out of book."""
+        if not guesses:
+            return self.opener
+        if len(guesses) == 1 and guesses[0] == self.opener:
+            return self.reply(results[0])
+        return None
+
+    def save(self, path: str):
+        tmp = f"{path}.{os.getpid()}.tmp.npz"
+        try:
+            np.savez(tmp, digest=np.array(self.bank.digest),
+                     opener=np.int32(self.bank.id_of(self.opener)), replies=self.replies)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    @classmethod
+    def load(cls, bank: WordBank, path: str) -> 'OpeningBook':
+        with np.load(path) as data:
+            if str(data['digest']) != bank.digest:
+                raise ValueError(f"{path}: built for another dictionary")
+            replies = data['replies']
+            if replies.shape != (3 ** bank.word_length,):
+                raise ValueError(f"{path}: wrong number of patterns")
+            return cls(bank, int(data['opener']), replies)
+
+# ————————————————————————————————————————————————————————————————
+# Building: the opener, then one reply search per feedback bucket
+# ————————————————————————————————————————————————————————————————
+
+_worker_bank = None
+
+
+def _pool_init(words_file, word_length):
+    global _worker_bank
+    _worker_bank = get_word_bank(words_file, word_length)
+    get_pattern_matrix(_worker_bank)
+
+
+def _pool_task(code, candidates):
+    bank = _worker_bank
+    return code, bank.id_of(
+        search(bank, candidates, get_pattern_matrix(bank), parallel=False, exact=True)
+    )
+
+
+def build_book(bank: WordBank, workers: Optional[int] = None) -> OpeningBook:
+    """
+    Compute the book for `bank`. The opener search uses the solver's own
+    process pool on big dictionaries; the replies (one independent
+    search per non-empty feedback bucket) are spread over `workers`
+    processes, largest buckets first.
+    """
+    matrix = get_pattern_matrix(bank)
+    everything = np.arange(len(bank))
+    opener  = bank.id_of(search(bank, everything, matrix, exact=True))
+    codes   = _codes_for(bank, matrix, opener, everything)
+    buckets = {int(c): everything[codes == c] for c in np.unique(codes)}
+    replies = np.full(3 ** bank.word_length, -1, dtype=np.int32)
+
+    order = sorted(buckets, key=lambda c: -len(buckets[c]))
+    if bank.source is None or (workers or os.cpu_count() or 1) < 2:
+        for code in order:
+            replies[code] = bank.id_of(search(bank, buckets[code], matrix, parallel=False, exact=True))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_pool_init,
+            initargs=(bank.source, bank.word_length),
+            mp_context=multiprocessing.get_context('spawn')
+        ) as pool:
+            for code, word_id in pool.map(_pool_task, order, [buckets[c] for c in order]):
+                replies[code] = word_id
+    return OpeningBook(bank, opener, replies)
+
+# ————————————————————————————————————————————————————————————————
+# Shared instances: loaded from disk once per dictionary
+# ————————————————————————————————————————————————————————————————
+
+_BOOKS: Dict[str, Optional[OpeningBook]] = {}
+_BOOKS_LOCK = threading.Lock()
+
+
+def book_path(bank: WordBank) -> Optional[str]:
+    """`words.<digest>.book.npz` next to the bank's source file."""
+    return cache_path(bank, 'book.npz')
+
+
+def get_opening_book(bank: Optional[WordBank] = None) -> Optional[OpeningBook]:
+    """
+    The saved book for `bank` (default: the shared bank), or None if
+    none has been built for this exact word list. Never builds one.
+    """
+    bank = bank or get_word_bank()
+    if bank.digest in _BOOKS:
+        return _BOOKS[bank.digest]
+    with _BOOKS_LOCK:
+        if bank.digest not in _BOOKS:
+            path, book = book_path(bank), None
+            if path and os.path.exists(path):
+                try:
+                    book = OpeningBook.load(bank, path)
+                except (OSError, ValueError, KeyError):
+                    book = None     # stale or damaged: rebuild with the CLI
+            _BOOKS[bank.digest] = book
+        return _BOOKS[bank.digest]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the opening book for a word list")
+    parser.add_argument('--words',   default=WORDS_FILE)
+    parser.add_argument('--length',  type=int, default=WORD_LENGTH)
+    parser.add_argument('--workers', type=int, default=None, help="processes (default: all cores)")
+    args = parser.parse_args()
+
+    bank  = get_word_bank(args.words, args.length)
+    start = time.perf_counter()
+    book  = build_book(bank, args.workers)
+    took  = time.perf_counter() - start
+
+    path = book_path(bank)
+    book.save(path)
+    with _BOOKS_LOCK:
+        _BOOKS[bank.digest] = book
+    known = int((book.replies >= 0).sum())
+    print(f"opener {book.opener}, replies for {known} feedback patterns "
+          f"({len(bank)} words) in {took:.1f}s -> {path}")
+    for code in np.argsort(-np.bincount(
+            _codes_for(bank, get_pattern_matrix(bank), bank.id_of(book.opener), np.arange(len(bank))),
+            minlength=3 ** bank.word_length))[:5]:
+        status = decode_pattern(int(code), bank.word_length)
+        print(f"  {''.join(s[0].upper() for s in status)} -> {book.reply(status)}")
+
+
+if __name__ == "__main__":
+    main()
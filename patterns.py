@@ -0,0 +1,111 @@
+# patterns.py
+
+import os
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from scoring import decode_pattern, pattern_dtype, score_batch
+from wordbank import WordBank, get_word_bank
+
+# Banks larger than this don't get a full matrix (N^2 bytes on disk)
+MAX_MATRIX_WORDS = 16000
+
+# ————————————————————————————————————————————————————————————————
+# The matrix
+# ————————————————————————————————————————————————————————————————
+
+class PatternMatrix:
+    """
+    All-pairs feedback table for a WordBank.
+
+    `codes[g, t]` is the pattern code of guess ID g against target ID t
+    (see scoring.encode_status). The array is usually a read-only memmap.
+    """
+    def __init__(self, bank: WordBank, codes: np.ndarray):
+        self.bank  = bank
+        # plain ndarray view: same mapped pages, no np.memmap indexing overhead
+        self.codes = codes.view(np.ndarray)
+
+    def code(self, guess: str, target: str) -> int:
+        """Pattern code for one (guess, target) pair."""
+        return int(self.codes[self.bank.id_of(guess), self.bank.id_of(target)])
+
+    def statuses(self, guess: str, target: str) -> List[str]:
+        """Same list Game.results stores: 'correct' / 'present' / 'absent'."""
+        return decode_pattern(self.code(guess, target), self.bank.word_length)
+
+    def row(self, guess_id: int) -> np.ndarray:
+        """Codes of one guess against every target."""
+        return self.codes[guess_id]
+
+
+def build_codes(bank: WordBank, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Score every (guess, target) pair of `bank`, block by block."""
+    n = len(bank)
+    if out is None:
+        out = np.empty((n, n), dtype=pattern_dtype(bank.word_length))
+    encoded = bank.encoded
+    for rows, cols, codes in score_batch(encoded, encoded):
+        out[rows, cols] = codes
+    return out
+
+# ————————————————————————————————————————————————————————————————
+# On-disk cache, keyed by dictionary hash
+# ————————————————————————————————————————————————————————————————
+
+def cache_path(bank: WordBank, suffix: str) -> Optional[str]:
+    """`words.<digest>.<suffix>` next to the bank's source file."""
+    if bank.source is None:
+        return None
+    stem = os.path.splitext(bank.source)[0]
+    return f"{stem}.{bank.digest}.{suffix}"
+
+
+def _load_or_build(bank: WordBank) -> np.ndarray:
+    path = cache_path(bank, 'patterns.npy')
+    if path and os.path.exists(path):
+        try:
+            codes = np.load(path, mmap_mode='r')
+            if codes.shape == (len(bank), len(bank)):
+                return codes
+        except (OSError, ValueError):
+            pass   # truncated or foreign file: rebuild below
+
+    codes = build_codes(bank)
+    if path:
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, 'wb') as fp:
+                np.save(fp, codes)
+            os.replace(tmp, path)
+            return np.load(path, mmap_mode='r')
+        except OSError:
+            # read-only install: keep the in-memory copy
+            if os.path.exists(tmp):
+                os.remove(tmp)
+    return codes
+
+
+_MATRICES: Dict[str, PatternMatrix] = {}
+_MATRICES_LOCK = threading.Lock()
+
+
+def get_pattern_matrix(bank: Optional[WordBank] = None) -> Optional[PatternMatrix]:
+    """
+    Return the shared PatternMatrix for `bank` (default: the shared
+    WordBank), or None when the bank is too large to precompute.
+    """
+    bank = bank or get_word_bank()
+    if len(bank) > MAX_MATRIX_WORDS:
+        return None
+
+    matrix = _MATRICES.get(bank.digest)
+    if matrix is None:
+        with _MATRICES_LOCK:
+            matrix = _MATRICES.get(bank.digest)
+            if matrix is None:
+                matrix = PatternMatrix(bank, _load_or_build(bank))
+                _MATRICES[bank.digest] = matrix
+    return matrix
@@ -0,0 +1,35 @@
+# preload.py
+
+import threading
+from typing import Optional
+
+_THREAD: Optional[threading.Thread] = None
+
+
+def _load():
+    # imported here so the heavy modules load off the UI thread too
+    from wordbank import get_word_bank
+    from patterns import get_pattern_matrix
+    from opening_book import get_opening_book
+    import game  # noqa: F401  (solver, candidates, ...)
+
+    bank = get_word_bank()
+    get_pattern_matrix(bank)
+    get_opening_book(bank)
+
+
+def start_preload() -> threading.Thread:
+    """
+    Load the dictionary, its indexes and the game modules on a daemon
+    thread while the menu is up. Both loaders are lock-protected, so a
+    Game() created before this finishes just waits for the same result.
+    """
+    global _THREAD
+    if _THREAD is None:
+        _THREAD = threading.Thread(target=_load, name='preload', daemon=True)
+        _THREAD.start()
+    return _THREAD
+
+
+def preload_done() -> bool:
+    return _THREAD is not None and not _THREAD.is_alive()
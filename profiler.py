@@ -0,0 +1,208 @@
+# profiler.py
+
+import functools
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import nullcontext
+from typing import Deque, Dict, List, Optional
+
+import pygame
+
+from config import COLORS
+from fonts import get_font
+from text_cache import render_text
+
+# Frame samples kept per state for percentiles / the histogram
+HISTORY = 600
+
+# Trace events kept for export (oldest dropped first)
+MAX_TRACE_EVENTS = 200_000
+
+# Overlay histogram buckets, in ms
+HIST_BUCKETS = (1, 2, 4, 8, 16, 33, 66, float('inf'))
+
+_NULL = nullcontext()
+
+
+class _Section:
+    """Times one named span and reports it to the profiler."""
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name     = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler._record(self.name, self.start, time.perf_counter())
+        return False
+
+
+class Profiler:
+    """
+    Frame-time and hot-path profiler for the main loop.
+
+    When disabled every hook is a constant-time no-op (a shared
+    nullcontext / one attribute check), so it can stay wired in.
+    When enabled it records per-state frame, event-handling, draw() and
+    flip() durations plus any instrumented engine calls, keeps rolling
+    p50/p99 and a histogram for the overlay, and buffers Chrome
+    trace-event records for export_chrome_trace().
+    """
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.overlay = False
+        self.state   = None
+
+        self.frames: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=HISTORY))
+        self.phases: Dict[tuple, Deque[float]] = defaultdict(lambda: deque(maxlen=HISTORY))
+        self.trace:  Deque[dict] = deque(maxlen=MAX_TRACE_EVENTS)
+
+        self._frame_start: Optional[float] = None
+        self._t0   = time.perf_counter()
+        self._font = None
+
+    # ─── recording ───────────────────────────────────────────────────
+
+    def frame_begin(self, state: str):
+        if not self.enabled:
+            return
+        self.state = state
+        self._frame_start = time.perf_counter()
+
+    def frame_end(self):
+        if not self.enabled or self._frame_start is None:
+            return
+        end = time.perf_counter()
+        self.frames[self.state].append((end - self._frame_start) * 1000)
+        self._trace('frame', self._frame_start, end)
+        self._frame_start = None
+
+    def section(self, name: str):
+        """Context manager timing `name` (e.g. 'events', 'draw', 'flip')."""
+        if not self.enabled:
+            return _NULL
+        return _Section(self, name)
+
+    def instrument(self, owner, attr: str, label: Optional[str] = None):
+        """
+        Wrap owner.attr (a function or method) so each call is timed
+        while the profiler is enabled. Wrapping the same attribute twice
+        with one profiler is a no-op.
+        """
+        fn    = getattr(owner, attr)
+        if getattr(fn, '_profiler', None) is self:
+            return
+        label = label or f"{getattr(owner, '__name__', owner)}.{attr}"
+
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            if not self.enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._record(label, start, time.perf_counter())
+
+        timed._profiler = self
+        setattr(owner, attr, timed)
+
+    def _record(self, name, start, end):
+        self.phases[(self.state, name)].append((end - start) * 1000)
+        self._trace(name, start, end)
+
+    def _trace(self, name, start, end):
+        self.trace.append({
+            'name': name,
+            'cat':  self.state or 'none',
+            'ph':   'X',
+            'ts':   (start - self._t0) * 1e6,
+            'dur':  (end - start) * 1e6,
+            'pid':  1,
+            'tid':  threading.get_ident(),
+        })
+
+    # ─── reporting ───────────────────────────────────────────────────
+
+    @staticmethod
+    def percentiles(samples) -> Optional[tuple]:
+        """(p50, p99) of `samples` in ms, or None when empty."""
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        n = len(ordered)
+        return ordered[n // 2], ordered[min(n - 1, int(n * 0.99))]
+
+    def summary(self) -> List[str]:
+        lines = []
+        for state, samples in sorted(self.frames.items()):
+            p50, p99 = self.percentiles(samples)
+            lines.append(f"{state:<9} frame p50 {p50:6.2f}ms  p99 {p99:6.2f}ms  n={len(samples)}")
+            for (st, name), phase in self.phases.items():
+                if st == state:
+                    p50, p99 = self.percentiles(phase)
+                    lines.append(f"  {name:<18} p50 {p50:6.2f}ms  p99 {p99:6.2f}ms")
+        return lines
+
+    def export_chrome_trace(self, path: str) -> str:
+        """Write buffered events as Chrome trace-event JSON (chrome://tracing)."""
+        with open(path, 'w') as fp:
+            json.dump({'traceEvents': list(self.trace), 'displayTimeUnit': 'ms'}, fp)
+        return path
+
+    def toggle_overlay(self):
+        """Show/hide the overlay; showing it also turns recording on."""
+        self.overlay = not self.overlay
+        if self.overlay:
+            self.enabled = True
+
+    def draw_overlay(self, screen) -> Optional[pygame.Rect]:
+        """Draw the stats panel for the current state; returns its rect."""
+        if not self.overlay:
+            return None
+        if self._font is None:
+            self._font = get_font(16)
+        font   = self._font
+        line_h = font.get_height()
+
+        lines  = self.summary() or ["collecting..."]
+        hist   = self._histogram(self.frames.get(self.state, ()))
+        width  = 420
+        height = (len(lines) + 1) * line_h + 70
+        panel  = pygame.Rect(screen.get_width() - width - 10, 10, width, height)
+
+        pygame.draw.rect(screen, COLORS['bg'], panel)
+        pygame.draw.rect(screen, COLORS['text'], panel, 1)
+        y = panel.y + 6
+        for line in lines:
+            # live numbers change every refresh: keep them out of the shared text cache
+            screen.blit(font.render(line, True, COLORS['text']), (panel.x + 8, y))
+            y += line_h
+
+        # frame-time histogram for the current state
+        y += 6
+        bar_w  = (width - 16) // len(HIST_BUCKETS)
+        peak   = max(hist) or 1
+        for i, (count, upper) in enumerate(zip(hist, HIST_BUCKETS)):
+            bar_h = int(40 * count / peak)
+            x = panel.x + 8 + i * bar_w
+            pygame.draw.rect(screen, COLORS['present'], (x, y + 40 - bar_h, bar_w - 4, bar_h))
+            label = f"<{upper:g}" if upper != float('inf') else "more"
+            screen.blit(render_text(font, label, COLORS['text']), (x, y + 42))
+        return panel
+
+    @staticmethod
+    def _histogram(samples) -> List[int]:
+        counts = [0] * len(HIST_BUCKETS)
+        for ms in samples:
+            for i, upper in enumerate(HIST_BUCKETS):
+                if ms < upper:
+                    counts[i] += 1
+                    break
+        return counts
@@ -0,0 +1,270 @@
+# replay.py
+#
+# Deterministic input record/replay for performance regression checks.
+#
+#   python replay.py record session.replay        # play normally; input is saved on quit
+#   python replay.py play session.replay          # headless, unthrottled replay + timings
+#   python replay.py play session.replay --save-baseline baseline.json
+#   python replay.py play session.replay --baseline baseline.json --tolerance 0.25
+#
+# A recording holds the RNG seed, the starting shop_state.json and
+# stats.db (a consistent VACUUM INTO copy, base64) and the per-frame event stream fed to main.py's state machine. Replays
+# run in a scratch directory, so they never touch your real save files.
+
+import argparse
+import base64
+import gzip
+import json
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+# Text save files a session starts from (restored into the scratch dir on
+# replay); the stats database is snapshotted separately, see _read_saves
+SAVE_FILES = ('shop_state.json',)
+
+# Event attributes worth keeping, per event type name
+_EVENT_FIELDS = {
+    'KEYDOWN':         ('key', 'unicode', 'mod', 'scancode'),
+    'KEYUP':           ('key', 'unicode', 'mod', 'scancode'),
+    'MOUSEBUTTONDOWN': ('pos', 'button'),
+    'MOUSEBUTTONUP':   ('pos', 'button'),
+    'QUIT':            (),
+}
+
+FORMAT_VERSION = 2
+
+
+# ————————————————————————————————————————————————————————————————
+# Schedulers: drop-in replacements for scheduler.FrameScheduler
+# ————————————————————————————————————————————————————————————————
+
+class RecordingScheduler:
+    """Wraps the real scheduler and logs every frame's events."""
+    def __init__(self, inner):
+        self.inner  = inner
+        self.frames: List[list] = []
+
+    def wait(self, wake_at=None, animating=False):
+        import pygame
+        events = self.inner.wait(wake_at, animating)
+        frame  = []
+        for event in events:
+            name = pygame.event.event_name(event.type).upper()
+            if name in _EVENT_FIELDS:
+                attrs = {k: getattr(event, k) for k in _EVENT_FIELDS[name] if hasattr(event, k)}
+                frame.append([name, attrs])
+        self.frames.append(frame)
+        return events
+
+
+class ReplayScheduler:
+    """Feeds recorded frames back without ever blocking, then quits."""
+    def __init__(self, frames: List[list]):
+        self.frames = frames
+        self.index  = 0
+
+    def wait(self, wake_at=None, animating=False):
+        import pygame
+        if self.index >= len(self.frames):
+            return [pygame.event.Event(pygame.QUIT)]
+        frame = self.frames[self.index]
+        self.index += 1
+        pygame.event.pump()           # keep SDL happy; real input is ignored
+        return [
+            pygame.event.Event(getattr(pygame, name), **_decode_attrs(attrs))
+            for name, attrs in frame
+        ]
+
+
+def _decode_attrs(attrs):
+    return {k: tuple(v) if isinstance(v, list) else v for k, v in attrs.items()}
+
+
+# ————————————————————————————————————————————————————————————————
+# Recording files
+# ————————————————————————————————————————————————————————————————
+
+def save_recording(path, seed, saves, frames):
+    with gzip.open(path, 'wt') as fp:
+        json.dump({
+            'version': FORMAT_VERSION,
+            'seed':    seed,
+            'saves':   saves,
+            'frames':  frames,
+        }, fp, separators=(',', ':'))
+
+
+def load_recording(path) -> dict:
+    with gzip.open(path, 'rt') as fp:
+        data = json.load(fp)
+    if data.get('version') != FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported recording version {data.get('version')}")
+    return data
+
+
+def _read_saves(root) -> Dict[str, Optional[str]]:
+    from stats_store import STATS_DB, get_stats_store
+
+    saves = {}
+    for name in SAVE_FILES:
+        path = os.path.join(root, name)
+        saves[name] = open(path).read() if os.path.exists(path) else None
+
+    # open the store first so a legacy stats.json is imported exactly as
+    # the game would, then copy it (WAL included) in one transaction
+    get_stats_store(os.path.join(root, STATS_DB))
+    with tempfile.TemporaryDirectory() as tmp:
+        copy = os.path.join(tmp, STATS_DB)
+        conn = sqlite3.connect(os.path.join(root, STATS_DB))
+        try:
+            conn.execute("VACUUM INTO ?", (copy,))
+        finally:
+            conn.close()
+        with open(copy, 'rb') as fp:
+            saves[STATS_DB] = base64.b64encode(fp.read()).decode('ascii')
+    return saves
+
+
+def _write_saves(root, saves: Dict[str, Optional[str]]):
+    from stats_store import STATS_DB
+
+    for name, text in saves.items():
+        if text is None:
+            continue
+        if name == STATS_DB:
+            with open(os.path.join(root, name), 'wb') as fp:
+                fp.write(base64.b64decode(text))
+        else:
+            with open(os.path.join(root, name), 'w') as fp:
+                fp.write(text)
+
+
+# ————————————————————————————————————————————————————————————————
+# Commands
+# ————————————————————————————————————————————————————————————————
+
+def record(path, seed=None):
+    import main as game_main
+    from scheduler import FrameScheduler
+
+    seed  = random.randrange(2 ** 32) if seed is None else seed
+    saves = _read_saves(os.getcwd())
+    random.seed(seed)
+
+    import pygame
+    pygame.init()
+    recorder = RecordingScheduler(FrameScheduler())
+    game_main.main(scheduler=recorder)
+    save_recording(path, seed, saves, recorder.frames)
+    print(f"recorded {len(recorder.frames)} frames to {path}")
+
+
+def play(path) -> dict:
+    """Replay `path` headless and unthrottled; returns the timing report."""
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    data = load_recording(path)
+    repo = os.path.dirname(os.path.abspath(__file__))
+
+    # scratch copy of the working dir: save files from the recording,
+    # dictionary (and its caches) linked from the repo
+    scratch = tempfile.mkdtemp(prefix='wordle-replay-')
+    try:
+        for name in os.listdir(repo):
+            if name.startswith('words.'):
+                os.symlink(os.path.join(repo, name), os.path.join(scratch, name))
+        _write_saves(scratch, data['saves'])
+
+        cwd = os.getcwd()
+        os.chdir(scratch)
+        try:
+            import main as game_main
+            from profiler import Profiler
+
+            random.seed(data['seed'])
+            profiler = Profiler(enabled=True)
+            start = time.perf_counter()
+            game_main.main(scheduler=ReplayScheduler(data['frames']), profiler=profiler)
+            total = (time.perf_counter() - start) * 1000
+        finally:
+            os.chdir(cwd)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    report = {'total_ms': total, 'frames': len(data['frames']), 'states': {}}
+    for state, samples in profiler.frames.items():
+        p50, p99 = Profiler.percentiles(samples)
+        report['states'][state] = {
+            'frames':  len(samples),
+            'mean_ms': sum(samples) / len(samples),
+            'p50_ms':  p50,
+            'p99_ms':  p99,
+        }
+    return report
+
+
+def compare(report, baseline, tolerance) -> List[str]:
+    """Regressions of `report` vs `baseline` beyond `tolerance` (fraction)."""
+    problems = []
+    limit = 1 + tolerance
+    if report['total_ms'] > baseline['total_ms'] * limit:
+        problems.append(f"total {report['total_ms']:.1f}ms > {baseline['total_ms']:.1f}ms x {limit:.2f}")
+    for state, base in baseline['states'].items():
+        cur = report['states'].get(state)
+        if cur is None:
+            problems.append(f"{state}: no frames in this run")
+            continue
+        for metric in ('mean_ms', 'p50_ms'):
+            if cur[metric] > base[metric] * limit:
+                problems.append(
+                    f"{state} {metric} {cur[metric]:.3f} > {base[metric]:.3f} x {limit:.2f}"
+                )
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record/replay input for perf regressions")
+    sub = parser.add_subparsers(dest='cmd', required=True)
+
+    rec = sub.add_parser('record', help="play normally and save the input stream")
+    rec.add_argument('path')
+    rec.add_argument('--seed', type=int, default=None)
+
+    ply = sub.add_parser('play', help="replay headless and report frame times")
+    ply.add_argument('path')
+    ply.add_argument('--baseline', help="fail if slower than this report")
+    ply.add_argument('--tolerance', type=float, default=0.2,
+                     help="allowed slowdown vs baseline (0.2 = 20%%)")
+    ply.add_argument('--save-baseline', help="write this run's report here")
+    args = parser.parse_args()
+
+    if args.cmd == 'record':
+        record(args.path, args.seed)
+        return
+
+    report = play(args.path)
+    print(f"total: {report['total_ms']:.1f}ms over {report['frames']} frames")
+    for state, r in sorted(report['states'].items()):
+        print(f"  {state:<9} n={r['frames']:<5} mean {r['mean_ms']:.3f}ms  "
+              f"p50 {r['p50_ms']:.3f}ms  p99 {r['p99_ms']:.3f}ms")
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as fp:
+            json.dump(report, fp, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as fp:
+            problems = compare(report, json.load(fp), args.tolerance)
+        for p in problems:
+            print(f"REGRESSION: {p}")
+        if problems:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# scheduler.py
+
+from typing import List, Optional
+
+import pygame
+
+# Frame rate while something on screen is animating
+ACTIVE_FPS = 60
+
+
+class FrameScheduler:
+    """
+    Decides when the main loop runs its next frame.
+
+    While a screen is animating we tick at ACTIVE_FPS like before.
+    Otherwise we block in pygame.event.wait() until input arrives or the
+    screen's next deadline (e.g. a transient message expiring) passes,
+    so an idle menu or finished game costs ~no CPU. Input is returned as
+    soon as it arrives, so blocking adds no latency.
+    """
+    def __init__(self, active_fps: int = ACTIVE_FPS):
+        self.active_fps = active_fps
+        self.clock      = pygame.time.Clock()
+
+        # nothing on screen reacts to hover, so don't wake up for it
+        pygame.event.set_blocked(pygame.MOUSEMOTION)
+
+    def wait(self, wake_at: Optional[int] = None, animating: bool = False) -> List[pygame.event.Event]:
+        """
+        Block until there is something to do and return the pending events
+        (possibly none, when woken by a deadline or animation tick).
+        `wake_at` is an absolute pygame.time.get_ticks() value.
+        """
+        if animating:
+            self.clock.tick(self.active_fps)
+            return pygame.event.get()
+
+        if wake_at is None:
+            first = pygame.event.wait()
+        else:
+            timeout = wake_at - pygame.time.get_ticks()
+            if timeout <= 0:
+                return pygame.event.get()
+            first = pygame.event.wait(timeout)
+
+        events = [] if first.type == pygame.NOEVENT else [first]
+        events.extend(pygame.event.get())
+
+        # keep Clock's frame timing meaningful for whoever reads it
+        self.clock.tick()
+        return events
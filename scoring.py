@@ -0,0 +1,178 @@
+# scoring.py
+
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Sequence, Tuple, Union
+
+import numpy as np
+
+# Per-letter statuses, indexed by their digit in a pattern code
+STATUSES = ('absent', 'present', 'correct')
+_DIGIT   = {status: digit for digit, status in enumerate(STATUSES)}
+
+# ————————————————————————————————————————————————————————————————
+# Reference scorer (one guess, one target)
+# ————————————————————————————————————————————————————————————————
+
+def score_guess(guess: str, target: str) -> List[str]:
+    """
+    Two-pass Wordle scoring: greens first, then yellows left to right,
+    each consuming one unmatched copy of the letter in the target.
+    """
+    status = []
+    target_chars = list(target)
+    # first pass: correct spots
+    for i, ch in enumerate(guess):
+        if ch == target_chars[i]:
+            status.append('correct')
+            target_chars[i] = None
+        else:
+            status.append(None)
+
+    # second pass: present vs absent
+    for i, ch in enumerate(guess):
+        if status[i] is None:
+            if ch in target_chars:
+                status[i] = 'present'
+                target_chars[target_chars.index(ch)] = None
+            else:
+                status[i] = 'absent'
+    return status
+
+# ————————————————————————————————————————————————————————————————
+# Pattern codes: one base-3 digit per letter, position 0 least significant
+# ————————————————————————————————————————————————————————————————
+
+def pattern_dtype(word_length: int):
+    """Smallest unsigned dtype that holds every pattern code."""
+    return np.uint8 if 3 ** word_length <= 256 else np.uint16
+
+
+def all_correct_code(word_length: int) -> int:
+    """Code of the all-green pattern."""
+    return 3 ** word_length - 1
+
+
+def encode_status(status: Sequence[str]) -> int:
+    """['absent', 'correct', ...] -> base-3 code."""
+    code = 0
+    for i, s in enumerate(status):
+        code += _DIGIT[s] * 3 ** i
+    return code
+
+
+@lru_cache(maxsize=None)
+def _decode_table(word_length: int):
+    table = []
+    for code in range(3 ** word_length):
+        status = []
+        for _ in range(word_length):
+            code, digit = divmod(code, 3)
+            status.append(STATUSES[digit])
+        table.append(tuple(status))
+    return tuple(table)
+
+
+def decode_pattern(code: int, word_length: int) -> List[str]:
+    """Base-3 code -> ['absent', 'correct', ...]."""
+    return list(_decode_table(word_length)[int(code)])
+
+
+def encode_words(words: Iterable[str]) -> np.ndarray:
+    """Upper-case words -> (N, word_length) uint8 array of letter indexes (A=0)."""
+    words = list(words)
+    if not words:
+        return np.zeros((0, 0), dtype=np.uint8)
+    raw = np.frombuffer(''.join(words).encode('ascii'), dtype=np.uint8)
+    return (raw.reshape(len(words), -1) - ord('A')).astype(np.uint8)
+
+# ————————————————————————————————————————————————————————————————
+# Vectorized kernel
+# ————————————————————————————————————————————————————————————————
+
+def score_codes(guesses: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """
+    Score encoded guesses against encoded targets, broadcasting over all
+    leading axes, and return pattern codes. Matches score_guess exactly:
+    a non-green letter is 'present' iff the target has more unmatched
+    copies of it than there are earlier non-green copies in the guess.
+    """
+    word_length = guesses.shape[-1]
+    shape = np.broadcast_shapes(guesses.shape[:-1], targets.shape[:-1])
+    dtype = pattern_dtype(word_length)
+
+    # work column by column so every op runs on a contiguous pair array
+    g = [guesses[..., i] for i in range(word_length)]
+    t = [targets[..., i] for i in range(word_length)]
+    not_green = [g[i] != t[i] for i in range(word_length)]
+
+    codes = np.zeros(shape, dtype=dtype)
+    for i in range(word_length):
+        avail = np.zeros(shape, dtype=np.uint8)
+        for j in range(word_length):
+            avail += (t[j] == g[i]) & not_green[j]
+        used = np.zeros(shape, dtype=np.uint8)
+        for j in range(i):
+            used += (g[j] == g[i]) & not_green[j]
+
+        present = not_green[i] & (used < avail)
+        codes  += np.where(not_green[i], present, 2).astype(dtype) * dtype(3 ** i)
+    return codes
+
+# ————————————————————————————————————————————————————————————————
+# Streaming batch API
+# ————————————————————————————————————————————————————————————————
+
+# Pairs scored per yielded block; bounds peak memory to a few tens of MB
+DEFAULT_BLOCK_PAIRS = 1 << 18
+
+WordsLike = Union[Sequence[str], np.ndarray]
+
+
+def _as_encoded(words: WordsLike) -> np.ndarray:
+    if isinstance(words, np.ndarray):
+        return words
+    return encode_words(words)
+
+
+def score_batch(
+    guesses: WordsLike,
+    targets: WordsLike,
+    block_pairs: int = DEFAULT_BLOCK_PAIRS
+) -> Iterator[Tuple[slice, slice, np.ndarray]]:
+    """
+    Score every guess against every target, in bounded-size blocks.
+
+    `guesses` / `targets` are word lists or encode_words() arrays. Yields
+    (guess_slice, target_slice, codes) where codes[i, j] is the pattern
+    of guesses[guess_slice][i] against targets[target_slice][j]. Blocks
+    cover the full guess x target grid exactly once.
+    """
+    g = _as_encoded(guesses)
+    t = _as_encoded(targets)
+    n_g, n_t = len(g), len(t)
+    if n_g == 0 or n_t == 0:
+        return
+
+    # whole target rows when they fit, otherwise split the target axis too
+    cols = min(n_t, block_pairs)
+    rows = max(1, block_pairs // cols)
+    for g0 in range(0, n_g, rows):
+        g1 = min(g0 + rows, n_g)
+        for t0 in range(0, n_t, cols):
+            t1 = min(t0 + cols, n_t)
+            codes = score_codes(g[g0:g1, None, :], t[None, t0:t1, :])
+            yield slice(g0, g1), slice(t0, t1), codes
+
+
+def score_one(guess: str, targets: WordsLike) -> np.ndarray:
+    """Codes of one guess against many targets (1-D)."""
+    t = _as_encoded(targets)
+    g = encode_words([guess])
+    return score_codes(g, t)
+
+
+def score_many(guesses: WordsLike, target: str) -> np.ndarray:
+    """Codes of many guesses against one target (1-D)."""
+    g = _as_encoded(guesses)
+    t = encode_words([target])
+    return score_codes(g, t)
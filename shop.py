@@ -1,9 +1,10 @@
 # shop.py
 
-import json
 import random
 from typing import Callable, Dict
 
+from shop_store import ShopStore
+
 # ————————————————————————————————————————————————————————————————
 # Data classes
 # ————————————————————————————————————————————————————————————————
@@ -51,20 +52,41 @@ def _effect_reveal_random_letter(game):
     """
     if hasattr(game, 'reveal_random_letter'):
         game.reveal_random_letter()
+    elif hasattr(game, 'reveal_letter'):
+        game.reveal_letter()
     else:
         raise NotImplementedError("Game.reveal_random_letter() not implemented")
 
 def _effect_reveal_one_letter(game):
     """
-    Reveal one specific letter of your choice in its correct position.
-    E.g. you may pop up a mini‐UI for the player to pick which letter to reveal.
-    Your Game class should implement `reveal_one_letter()` accordingly.
+    Reveal the correct letter for the first position the player hasn't
+    solved yet (Game.reveal_one_letter() posts it as a notice).
     """
     if hasattr(game, 'reveal_one_letter'):
         game.reveal_one_letter()
     else:
         raise NotImplementedError("Game.reveal_one_letter() not implemented")
 
+def _effect_best_guess(game):
+    """
+    Ask the solver for the guess that narrows down the remaining words the most.
+    The answer arrives asynchronously; GameUI shows it once ready.
+    """
+    if hasattr(game, 'request_best_guess'):
+        game.request_best_guess()
+    else:
+        raise NotImplementedError("Game.request_best_guess() not implemented")
+
+def _effect_matches_remaining(game):
+    """
+    Tell the player how many words still fit what they know, including
+    the letters typed on the current row.
+    """
+    if hasattr(game, 'count_matches'):
+        game.count_matches()
+    else:
+        raise NotImplementedError("Game.count_matches() not implemented")
+
 # ————————————————————————————————————————————————————————————————
 # The shop catalog
 # ————————————————————————————————————————————————————————————————
@@ -88,9 +110,23 @@ CATALOG: Dict[str, ShopItem] = {
         item_id="reveal_one",
         name="Reveal One Letter",
         cost=50,
-        description="Pick a position to reveal the correct letter.",
+        description="Reveals the letter in your first unsolved position.",
         effect=_effect_reveal_one_letter
     ),
+    "best_guess": ShopItem(
+        item_id="best_guess",
+        name="Best Guess",
+        cost=120,
+        description="Suggests the most informative word to try next.",
+        effect=_effect_best_guess
+    ),
+    "matches_left": ShopItem(
+        item_id="matches_left",
+        name="Matches Left",
+        cost=40,
+        description="Counts the words that still fit your clues and current row.",
+        effect=_effect_matches_remaining
+    ),
 }
 
 # ————————————————————————————————————————————————————————————————
@@ -104,41 +140,31 @@ class Shop:
     def __init__(self, state_file: str = _STATE_FILE):
         self.state_file = state_file
 
-        # player currency
-        self.coins: int = 0
+        # coins & per-item counts, e.g. { "extra_guess": 2, "reveal_one": 0, ... };
+        # changes are journaled and written behind (see shop_store.py)
+        self._store = ShopStore(state_file, CATALOG)
 
-        # how many of each item the player owns
-        # e.g. { "extra_guess": 2, "reveal_one": 0, ... }
-        self.inventory: Dict[str, int] = {item_id: 0 for item_id in CATALOG}
+    @property
+    def coins(self) -> int:
+        """Player currency."""
+        return self._store.coins
 
-        self._load_state()
-
-    def _load_state(self):
-        """Attempt to load coins & inventory from disk."""
-        try:
-            data = json.load(open(self.state_file, "r"))
-            self.coins     = data.get("coins", self.coins)
-            inv            = data.get("inventory", {})
-            for k, v in inv.items():
-                if k in self.inventory:
-                    self.inventory[k] = v
-        except (FileNotFoundError, json.JSONDecodeError):
-            # first run or corrupted file: ignore
-            pass
+    @property
+    def inventory(self) -> Dict[str, int]:
+        """How many of each item the player owns (a snapshot)."""
+        return self._store.inventory
 
     def save_state(self):
-        """Persist coins & inventory back to disk."""
-        data = {
-            "coins":     self.coins,
-            "inventory": self.inventory
-        }
-        with open(self.state_file, "w") as fp:
-            json.dump(data, fp, indent=2)
+        """Write any pending changes to disk now (they flush on their own shortly)."""
+        self._store.flush()
+
+    def close(self):
+        """Write pending changes and stop the background writer."""
+        self._store.close()
 
     def earn_coins(self, amount: int):
         """Call when the player finishes a puzzle, etc."""
-        self.coins += amount
-        self.save_state()
+        self._store.record(coins=amount)
 
     def can_afford(self, item_id: str) -> bool:
         item = CATALOG.get(item_id)
@@ -156,27 +182,27 @@ class Shop:
         if self.coins < item.cost:
             return False
 
-        self.coins -= item.cost
-        self.inventory[item_id] += 1
-        self.save_state()
-        return True
+        # re-checked against the file: another instance may have spent the coins
+        return self._store.spend(coins=-item.cost, items={item_id: 1})
+
+    def use(self, key, game) -> bool:
+        """
+        Spend one unit of boost `key` on `game`.
+        Returns True if the boost was applied.
+        """
+        item = CATALOG.get(key)
+        if not item or self.inventory.get(key, 0) < 1:
+            return False  # nothing to do
 
-    def use(self, key, game):
-        inv = self.get_inventory()
-        if inv.get(key, 0) < 1:
-            return  # nothing to do
+        # Apply effect; boosts the Game can't handle aren't consumed
+        try:
+            item.effect(game)
+        except NotImplementedError:
+            return False
 
         # Decrement
-        inv[key] -= 1
-
-        # Apply effect
-        if key == 'reveal':
-            game.reveal_letter()
-        elif key == 'extra':
-            game.grant_extra_guess()
-        elif key == 'freeze':
-            game.freeze_timer()
-        
+        self._store.record(items={key: -1})
+        return True
 
     def get_catalog(self):
         """Return list of ShopItems for display in your UI."""
@@ -0,0 +1,242 @@
+# shop_store.py
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:       # Windows: no advisory locks, single instance assumed
+    fcntl = None
+
+# Changes are coalesced for this long before being written
+DEBOUNCE_S = 0.5
+
+
+class _FileLock:
+    """Exclusive advisory lock on `<path>.lock` across processes."""
+    def __init__(self, path: str):
+        self.path = path + '.lock'
+        self._fd  = None
+
+    def __enter__(self):
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
+        return False
+
+
+def _read_state(path: str) -> Optional[dict]:
+    """Parsed state file, {} if missing, None if unreadable."""
+    try:
+        with open(path, 'r') as fp:
+            data = json.load(fp)
+    except FileNotFoundError:
+        return {}
+    except (json.JSONDecodeError, IOError, UnicodeDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _write_atomic(path: str, data: dict):
+    """Write JSON to a temp file, fsync it, rename it over `path`."""
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix='.shop-', suffix='.tmp', dir=folder)
+    try:
+        with os.fdopen(fd, 'w') as fp:
+            json.dump(data, fp, separators=(',', ':'))
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+    # make the rename itself durable
+    try:
+        dir_fd = os.open(folder, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def _covers(state: dict, coins: int, items: Dict[str, int]) -> bool:
+    """True if applying the deltas to `state` leaves nothing negative."""
+    return state['coins'] + coins >= 0 and all(
+        state['inventory'].get(k, 0) + v >= 0 for k, v in items.items()
+    )
+
+
+class ShopStore:
+    """
+    Write-behind persistence for coins and boost counts.
+
+    Mutations are journaled as in-memory deltas and applied to the
+    visible state immediately; a background thread flushes them after
+    DEBOUNCE_S (and at exit). A flush takes an exclusive file lock,
+    re-reads the file, adds our deltas on top and writes the result
+    atomically, so a second running instance's changes are merged
+    rather than overwritten. Debits go through spend(), which checks
+    them against the file as re-read under the lock, so two instances
+    can't both spend the same coins. An unreadable file (at load or at
+    flush) is moved aside to `<path>.corrupt` instead of being silently
+    replaced.
+    """
+    def __init__(self, path: str, items, debounce: float = DEBOUNCE_S):
+        # absolute: flushes happen later, possibly after a chdir (replay.py)
+        self.path     = os.path.abspath(path)
+        self.debounce = debounce
+        self._items   = tuple(items)
+
+        self._lock       = threading.Lock()     # guards the three states below
+        self._flush_lock = threading.Lock()     # one flush at a time
+        self._base       = self._empty()        # last state known to be on disk
+        self._inflight   = self._empty()        # deltas being written right now
+        self._pending    = self._empty()        # deltas not yet picked up
+
+        with _FileLock(self.path):
+            self._base = self._merge(self._base, self._load_locked() or {})
+
+        self._wake    = threading.Event()
+        self._closed  = False
+        self._thread  = threading.Thread(target=self._run, name='shop-store', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    # ─── state view ──────────────────────────────────────────────────
+
+    def _empty(self) -> dict:
+        return {'coins': 0, 'inventory': {k: 0 for k in self._items}}
+
+    def _merge(self, into: dict, delta: dict) -> dict:
+        inv = dict(into['inventory'])
+        for k, v in delta.get('inventory', {}).items():
+            if k in inv and isinstance(v, int):
+                inv[k] += v
+        coins = delta.get('coins', 0)
+        return {'coins': into['coins'] + (coins if isinstance(coins, int) else 0), 'inventory': inv}
+
+    def state(self) -> dict:
+        """Current coins/inventory including changes not yet on disk."""
+        with self._lock:
+            return self._merge(self._merge(self._base, self._inflight), self._pending)
+
+    @property
+    def coins(self) -> int:
+        return self.state()['coins']
+
+    @property
+    def inventory(self) -> Dict[str, int]:
+        return self.state()['inventory']
+
+    # ─── mutations ───────────────────────────────────────────────────
+
+    def record(self, coins: int = 0, items: Optional[Dict[str, int]] = None):
+        """Journal a change (deltas) and schedule a flush."""
+        with self._lock:
+            self._pending['coins'] += coins
+            for k, v in (items or {}).items():
+                self._pending['inventory'][k] += v
+        self._wake.set()
+
+    def spend(self, coins: int = 0, items: Optional[Dict[str, int]] = None) -> bool:
+        """
+        Apply a debit (deltas, as for record()) only if it leaves no
+        balance negative in the latest state: the file re-read under the
+        lock plus our unwritten changes. Written through immediately.
+        Falls back to the in-memory state if the file can't be written.
+        """
+        items = items or {}
+        with self._flush_lock:
+            with self._lock:
+                self._inflight, self._pending = self._pending, self._empty()
+            try:
+                with _FileLock(self.path):
+                    disk = self._load_locked()
+                    base = self._base if disk is None else self._merge(self._empty(), disk)
+                    new  = self._merge(base, self._inflight)
+                    with self._lock:
+                        latest = self._merge(new, self._pending)
+                    ok = _covers(latest, coins, items)
+                    if ok:
+                        new = self._merge(new, {'coins': coins, 'inventory': items})
+                    _write_atomic(self.path, new)
+            except OSError:
+                with self._lock:
+                    self._pending  = self._merge(self._inflight, self._pending)
+                    self._inflight = self._empty()
+                    latest = self._merge(self._base, self._pending)
+                ok = _covers(latest, coins, items)
+                if ok:
+                    self.record(coins, items)
+                return ok
+            with self._lock:
+                self._base     = new
+                self._inflight = self._empty()
+            return ok
+
+    # ─── persistence ─────────────────────────────────────────────────
+
+    def _load_locked(self) -> Optional[dict]:
+        """The file's state; None (after moving it to .corrupt) if unreadable."""
+        data = _read_state(self.path)
+        if data is None:
+            # keep the bad file for inspection; callers fall back to what they know
+            try:
+                os.replace(self.path, self.path + '.corrupt')
+            except OSError:
+                pass
+        return data
+
+    def flush(self):
+        """Write pending changes now (blocking). Safe to call from any thread."""
+        with self._flush_lock:
+            with self._lock:
+                if self._pending == self._empty():
+                    return
+                self._inflight, self._pending = self._pending, self._empty()
+            try:
+                with _FileLock(self.path):
+                    disk = self._load_locked()
+                    base = self._base if disk is None else self._merge(self._empty(), disk)
+                    new  = self._merge(base, self._inflight)
+                    _write_atomic(self.path, new)
+            except OSError:
+                # leave the deltas journaled for the next attempt
+                with self._lock:
+                    self._pending  = self._merge(self._inflight, self._pending)
+                    self._inflight = self._empty()
+                return
+            with self._lock:
+                self._base     = new
+                self._inflight = self._empty()
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait()
+            time.sleep(self.debounce)     # coalesce bursts of changes
+            self._wake.clear()
+            self.flush()
+
+    def close(self):
+        """Flush synchronously and stop the background writer."""
+        self._closed = True
+        self._wake.set()
+        self.flush()
@@ -1,7 +1,10 @@
 # shop_ui.py
 
 import pygame
-from config import WIDTH, HEIGHT, FONT_NAME, FONT_SIZE, KEY_FONT_SIZE, COLORS
+from config import WIDTH, HEIGHT, FONT_SIZE, KEY_FONT_SIZE, COLORS
+from fonts import get_font
+from text_cache import render_text
+from layers import static_layer
 from shop import ShopItem
 
 class ShopUI:
@@ -10,9 +13,9 @@ class ShopUI:
         self.shop   = shop
 
         # fonts
-        self.title_font = pygame.font.SysFont(FONT_NAME, FONT_SIZE + 8, bold=True)
-        self.font       = pygame.font.SysFont(FONT_NAME, FONT_SIZE)
-        self.small_font = pygame.font.SysFont(FONT_NAME, KEY_FONT_SIZE)
+        self.title_font = get_font(FONT_SIZE + 8, bold=True)
+        self.font       = get_font(FONT_SIZE)
+        self.small_font = get_font(KEY_FONT_SIZE)
 
         # layout
         self.back_rect = pygame.Rect(10, 10, 80, 30)
@@ -57,52 +60,58 @@ class ShopUI:
         return None
 
     def draw(self):
-        self.screen.fill(COLORS['bg'])
-
-        # title
-        title_surf = self.title_font.render("SHOP", True, COLORS['text'])
-        tx = (WIDTH - title_surf.get_width()) // 2
-        self.screen.blit(title_surf, (tx, 20))
+        layout = tuple((item.id, item.cost, tuple(box), tuple(buy)) for item, box, buy in self.item_boxes)
+        self.screen.blit(static_layer('shop', self.screen, self._build_static, layout), (0, 0))
 
         # balance
         bal = self.shop.get_balance()
-        bal_surf = self.font.render(f"Coins: {bal}", True, COLORS['text'])
+        bal_surf = render_text(self.font, f"Coins: {bal}", COLORS['text'])
         self.screen.blit(bal_surf, (WIDTH - bal_surf.get_width() - 20, 20))
 
+        # owned counts
+        inv = self.shop.get_inventory()
+        for item, box, buy in self.item_boxes:
+            owned = inv.get(item.id, 0)
+            own_s = render_text(self.small_font, f"x{owned}", COLORS['text'])
+            self.screen.blit(own_s, (box.x + 10, box.y + box.h - 24))
+
+    def _build_static(self, surf):
+        """Background, title, Back button and every item box except its count."""
+        surf.fill(COLORS['bg'])
+
+        # title
+        title_surf = render_text(self.title_font, "SHOP", COLORS['text'])
+        tx = (WIDTH - title_surf.get_width()) // 2
+        surf.blit(title_surf, (tx, 20))
+
         # back button
-        pygame.draw.rect(self.screen, COLORS['button_BG'], self.back_rect)
-        pygame.draw.rect(self.screen, COLORS['text'], self.back_rect, 2)
-        back_s = self.small_font.render("Back", True, COLORS['text'])
+        pygame.draw.rect(surf, COLORS['button_BG'], self.back_rect)
+        pygame.draw.rect(surf, COLORS['text'], self.back_rect, 2)
+        back_s = render_text(self.small_font, "Back", COLORS['text'])
         bx = self.back_rect.x + (self.back_rect.w - back_s.get_width())//2
         by = self.back_rect.y + (self.back_rect.h - back_s.get_height())//2
-        self.screen.blit(back_s, (bx, by))
+        surf.blit(back_s, (bx, by))
 
         # list items
-        inv = self.shop.get_inventory()
         for item, box, buy in self.item_boxes:
             # outline
-            pygame.draw.rect(self.screen, COLORS['text'], box, 2)
+            pygame.draw.rect(surf, COLORS['text'], box, 2)
 
             # name & description
-            name_s = self.font.render(item.name, True, COLORS['text'])
-            self.screen.blit(name_s, (box.x + 10, box.y + 8))
-
-            desc_s = self.small_font.render(item.description, True, COLORS['text'])
-            self.screen.blit(desc_s, (box.x + 10, box.y + 36))
+            name_s = render_text(self.font, item.name, COLORS['text'])
+            surf.blit(name_s, (box.x + 10, box.y + 8))
 
-            # owned count
-            owned = inv.get(item.id, 0)
-            own_s = self.small_font.render(f"x{owned}", True, COLORS['text'])
-            self.screen.blit(own_s, (box.x + 10, box.y + box.h - 24))
+            desc_s = render_text(self.small_font, item.description, COLORS['text'])
+            surf.blit(desc_s, (box.x + 10, box.y + 36))
 
             # cost
-            cost_s = self.small_font.render(f"{item.cost}¢", True, COLORS['text'])
-            self.screen.blit(cost_s, (buy.x - cost_s.get_width() - 10, buy.y + 6))
+            cost_s = render_text(self.small_font, f"{item.cost}¢", COLORS['text'])
+            surf.blit(cost_s, (buy.x - cost_s.get_width() - 10, buy.y + 6))
 
             # buy button
-            pygame.draw.rect(self.screen, COLORS['button_BG'], buy)
-            pygame.draw.rect(self.screen, COLORS['text'], buy, 2)
-            b_s = self.small_font.render("BUY", True, COLORS['text'])
+            pygame.draw.rect(surf, COLORS['button_BG'], buy)
+            pygame.draw.rect(surf, COLORS['text'], buy, 2)
+            b_s = render_text(self.small_font, "BUY", COLORS['text'])
             bx = buy.x + (buy.w - b_s.get_width())//2
             by = buy.y + (buy.h - b_s.get_height())//2
-            self.screen.blit(b_s, (bx, by))
+            surf.blit(b_s, (bx, by))
@@ -0,0 +1,305 @@
+# simulate.py
+#
+# Headless self-play across every CPU core, streaming one row per game to
+# a columnar results directory. The built-in policies play on word IDs and
+# pattern-matrix rows directly (no Game objects, no string decoding):
+# about 40k games/s per core with --policy random on words.txt, ~6x the
+# Game path that custom module:function policies still drive.
+#
+#   python simulate.py --games 1000000 --policy random --out sim_results
+#   python simulate.py --games 20000 --policy entropy --max-guesses 5
+#   python simulate.py --policy mypolicies:greedy     # any (game, rng) -> str
+
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+from config   import GRID_SIZE, WORD_LENGTH
+from game     import Game
+from opening_book import get_opening_book
+from patterns import get_pattern_matrix
+from scoring  import all_correct_code
+from solver   import best_guess, search
+from wordbank import WORDS_FILE, get_word_bank
+
+# Games per pool task; also the granularity results are flushed at
+CHUNK_GAMES = 10_000
+
+# Output columns: name -> on-disk dtype
+COLUMNS = {
+    'target':  np.uint32,   # WordBank ID of the target
+    'guesses': np.uint8,    # rows used
+    'won':     np.uint8,    # 1 = solved
+    'boosts':  np.uint8,    # boosts consumed
+}
+
+# ————————————————————————————————————————————————————————————————
+# Guessing policies: (game, rng) -> guess
+# ————————————————————————————————————————————————————————————————
+
+def policy_random(game, rng):
+    """Any word still consistent with the feedback."""
+    ids = game.candidates.ids
+    return game.bank[int(ids[rng.randrange(len(ids))])]
+
+
+def policy_first(game, rng):
+    """Alphabetically first surviving word (fast, deterministic)."""
+    return game.bank[int(game.candidates.ids[0])]
+
+
+def policy_entropy(game, rng):
+    """The Best Guess solver."""
+    return best_guess(game.bank, game.guesses, game.results, game.candidates.ids)
+
+
+POLICIES: Dict[str, Callable] = {
+    'random':  policy_random,
+    'first':   policy_first,
+    'entropy': policy_entropy,
+}
+
+
+# ─── the same policies on word IDs: (bank, matrix, ids, history, rng) -> ID ───
+# `ids` are the survivors, `history` the (guess ID, code) pairs so far
+
+def _fast_random(bank, matrix, ids, history, rng):
+    return int(ids[rng.randrange(len(ids))])
+
+
+def _fast_first(bank, matrix, ids, history, rng):
+    return int(ids[0])
+
+
+def _fast_entropy(bank, matrix, ids, history, rng):
+    book = get_opening_book(bank)
+    if book is not None:
+        opener = bank.id_of(book.opener)
+        if not history:
+            return opener
+        if len(history) == 1 and history[0][0] == opener and book.replies[history[0][1]] >= 0:
+            return int(book.replies[history[0][1]])
+    if not history:
+        if 'opener' not in _worker:
+            _worker['opener'] = bank.id_of(search(bank, ids, matrix, parallel=False))
+        return _worker['opener']
+    return bank.id_of(search(bank, ids, matrix, parallel=False))
+
+
+FAST_POLICIES: Dict[str, Callable] = {
+    'random':  _fast_random,
+    'first':   _fast_first,
+    'entropy': _fast_entropy,
+}
+
+
+def resolve_policy(name: str) -> Callable:
+    """A built-in policy name, or `module:function` for a custom one."""
+    if name in POLICIES:
+        return POLICIES[name]
+    module, _, attr = name.partition(':')
+    return getattr(importlib.import_module(module), attr)
+
+# ————————————————————————————————————————————————————————————————
+# Playing games
+# ————————————————————————————————————————————————————————————————
+
+def play_game(bank, policy, rng, max_guesses=GRID_SIZE, extra_guesses=0):
+    """Play one game to completion; returns the finished Game."""
+    game = Game(bank=bank, max_guesses=max_guesses, record_stats=False, rng=rng)
+    while True:
+        if game.is_over():
+            # spend Extra Guess boosts on a loss, if the run allows them
+            if game.is_won() or game.boosts_used >= extra_guesses:
+                return game
+            game.grant_extra_guess()
+        game.current_guess = policy(game, rng)
+        if not game.submit_guess():
+            raise ValueError(f"policy returned an invalid guess: {game.current_guess!r}")
+
+
+def play_fast(bank, matrix, policy, rng, max_guesses=GRID_SIZE, extra_guesses=0):
+    """
+    play_game() on word IDs for a FAST_POLICIES policy: the target is
+    drawn and survivors are narrowed exactly as Game does (same RNG
+    calls), so a seed gives the same games. Returns
+    (target ID, rows used, won, boosts used).
+    """
+    codes  = matrix.codes
+    solved = all_correct_code(bank.word_length)
+    target = rng.randrange(len(bank))          # = bank.random_word(rng)
+    ids    = _worker['all_ids']
+    history = []
+    limit, boosts = max_guesses, 0
+    while True:
+        if len(history) >= limit:
+            if boosts >= extra_guesses:
+                return target, len(history), False, boosts
+            limit  += 1
+            boosts += 1
+        guess = policy(bank, matrix, ids, history, rng)
+        code  = int(codes[guess, target])
+        history.append((guess, code))
+        if code == solved:
+            return target, len(history), True, boosts
+        if len(history) == 1:
+            ids = (codes[guess] == code).nonzero()[0]      # whole row: no gather
+        else:
+            ids = ids[codes[guess, ids] == code]
+
+
+_worker: Dict[str, object] = {}
+
+
+def _init_worker(words_file, word_length, policy_name):
+    bank = _worker['bank'] = get_word_bank(words_file, word_length)
+    _worker['policy']  = resolve_policy(policy_name)
+    _worker['fast']    = FAST_POLICIES.get(policy_name)
+    _worker['matrix']  = get_pattern_matrix(bank)    # map the shared matrix once
+    _worker['all_ids'] = np.arange(len(bank))
+    get_opening_book(bank)                           # first two entropy guesses, if built
+
+
+def _run_chunk(seed, n_games, max_guesses, extra_guesses):
+    bank, policy = _worker['bank'], _worker['policy']
+    fast, matrix = _worker['fast'], _worker['matrix']
+    rng  = random.Random(seed)
+    cols = {name: np.empty(n_games, dtype=dt) for name, dt in COLUMNS.items()}
+    if fast is not None and matrix is not None:
+        for i in range(n_games):
+            (cols['target'][i], cols['guesses'][i],
+             cols['won'][i], cols['boosts'][i]) = play_fast(
+                bank, matrix, fast, rng, max_guesses, extra_guesses)
+        return cols
+
+    for i in range(n_games):
+        game = play_game(bank, policy, rng, max_guesses, extra_guesses)
+        cols['target'][i]  = bank.id_of(game.target)
+        cols['guesses'][i] = len(game.guesses)
+        cols['won'][i]     = game.is_won()
+        cols['boosts'][i]  = game.boosts_used
+    return cols
+
+# ————————————————————————————————————————————————————————————————
+# Columnar output
+# ————————————————————————————————————————————————————————————————
+
+def read_results(out_dir: str) -> Dict[str, np.ndarray]:
+    """Memory-map every column of a results directory."""
+    with open(os.path.join(out_dir, 'meta.json')) as fp:
+        meta = json.load(fp)
+    if meta['games'] == 0:
+        return {name: np.empty(0, dtype=dt) for name, dt in COLUMNS.items()}
+    return {
+        name: np.memmap(os.path.join(out_dir, f"{name}.bin"), dtype=dt, mode='r')
+        for name, dt in COLUMNS.items()
+    }
+
+
+def simulate(
+    games: int,
+    policy: str = 'random',
+    out_dir: str = 'sim_results',
+    workers: Optional[int] = None,
+    seed: int = 0,
+    max_guesses: int = GRID_SIZE,
+    extra_guesses: int = 0,
+    words_file: str = WORDS_FILE,
+    word_length: int = WORD_LENGTH
+) -> Dict[str, np.ndarray]:
+    """Run `games` self-play games and write them to `out_dir`."""
+    os.makedirs(out_dir, exist_ok=True)
+    files = {
+        name: open(os.path.join(out_dir, f"{name}.bin"), 'wb')
+        for name in COLUMNS
+    }
+    chunks = [
+        (seed + i, min(CHUNK_GAMES, games - start), max_guesses, extra_guesses)
+        for i, start in enumerate(range(0, games, CHUNK_GAMES))
+    ]
+
+    # build/map the dictionary caches before starting workers
+    get_pattern_matrix(get_word_bank(words_file, word_length))
+    init_args = (words_file, word_length, policy)
+    try:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=init_args,
+                                 mp_context=multiprocessing.get_context('spawn')) as pool:
+            # map() keeps chunk order, so output is deterministic per seed
+            for cols in pool.map(_run_chunk, *zip(*chunks)):
+                for name, fp in files.items():
+                    cols[name].tofile(fp)
+    finally:
+        for fp in files.values():
+            fp.close()
+
+    meta = {
+        'games': games, 'policy': policy, 'seed': seed,
+        'max_guesses': max_guesses, 'extra_guesses': extra_guesses,
+        'words_file': words_file, 'word_length': word_length,
+        'columns': {name: np.dtype(dt).str for name, dt in COLUMNS.items()},
+    }
+    with open(os.path.join(out_dir, 'meta.json'), 'w') as fp:
+        json.dump(meta, fp, indent=2)
+    return read_results(out_dir)
+
+
+def summarize(results: Dict[str, np.ndarray], bank, top: int = 10):
+    """Print win rate, guess histogram and the hardest targets."""
+    won     = results['won'].astype(bool)
+    guesses = results['guesses']
+    print(f"games:        {len(won):,}")
+    if not len(won):
+        return
+    print(f"win rate:     {won.mean() * 100:.2f}%")
+    if won.any():
+        print(f"mean guesses: {guesses[won].mean():.3f} (wins only)")
+    hist = np.bincount(guesses[won], minlength=guesses.max() + 1)[1:]
+    print("guesses:      " + "  ".join(f"{i}:{n}" for i, n in enumerate(hist, 1) if n))
+    print(f"boosts used:  {int(results['boosts'].sum()):,}")
+
+    # per-target difficulty: mean rows used (losses count as max + 1)
+    target = results['target'].astype(np.int64)
+    rows   = np.where(won, guesses, guesses.astype(np.int64) + 1)
+    plays  = np.bincount(target, minlength=len(bank))
+    total  = np.bincount(target, weights=rows, minlength=len(bank))
+    seen   = np.flatnonzero(plays)
+    mean   = total[seen] / plays[seen]
+    hardest = seen[np.argsort(mean)[::-1][:top]]
+    print("hardest:      " + ", ".join(
+        f"{bank[i]} ({total[i] / plays[i]:.2f})" for i in hardest
+    ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless Wordle self-play")
+    parser.add_argument('--games',   type=int, default=100_000)
+    parser.add_argument('--policy',  default='random',
+                        help="random | first | entropy | module:function")
+    parser.add_argument('--out',     default='sim_results')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed',    type=int, default=0)
+    parser.add_argument('--max-guesses',   type=int, default=GRID_SIZE)
+    parser.add_argument('--extra-guesses', type=int, default=0,
+                        help="Extra Guess boosts a player may spend per game")
+    args = parser.parse_args()
+
+    start   = time.perf_counter()
+    results = simulate(
+        args.games, args.policy, args.out, args.workers, args.seed,
+        args.max_guesses, args.extra_guesses
+    )
+    elapsed = time.perf_counter() - start
+    summarize(results, get_word_bank())
+    print(f"throughput:   {args.games / elapsed:,.0f} games/s ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+# solver.py
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from patterns import PatternMatrix, get_pattern_matrix
+from scoring  import encode_status, score_codes
+from wordbank import WordBank, get_word_bank
+
+# Above this many (guess, candidate) pairs, split the work over a process pool
+PARALLEL_PAIRS = 8_000_000
+
+# Guess rows handed to one pool task
+_POOL_ROWS = 1024
+
+# Above this many (guess, candidate) pairs, guesses are first ranked on an
+# even spread of SAMPLE_SIZE candidates and only the best SHORTLIST are
+# scored against all of them (keeps a hint under ~50 ms on words.txt)
+SAMPLE_PAIRS = 1_000_000
+SAMPLE_SIZE  = 256
+SHORTLIST    = 64
+
+# Without a pattern matrix (banks over patterns.MAX_MATRIX_WORDS) every
+# pair is scored on the fly, so only survivors are tried as guesses and
+# both they and the candidates are cut to an even spread of this many
+NO_MATRIX_CAP = 2048
+
+# ————————————————————————————————————————————————————————————————
+# Core maths
+# ————————————————————————————————————————————————————————————————
+
+def filter_candidates(
+    bank: WordBank,
+    guesses: Sequence[str],
+    results: Sequence[Sequence[str]],
+    matrix: Optional[PatternMatrix] = None
+) -> np.ndarray:
+    """IDs of every word still consistent with the feedback so far."""
+    ids = np.arange(len(bank))
+    for guess, status in zip(guesses, results):
+        codes = _codes_for(bank, matrix, bank.id_of(guess), ids)
+        ids   = ids[codes == encode_status(status)]
+    return ids
+
+
+def _codes_for(bank, matrix, guess_id, target_ids):
+    if matrix is not None:
+        return matrix.codes[guess_id, target_ids]
+    return score_codes(bank.encoded[guess_id], bank.encoded[target_ids])
+
+
+def _block_codes(bank, matrix, guesses, cand):
+    """Codes of guess IDs `guesses` against candidate IDs `cand`, shape (rows, M)."""
+    if matrix is not None:
+        return matrix.codes[guesses[:, None], cand]
+    enc = bank.encoded
+    return score_codes(enc[guesses][:, None, :], enc[None, cand, :])
+
+
+def _spread(ids: np.ndarray, k: int) -> np.ndarray:
+    """At most `k` of `ids`, evenly spaced (a deterministic, stratified sample)."""
+    if len(ids) <= k:
+        return ids
+    return ids[np.linspace(0, len(ids) - 1, k).astype(np.int64)]
+
+
+def entropies(codes: np.ndarray, n_patterns: int) -> np.ndarray:
+    """
+    Expected information (bits) of each row of `codes` (rows = guesses,
+    columns = equally likely candidates), via one bincount over all rows.
+    """
+    rows, m = codes.shape
+    offsets = codes.astype(np.int64) + (np.arange(rows) * n_patterns)[:, None]
+    counts  = np.bincount(offsets.ravel(), minlength=rows * n_patterns)
+    counts  = counts.reshape(rows, n_patterns)
+
+    # H = log2(m) - sum(c * log2 c) / m
+    xlogx = np.zeros(m + 1)
+    xlogx[1:] = np.arange(1, m + 1) * np.log2(np.arange(1, m + 1))
+    return np.log2(m) - xlogx[counts].sum(axis=1) / m
+
+
+def _entropy_rows(bank, matrix, guesses, cand):
+    """Entropy of each guess ID in `guesses` over candidate IDs `cand`."""
+    n_patterns = 3 ** bank.word_length
+    out = np.empty(len(guesses))
+    # keep each bincount block to a few million pairs
+    step = max(1, 4_000_000 // max(1, len(cand)))
+    for start in range(0, len(guesses), step):
+        out[start:start + step] = entropies(
+            _block_codes(bank, matrix, guesses[start:start + step], cand), n_patterns
+        )
+    return out
+
+# ————————————————————————————————————————————————————————————————
+# Process pool for large dictionaries
+# ————————————————————————————————————————————————————————————————
+
+_worker_bank   = None
+_worker_matrix = None
+
+
+def _pool_init(words_file, word_length):
+    """Each worker maps the same dictionary and on-disk matrix."""
+    global _worker_bank, _worker_matrix
+    _worker_bank   = get_word_bank(words_file, word_length)
+    _worker_matrix = get_pattern_matrix(_worker_bank)
+
+
+def _pool_task(guesses, cand):
+    return _entropy_rows(_worker_bank, _worker_matrix, guesses, cand)
+
+
+_POOLS: Dict[str, ProcessPoolExecutor] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _pool_for(bank: WordBank) -> Optional[ProcessPoolExecutor]:
+    """Shared pool for `bank`, or None when workers couldn't load it."""
+    if bank.source is None or (os.cpu_count() or 1) < 2:
+        return None
+    with _POOLS_LOCK:
+        pool = _POOLS.get(bank.digest)
+        if pool is None:
+            # spawn, not fork: the game process runs pygame and other threads
+            pool = ProcessPoolExecutor(
+                initializer=_pool_init,
+                initargs=(bank.source, bank.word_length),
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            _POOLS[bank.digest] = pool
+    return pool
+
+# ————————————————————————————————————————————————————————————————
+# Public API
+# ————————————————————————————————————————————————————————————————
+
+# best first guess per dictionary digest
+_OPENERS: Dict[str, str] = {}
+
+
+def search(
+    bank: WordBank,
+    candidates: np.ndarray,
+    matrix: Optional[PatternMatrix] = None,
+    parallel: bool = True,
+    exact: bool = False
+) -> Optional[str]:
+    """
+    The word that maximizes expected information over `candidates`,
+    computed from scratch (no opener memo or opening book). Ties go to
+    words that could still be the answer; None if `candidates` is empty.
+    `parallel=False` keeps the work in this process (e.g. in a worker).
+    Big searches rank every guess on a sample of the candidates and
+    score only a shortlist in full; `exact=True` (the opening book)
+    scores every guess. Without a pattern matrix on a large bank the
+    search is bounded: only an even spread of NO_MATRIX_CAP survivors
+    is tried and scored.
+    """
+    if len(candidates) <= 2:
+        return bank[int(candidates[0])] if len(candidates) else None
+
+    guesses = np.arange(len(bank))
+    if matrix is None and len(bank) > NO_MATRIX_CAP:
+        guesses = candidates = _spread(candidates, NO_MATRIX_CAP)
+
+    if not exact and len(guesses) * len(candidates) > SAMPLE_PAIRS:
+        rough   = _entropy_rows(bank, matrix, guesses, _spread(candidates, SAMPLE_SIZE))
+        guesses = np.sort(guesses[np.argsort(-rough, kind='stable')[:SHORTLIST]])
+
+    pairs = len(guesses) * len(candidates)
+    pool  = _pool_for(bank) if parallel and pairs > PARALLEL_PAIRS else None
+    if pool is None:
+        scores = _entropy_rows(bank, matrix, guesses, candidates)
+    else:
+        parts = [
+            pool.submit(_pool_task, guesses[i:i + _POOL_ROWS], candidates)
+            for i in range(0, len(guesses), _POOL_ROWS)
+        ]
+        scores = np.concatenate([p.result() for p in parts])
+
+    # a tiny bonus breaks ties in favour of possible answers
+    scores[np.isin(guesses, candidates, assume_unique=True)] += 1e-6
+    return bank[int(guesses[np.argmax(scores)])]
+
+
+def best_guess(
+    bank: WordBank,
+    guesses: Sequence[str],
+    results: Sequence[Sequence[str]],
+    candidates: Optional[np.ndarray] = None
+) -> Optional[str]:
+    """
+    The word that maximizes expected information over the remaining
+    candidates. Ties go to words that could still be the answer.
+    Returns None if nothing is consistent with the feedback.
+    """
+    # the first two guesses depend only on the dictionary: look them up
+    if len(guesses) <= 1:
+        from opening_book import get_opening_book
+        book  = get_opening_book(bank)
+        guess = book.lookup(guesses, results) if book is not None else None
+        if guess is not None:
+            return guess
+    if not guesses and bank.digest in _OPENERS:
+        return _OPENERS[bank.digest]
+
+    matrix = get_pattern_matrix(bank)
+    if candidates is None:
+        candidates = filter_candidates(bank, guesses, results, matrix)
+    guess = search(bank, candidates, matrix)
+    if not guesses and guess is not None:
+        _OPENERS[bank.digest] = guess
+    return guess
+
+
+def best_guess_for(game) -> Optional[str]:
+    """best_guess() for a Game, reusing its tracked candidate set."""
+    return best_guess(game.bank, game.guesses, game.results, game.candidates.ids)
+
+
+# Single background thread so the UI loop never waits on the solver
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='solver')
+
+
+def request_best_guess(game) -> Future:
+    """Run best_guess_for(game) in the background; returns its Future."""
+    guesses = list(game.guesses)
+    results = [list(r) for r in game.results]
+    return _EXECUTOR.submit(
+        best_guess, game.bank, guesses, results, game.candidates.ids
+    )
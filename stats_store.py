@@ -0,0 +1,196 @@
+# stats_store.py
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+# Game history + running totals (SQLite, WAL journal)
+STATS_DB = 'stats.db'
+
+# Old whole-file format (wins/losses only), imported once on first open
+LEGACY_STATS_FILE = 'stats.json'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id          INTEGER PRIMARY KEY,
+    finished_at REAL    NOT NULL,
+    target      TEXT    NOT NULL,
+    guesses     INTEGER NOT NULL,
+    won         INTEGER NOT NULL,
+    duration    REAL    NOT NULL,
+    boosts      INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS totals (
+    id         INTEGER PRIMARY KEY CHECK (id = 1),
+    wins       INTEGER NOT NULL,
+    losses     INTEGER NOT NULL,
+    streak     INTEGER NOT NULL,
+    max_streak INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS distribution (
+    guesses INTEGER PRIMARY KEY,
+    wins    INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+INSERT OR IGNORE INTO totals VALUES (1, 0, 0, 0, 0);
+"""
+
+
+class StatsSummary:
+    """Aggregate stats as shown on the stats screen."""
+    def __init__(self, wins=0, losses=0, streak=0, max_streak=0, distribution=None):
+        self.wins         = wins
+        self.losses       = losses
+        self.streak       = streak          # current win streak
+        self.max_streak   = max_streak
+        self.distribution: Dict[int, int] = distribution or {}   # guesses -> wins
+
+    @property
+    def played(self) -> int:
+        return self.wins + self.losses
+
+    @property
+    def win_pct(self) -> float:
+        return (self.wins / self.played * 100) if self.played else 0.0
+
+
+class StatsStore:
+    """
+    Append-only game log with incrementally maintained aggregates.
+
+    Every finished game is one INSERT plus O(1) updates to the totals
+    and distribution rows, committed in a single transaction, so nothing
+    is ever re-read or rewritten in full. summary() is served from
+    memory and only re-queried (a handful of rows) when another
+    connection, e.g. a second game window, has committed since.
+    """
+    def __init__(self, path: str = STATS_DB, legacy_path: Optional[str] = LEGACY_STATS_FILE):
+        self.path  = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        if legacy_path:
+            self._import_legacy(legacy_path)
+
+        self._version = None
+        self._summary = StatsSummary()
+        self._refresh()
+
+    # ─── writes ──────────────────────────────────────────────────────
+
+    def record_game(self, target: str, guesses: int, won: bool,
+                    duration: float = 0.0, boosts: int = 0, distribution: bool = True):
+        """
+        Append one finished game and fold it into the aggregates
+        (`distribution=False` leaves a win out of the guess distribution).
+        """
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute(
+                "INSERT INTO games (finished_at, target, guesses, won, duration, boosts)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (time.time(), target, guesses, int(won), duration, boosts),
+            )
+            if won:
+                self._conn.execute(
+                    "UPDATE totals SET wins = wins + 1, streak = streak + 1,"
+                    " max_streak = MAX(max_streak, streak + 1)"
+                )
+                if distribution:
+                    self._conn.execute(
+                        "INSERT INTO distribution VALUES (?, 1)"
+                        " ON CONFLICT(guesses) DO UPDATE SET wins = wins + 1",
+                        (guesses,),
+                    )
+            else:
+                self._conn.execute("UPDATE totals SET losses = losses + 1, streak = 0")
+
+            # our own commits don't bump data_version: update memory directly
+            s = self._summary
+            if won:
+                s.wins  += 1
+                s.streak += 1
+                s.max_streak = max(s.max_streak, s.streak)
+                if distribution:
+                    s.distribution[guesses] = s.distribution.get(guesses, 0) + 1
+            else:
+                s.losses += 1
+                s.streak  = 0
+
+    def _import_legacy(self, legacy_path: str):
+        """Fold an old stats.json's win/loss counts into the totals, once."""
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            done = self._conn.execute(
+                "SELECT 1 FROM meta WHERE key = 'legacy_imported'"
+            ).fetchone()
+            if done or not os.path.exists(legacy_path):
+                return
+            try:
+                with open(legacy_path, 'r') as fp:
+                    data = json.load(fp)
+                wins, losses = int(data.get('wins', 0)), int(data.get('losses', 0))
+            except (json.JSONDecodeError, IOError, AttributeError, TypeError, ValueError):
+                wins, losses = 0, 0
+            self._conn.execute(
+                "UPDATE totals SET wins = wins + ?, losses = losses + ?", (wins, losses)
+            )
+            self._conn.execute(
+                "INSERT INTO meta VALUES ('legacy_imported', ?)", (legacy_path,)
+            )
+
+    # ─── reads ───────────────────────────────────────────────────────
+
+    def _refresh(self):
+        with self._lock:
+            version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if version == self._version:
+                return
+            wins, losses, streak, max_streak = self._conn.execute(
+                "SELECT wins, losses, streak, max_streak FROM totals"
+            ).fetchone()
+            dist = dict(self._conn.execute("SELECT guesses, wins FROM distribution"))
+            self._summary = StatsSummary(wins, losses, streak, max_streak, dist)
+            self._version = version
+
+    def summary(self) -> StatsSummary:
+        """Current aggregates; O(1) regardless of how many games were played."""
+        self._refresh()
+        return self._summary
+
+    def recent_games(self, limit: int = 10) -> List[tuple]:
+        """Latest (finished_at, target, guesses, won, duration, boosts) rows."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT finished_at, target, guesses, won, duration, boosts"
+                " FROM games ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# ————————————————————————————————————————————————————————————————
+# Shared instance
+# ————————————————————————————————————————————————————————————————
+
+_STORES: Dict[str, StatsStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_stats_store(path: str = STATS_DB) -> StatsStore:
+    """Return the process-wide store for `path`, opening it on first use."""
+    with _STORES_LOCK:
+        store = _STORES.get(path)
+        if store is None:
+            store = _STORES[path] = StatsStore(path)
+        return store
@@ -1,76 +1,90 @@
 # stats_ui.py
 
 import pygame
-import json
-import os
-from config import WIDTH, HEIGHT, COLORS, FONT_NAME
+from config import WIDTH, HEIGHT, GRID_SIZE, COLORS
+from fonts import get_font
+from text_cache import render_text
+from layers import static_layer
+from stats_store import get_stats_store
+
+# Width of the longest guess-distribution bar
+DIST_BAR_W = 500
 
 class StatsUI:
     def __init__(self, screen):
         self.screen     = screen
-        self.title_font = pygame.font.SysFont(FONT_NAME, 48, bold=True)
-        self.font       = pygame.font.SysFont(FONT_NAME, 32)
+        self.title_font = get_font(48, bold=True)
+        self.font       = get_font(32)
 
         # Back button (top-left)
         self.back_rect  = pygame.Rect(20, 20, 100, 40)
 
-        # Where we persist stats
-        self.stats_file = 'stats.json'
-        self.wins, self.losses = self._load_stats()
-
-    def _load_stats(self):
-        """
-        Safely load wins/losses from stats.json.
-        Returns (0,0) on missing, empty, or invalid file.
-        """
-        if not os.path.exists(self.stats_file):
-            return 0, 0
-
-        try:
-            with open(self.stats_file, 'r') as f:
-                data = json.load(f)
-            wins   = data.get('wins', 0)
-            losses = data.get('losses', 0)
-            return wins, losses
-
-        except (json.JSONDecodeError, IOError):
-            # empty or corrupted file → reset stats
-            return 0, 0
-
-    def _win_pct(self):
-        total = self.wins + self.losses
-        return (self.wins / total * 100) if total > 0 else 0.0
+        # live aggregates (the store is shared with Game)
+        self.store = get_stats_store()
 
     def draw(self):
-        self.screen.fill(COLORS['bg'])
+        static = static_layer('stats', self.screen, self._build_static, tuple(self.back_rect))
+        self.screen.blit(static, (0, 0))
+        stats = self.store.summary()
+
+        # Wins / Losses / Win % / streaks
+        title_h = self.title_font.get_height()
+        line_h  = self.font.get_height() + 10
+        ty      = HEIGHT // 6
+        lines = [
+            f"Wins: {stats.wins}",
+            f"Losses: {stats.losses}",
+            f"Win %: {stats.win_pct:.1f}%",
+            f"Current Streak: {stats.streak}",
+            f"Max Streak: {stats.max_streak}",
+        ]
+        y = ty + title_h + 40
+        for text in lines:
+            surf = render_text(self.font, text, COLORS['text'])
+            self.screen.blit(surf, ((WIDTH - surf.get_width()) // 2, y))
+            y += line_h
+
+        # Guess distribution: one bar per guess count
+        y += 30
+        head = render_text(self.font, "Guess Distribution", COLORS['text'])
+        self.screen.blit(head, ((WIDTH - head.get_width()) // 2, y))
+        y += line_h
+
+        dist  = stats.distribution
+        rows  = max([GRID_SIZE] + list(dist))
+        peak  = max(dist.values(), default=0) or 1
+        left  = (WIDTH - DIST_BAR_W) // 2
+        for n in range(1, rows + 1):
+            count = dist.get(n, 0)
+            label = render_text(self.font, str(n), COLORS['text'])
+            self.screen.blit(label, (left - label.get_width() - 12, y))
+
+            bar_w = max(40, DIST_BAR_W * count // peak)
+            bar   = pygame.Rect(left, y, bar_w, self.font.get_height())
+            pygame.draw.rect(self.screen, COLORS['correct'] if count else COLORS['absent'], bar)
+            num = render_text(self.font, str(count), COLORS['text'])
+            self.screen.blit(num, (bar.right - num.get_width() - 8, y))
+            y += line_h
+
+    def _build_static(self, surf):
+        """Background, title and Back button."""
+        surf.fill(COLORS['bg'])
 
         # Title
-        title_surf = self.title_font.render("Statistics", True, COLORS['text'])
+        title_surf = render_text(self.title_font, "Statistics", COLORS['text'])
         tx = (WIDTH - title_surf.get_width()) // 2
         ty = HEIGHT // 6
-        self.screen.blit(title_surf, (tx, ty))
-
-        # Wins / Losses / Win %
-        lines = [
-            f"Wins: {self.wins}",
-            f"Losses: {self.losses}",
-            f"Win %: {self._win_pct():.1f}%"
-        ]
-        for i, text in enumerate(lines):
-            surf = self.font.render(text, True, COLORS['text'])
-            x    = (WIDTH - surf.get_width()) // 2
-            y    = ty + title_surf.get_height() + 40 + i * (self.font.get_height() + 10)
-            self.screen.blit(surf, (x, y))
+        surf.blit(title_surf, (tx, ty))
 
         # Back button
-        pygame.draw.rect(self.screen, COLORS['text'], self.back_rect, border_radius=5)
+        pygame.draw.rect(surf, COLORS['text'], self.back_rect, border_radius=5)
         inner = self.back_rect.inflate(-4, -4)
-        pygame.draw.rect(self.screen, COLORS['bg'], inner, border_radius=5)
+        pygame.draw.rect(surf, COLORS['bg'], inner, border_radius=5)
 
-        back_surf = self.font.render("Back", True, COLORS['text'])
+        back_surf = render_text(self.font, "Back", COLORS['text'])
         bx = self.back_rect.centerx - back_surf.get_width() // 2
         by = self.back_rect.centery - back_surf.get_height() // 2
-        self.screen.blit(back_surf, (bx, by))
+        surf.blit(back_surf, (bx, by))
 
     def handle_event(self, event):
         if event.type == pygame.QUIT:
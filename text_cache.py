@@ -0,0 +1,99 @@
+# text_cache.py
+
+from collections import OrderedDict
+from typing import Dict, Iterable, Tuple
+
+import pygame
+
+# Rendered strings kept alive across all screens
+MAX_ENTRIES = 512
+
+
+class TextCache:
+    """
+    Bounded LRU cache of rendered text surfaces, keyed by
+    (font, text, color, antialias). Keeps hit/miss counters so we can
+    check that steady-state frames don't call font.render at all.
+    """
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits   = 0
+        self.misses = 0
+        self._surfs: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+
+    def render(self, font, text, color, antialias=True) -> pygame.Surface:
+        key  = (font, text, tuple(color), antialias)
+        surf = self._surfs.get(key)
+        if surf is not None:
+            self.hits += 1
+            self._surfs.move_to_end(key)
+            return surf
+
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self._surfs[key] = surf
+        if len(self._surfs) > self.max_entries:
+            self._surfs.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self._surfs.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._surfs)}
+
+
+class GlyphAtlas:
+    """
+    A fixed set of labels (tile letters, keyboard keys) rendered once
+    side by side into a single surface; glyph() hands out subsurfaces.
+    """
+    def __init__(self, font, labels: Iterable[str], color, antialias=True):
+        self._style = (font, color, antialias)     # for labels outside the atlas
+        surfs = [(label, font.render(label, antialias, color)) for label in labels]
+        width  = sum(s.get_width() for _, s in surfs) or 1
+        height = max((s.get_height() for _, s in surfs), default=1)
+
+        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self._glyphs: Dict[str, pygame.Surface] = {}
+        x = 0
+        for label, s in surfs:
+            self.surface.blit(s, (x, 0))
+            self._glyphs[label] = self.surface.subsurface(
+                pygame.Rect(x, 0, s.get_width(), s.get_height())
+            )
+            x += s.get_width()
+
+    def glyph(self, label: str) -> pygame.Surface:
+        surf = self._glyphs.get(label)
+        if surf is None:
+            font, color, antialias = self._style
+            surf = render_text(font, label, color, antialias)
+        return surf
+
+    def __contains__(self, label) -> bool:
+        return label in self._glyphs
+
+
+# ————————————————————————————————————————————————————————————————
+# Process-wide instances
+# ————————————————————————————————————————————————————————————————
+
+TEXT_CACHE = TextCache()
+
+_ATLASES: Dict[Tuple, GlyphAtlas] = {}
+
+
+def render_text(font, text, color, antialias=True) -> pygame.Surface:
+    """Cached font.render(text, antialias, color)."""
+    return TEXT_CACHE.render(font, text, color, antialias)
+
+
+def get_atlas(font, labels: Iterable[str], color, antialias=True) -> GlyphAtlas:
+    """Shared GlyphAtlas for this font/label set/color."""
+    labels = tuple(labels)
+    key    = (font, labels, tuple(color), antialias)
+    atlas  = _ATLASES.get(key)
+    if atlas is None:
+        atlas = _ATLASES[key] = GlyphAtlas(font, labels, color, antialias)
+    return atlas
@@ -1,11 +1,19 @@
 # ===== ui.py =====
 
+import string
+from functools import lru_cache
+from typing import NamedTuple, Tuple
+
 import pygame
 from config import (
     WIDTH, HEIGHT, GRID_SIZE, WORD_LENGTH,
-    COLORS, FONT_NAME, FONT_SIZE,
+    COLORS, FONT_SIZE,
     KEYBOARD_ROWS, KEY_FONT_SIZE
 )
+from fonts import get_font
+from text_cache import get_atlas, render_text
+from layers import static_layer
+from wordbank import is_letter
 
 # Layout constants
 TOP_MARGIN    = 80
@@ -13,31 +21,62 @@ BOTTOM_MARGIN = 180
 PADDING       = 20
 GRID_SCALE    = 0.7
 
-# Grid sizing
-avail_w   = WIDTH  - 2 * PADDING
-avail_h   = HEIGHT - TOP_MARGIN - BOTTOM_MARGIN
-_raw_cell = min(avail_w // WORD_LENGTH, avail_h // GRID_SIZE)
-CELL_SIZE = int(_raw_cell * GRID_SCALE)
-GRID_WIDTH  = CELL_SIZE * WORD_LENGTH
-GRID_HEIGHT = CELL_SIZE * GRID_SIZE
-START_X     = (WIDTH - GRID_WIDTH)  // 2
-START_Y     = TOP_MARGIN
-
-# Keyboard sizing
+# Keyboard sizing (the same for every grid)
 KEY_SPACING = 6
 max_keys    = max(len(r) for r in KEYBOARD_ROWS) + 2
 KEY_W       = (WIDTH - 2 * PADDING - (max_keys - 1) * KEY_SPACING) // max_keys
 KEY_H       = int(KEY_W * 0.6)
-KEYBOARD_Y  = START_Y + GRID_HEIGHT + 40
 
 # End-of-game buttons
 KB_ROWS      = len(KEYBOARD_ROWS)
 KB_HEIGHT    = KB_ROWS * KEY_H + (KB_ROWS - 1) * KEY_SPACING
-BUTTON_Y     = KEYBOARD_Y + KB_HEIGHT + 20
 BUTTON_W     = 140
 BUTTON_H     = 40
 BUTTON_SPACE = 20
 
+# Blank tile / untouched key fill, and the Backspace key fill
+EMPTY_TILE = (58, 58, 60)
+BACK_KEY   = (160, 160, 160)
+
+# How often to check for a Best Guess answer while one is pending
+HINT_POLL_MS = 50
+
+
+class Layout(NamedTuple):
+    """Screen geometry for one (word length, rows) grid."""
+    word_length: int
+    rows:        int
+    cell:        int
+    start_x:     int
+    start_y:     int
+    keyboard_y:  int
+    button_y:    int
+    key_rects:   Tuple[Tuple[pygame.Rect, str], ...]
+
+
+@lru_cache(maxsize=None)
+def layout_for(word_length: int = WORD_LENGTH, rows: int = GRID_SIZE) -> Layout:
+    """Grid, keyboard and button positions, computed once per grid shape."""
+    avail_w = WIDTH  - 2 * PADDING
+    avail_h = HEIGHT - TOP_MARGIN - BOTTOM_MARGIN
+    cell    = int(min(avail_w // word_length, avail_h // rows) * GRID_SCALE)
+    start_x = (WIDTH - cell * word_length) // 2
+    start_y = TOP_MARGIN
+
+    keyboard_y = start_y + cell * rows + 40
+    key_rects  = []
+    for ri, row_keys in enumerate(KEYBOARD_ROWS):
+        keys = (['ENTER'] + list(row_keys) + ['BACK']) if ri == 2 else list(row_keys)
+        total_w = len(keys)*KEY_W + (len(keys)-1)*KEY_SPACING
+        sx = (WIDTH - total_w)//2
+        y  = keyboard_y + ri*(KEY_H + KEY_SPACING)
+        for key in keys:
+            key_rects.append((pygame.Rect(sx, y, KEY_W, KEY_H), key))
+            sx += KEY_W + KEY_SPACING
+
+    return Layout(word_length, rows, cell, start_x, start_y, keyboard_y,
+                  keyboard_y + KB_HEIGHT + 20, tuple(key_rects))
+
 
 class GameUI:
     def __init__(self, screen, game):
@@ -45,27 +84,52 @@ class GameUI:
         self.game       = game
 
         # fonts
-        self.font        = pygame.font.SysFont(FONT_NAME, FONT_SIZE)
-        self.small_font  = pygame.font.SysFont(FONT_NAME, KEY_FONT_SIZE, bold=True)
-        self.header_font = pygame.font.SysFont(FONT_NAME, FONT_SIZE + 8, bold=True)
+        self.font        = get_font(FONT_SIZE)
+        self.small_font  = get_font(KEY_FONT_SIZE, bold=True)
+        self.header_font = get_font(FONT_SIZE + 8, bold=True)
 
         # transient message
         self.message   = ""
         self.msg_timer = 0
 
-        # keyboard rectangles
-        self.key_rects = []
+        # grid + keyboard geometry for this game's shape (cached per shape)
+        self.layout    = layout_for(game.word_length, game.max_guesses)
+        self.key_rects = list(self.layout.key_rects)
+
+        # pre-rendered glyphs for tile letters and keyboard labels
+        self.tile_glyphs = get_atlas(self.font, string.ascii_uppercase, COLORS['text'])
+        self.key_glyphs  = get_atlas(
+            self.small_font,
+            [k for row in KEYBOARD_ROWS for k in row] + ['ENTER', '←'],
+            COLORS['text']
+        )
+
+        # header + the text line under it
+        self.header_surf = render_text(self.header_font, "ZAY'S WORDLE", COLORS['text'])
+        self.header_pos  = ((WIDTH - self.header_surf.get_width()) // 2, PADDING // 2)
+        self.msg_y       = self.header_pos[1] + self.header_surf.get_height() + 10
+        self.msg_rect    = pygame.Rect(0, self.msg_y, WIDTH, self.small_font.get_height())
+        self.left_rect   = pygame.Rect(
+            self.header_pos[0] + self.header_surf.get_width(), self.header_pos[1],
+            WIDTH - self.header_pos[0] - self.header_surf.get_width(),
+            self.small_font.get_height()
+        )
+
+        # retained-mode state: what each element was last drawn with
+        self._drawn  = {}
+        self._dirty  = []
+        self._static = None
 
         # end-of-game buttons
         cx = WIDTH // 2
         self.play_again_rect = pygame.Rect(
             cx - BUTTON_W - BUTTON_SPACE//2,
-            BUTTON_Y,
+            self.layout.button_y,
             BUTTON_W, BUTTON_H
         )
         self.menu_rect = pygame.Rect(
             cx + BUTTON_SPACE//2,
-            BUTTON_Y,
+            self.layout.button_y,
             BUTTON_W, BUTTON_H
         )
 
@@ -87,7 +151,7 @@ class GameUI:
                 return self._try_submit()
             else:
                 ch = event.unicode
-                if ch.isalpha():
+                if is_letter(ch):
                     self.game.add_letter(ch)
 
         # On-screen keyboard clicks
@@ -107,33 +171,87 @@ class GameUI:
     def _try_submit(self):
         success = self.game.submit_guess()
         if not success:
-            self.message   = "Not in word list!"
+            self.message   = self.game.last_error or "Not in word list!"
             self.msg_timer = pygame.time.get_ticks() + 2000
         return None
 
+    def next_wakeup(self):
+        """
+        Earliest get_ticks() at which draw() would show something new
+        without any input (None = nothing scheduled).
+        """
+        now = pygame.time.get_ticks()
+        if self.game.hint_pending():
+            return now + HINT_POLL_MS
+        if self.message:
+            return self.msg_timer
+        return None
+
+    def is_animating(self):
+        """GameUI has no animations yet; hook for the frame scheduler."""
+        return False
+
+    def invalidate(self):
+        """Force a full repaint on the next draw()."""
+        self._drawn.clear()
+
+    def _update(self, key, state, rect, paint):
+        """Repaint `rect` via paint() only if `state` changed since last frame."""
+        if self._drawn.get(key, self) == state:
+            return
+        self.screen.blit(self._static, rect, rect)   # restore static chrome
+        paint()
+        self._drawn[key] = state
+        self._dirty.append(rect)
+
     def draw(self):
+        """
+        Repaint whatever changed since the last call and return the list of
+        dirty rects, for pygame.display.update(). The first call (or the
+        first after invalidate()) repaints and returns the whole screen.
+        """
         now = pygame.time.get_ticks()
-        self.screen.fill(COLORS['bg'])
-
-        # 1) Header
-        header_surf = self.header_font.render("ZAY'S WORDLE", True, COLORS['text'])
-        header_x    = (WIDTH - header_surf.get_width()) // 2
-        header_y    = PADDING // 2
-        self.screen.blit(header_surf, (header_x, header_y))
-
-        # 2) Transient message (below header)
-        msg_y = header_y + header_surf.get_height() + 10
-        if self.message and now < self.msg_timer:
-            msg_surf = self.small_font.render(self.message, True, COLORS['text'])
-            self.screen.blit(
-                msg_surf,
-                ((WIDTH - msg_surf.get_width()) // 2, msg_y)
-            )
-        elif now >= self.msg_timer:
+        self._dirty = []
+
+        # Best Guess boost answers arrive from a background solver
+        hint = self.game.poll_hint()
+        if hint:
+            self.message   = f"Try: {hint}"
+            self.msg_timer = now + 4000
+        notice = self.game.pop_notice()
+        if notice:
+            self.message   = notice
+            self.msg_timer = now + 4000
+
+        # 1) Static layer: background, header, empty grid, blank keyboard
+        #    (one cached layer per grid shape, so switching back is free)
+        lay    = self.layout
+        static = static_layer(f'game:{lay.word_length}x{lay.rows}', self.screen,
+                              self._build_static, lay[:3])
+        if static is not self._static:
+            self._static = static
+            self._drawn.clear()
+        if not self._drawn:
+            self.screen.blit(static, (0, 0))
+            self._drawn['screen'] = True
+            self._dirty.append(self.screen.get_rect())
+
+        # live count of words still consistent with the feedback
+        left = len(self.game.candidates)
+        self._update('left', left, self.left_rect, lambda: self._draw_left(left))
+
+        # 2) Transient message / 4) end-of-game text (below header)
+        if self.message and now >= self.msg_timer:
             self.message = ""
+        if self.game.is_over():
+            line = "You Win!" if self.game.is_won() else f"Game Over the word was: {self.game.target.upper()}"
+        else:
+            # hard mode complains while you type, not only on Enter
+            line = self.message or self.game.typing_error() or ""
+        self._update('msg', line, self.msg_rect, lambda: self._draw_centered(line, self.msg_y))
 
         # 3) Grid of guesses
-        for row in range(GRID_SIZE):
+        for row in range(lay.rows):
             if row < len(self.game.guesses):
                 guess, status = self.game.guesses[row], self.game.results[row]
             elif row == len(self.game.guesses):
@@ -141,79 +259,102 @@ class GameUI:
             else:
                 guess, status = "", []
 
-            for col in range(WORD_LENGTH):
-                x = START_X + col * CELL_SIZE
-                y = START_Y + row * CELL_SIZE
-                rect = pygame.Rect(x, y, CELL_SIZE - 5, CELL_SIZE - 5)
-
+            for col in range(lay.word_length):
                 if status:
                     bg = COLORS[status[col]]
                 else:
-                    bg = COLORS['absent'] if row < len(self.game.guesses) else (58, 58, 60)
-
-                pygame.draw.rect(self.screen, bg, rect, border_radius=5)
-                pygame.draw.rect(self.screen, COLORS['text'], rect, 2, border_radius=5)
-
+                    bg = COLORS['absent'] if row < len(self.game.guesses) else EMPTY_TILE
                 letter = guess[col] if col < len(guess) else ""
-                if letter:
-                    sf = self.font.render(letter.upper(), True, COLORS['text'])
-                    tw, th = sf.get_size()
-                    self.screen.blit(
-                        sf,
-                        (x + (CELL_SIZE - tw)//2, y + (CELL_SIZE - th)//2)
-                    )
-
-        # 4) End-of-game overlay text
-        if self.game.is_over():
-            res = "You Win!" if self.game.is_won() else f"Game Over the word was: {self.game.target.upper()}"
-            rs = self.small_font.render(res, True, COLORS['text'])
-            self.screen.blit(
-                rs,
-                ((WIDTH - rs.get_width())//2, msg_y)
-            )
 
-        # 5) On-screen keyboard
-        self.key_rects.clear()
-        for ri, row_keys in enumerate(KEYBOARD_ROWS):
-            keys = (['ENTER'] + list(row_keys) + ['BACK']) if ri == 2 else list(row_keys)
-            total_w = len(keys)*KEY_W + (len(keys)-1)*KEY_SPACING
-            sx = (WIDTH - total_w)//2
-            y  = KEYBOARD_Y + ri*(KEY_H + KEY_SPACING)
-
-            for key in keys:
-                rect = pygame.Rect(sx, y, KEY_W, KEY_H)
-                clr  = (160,160,160) if key == 'BACK' else COLORS.get(self.game.key_states.get(key.lower(), ''), (58,58,60))
-
-                pygame.draw.rect(self.screen, clr, rect, border_radius=5)
-                pygame.draw.rect(self.screen, COLORS['text'], rect, 2, border_radius=5)
-
-                lbl = '←' if key == 'BACK' else key
-                sf  = self.small_font.render(lbl, True, COLORS['text'])
-                tw, th = sf.get_size()
-                self.screen.blit(
-                    sf,
-                    (sx + (KEY_W - tw)//2, y + (KEY_H - th)//2)
+                x = lay.start_x + col * lay.cell
+                y = lay.start_y + row * lay.cell
+                cell = pygame.Rect(x, y, lay.cell, lay.cell)
+                self._update(
+                    ('tile', row, col), (letter, bg), cell,
+                    lambda x=x, y=y, bg=bg, letter=letter: self._draw_tile(self.screen, x, y, bg, letter)
                 )
 
-                self.key_rects.append((rect, key))
-                sx += KEY_W + KEY_SPACING
+        # 5) On-screen keyboard
+        for rect, key in self.key_rects:
+            clr = self._key_color(key)
+            self._update(
+                ('key', key), clr, rect,
+                lambda rect=rect, key=key, clr=clr: self._draw_key(self.screen, rect, key, clr)
+            )
 
         # 6) Play Again & Menu buttons
-        if self.game.is_over():
-            # Play Again
-            pygame.draw.rect(self.screen, COLORS['text'], self.play_again_rect, border_radius=5)
-            inner_pa = self.play_again_rect.inflate(-4, -4)
-            pygame.draw.rect(self.screen, COLORS['bg'], inner_pa, border_radius=5)
-            pa_s = self.small_font.render("Play Again", True, COLORS['text'])
-            px   = self.play_again_rect.x + (BUTTON_W - pa_s.get_width())//2
-            py   = self.play_again_rect.y + (BUTTON_H - pa_s.get_height())//2
-            self.screen.blit(pa_s, (px, py))
-
-            # Menu
-            pygame.draw.rect(self.screen, COLORS['text'], self.menu_rect, border_radius=5)
-            inner_m = self.menu_rect.inflate(-4, -4)
-            pygame.draw.rect(self.screen, COLORS['bg'], inner_m, border_radius=5)
-            m_s = self.small_font.render("Menu", True, COLORS['text'])
-            mx  = self.menu_rect.x + (BUTTON_W - m_s.get_width())//2
-            my  = self.menu_rect.y + (BUTTON_H - m_s.get_height())//2
-            self.screen.blit(m_s, (mx, my))
+        over = self.game.is_over()
+        if over:
+            self._update('btn_play', over, self.play_again_rect,
+                         lambda: self._draw_button(self.play_again_rect, "Play Again"))
+            self._update('btn_menu', over, self.menu_rect,
+                         lambda: self._draw_button(self.menu_rect, "Menu"))
+
+        return self._dirty
+
+    def _key_color(self, key):
+        if key == 'BACK':
+            return BACK_KEY
+        return COLORS.get(self.game.key_states.get(key.lower(), ''), EMPTY_TILE)
+
+    def _build_static(self, surf):
+        """Everything that looks the same at the start of every game."""
+        surf.fill(COLORS['bg'])
+        surf.blit(self.header_surf, self.header_pos)
+        lay = self.layout
+        for row in range(lay.rows):
+            for col in range(lay.word_length):
+                self._draw_tile(surf, lay.start_x + col * lay.cell, lay.start_y + row * lay.cell,
+                                EMPTY_TILE, "", force=True)
+        for rect, key in self.key_rects:
+            self._draw_key(surf, rect, key, BACK_KEY if key == 'BACK' else EMPTY_TILE, force=True)
+
+    # ─── element painters (no-ops where the static layer already matches) ─
+
+    def _draw_left(self, left):
+        left_surf = render_text(
+            self.small_font, f"{left} word{'s' if left != 1 else ''} left", COLORS['text']
+        )
+        self.screen.blit(left_surf, (WIDTH - left_surf.get_width() - PADDING, self.header_pos[1]))
+
+    def _draw_centered(self, text, y):
+        if text:
+            sf = render_text(self.small_font, text, COLORS['text'])
+            self.screen.blit(sf, ((WIDTH - sf.get_width()) // 2, y))
+
+    def _draw_tile(self, surf, x, y, bg, letter, force=False):
+        cell = self.layout.cell
+        rect = pygame.Rect(x, y, cell - 5, cell - 5)
+        if force or bg != EMPTY_TILE:
+            pygame.draw.rect(surf, bg, rect, border_radius=5)
+            pygame.draw.rect(surf, COLORS['text'], rect, 2, border_radius=5)
+        if letter:
+            sf = self.tile_glyphs.glyph(letter.upper())
+            tw, th = sf.get_size()
+            surf.blit(
+                sf,
+                (x + (cell - tw)//2, y + (cell - th)//2)
+            )
+
+    def _draw_key(self, surf, rect, key, clr, force=False):
+        if not force and clr == (BACK_KEY if key == 'BACK' else EMPTY_TILE):
+            return
+        pygame.draw.rect(surf, clr, rect, border_radius=5)
+        pygame.draw.rect(surf, COLORS['text'], rect, 2, border_radius=5)
+
+        lbl = '←' if key == 'BACK' else key
+        sf  = self.key_glyphs.glyph(lbl)
+        tw, th = sf.get_size()
+        surf.blit(
+            sf,
+            (rect.x + (KEY_W - tw)//2, rect.y + (KEY_H - th)//2)
+        )
+
+    def _draw_button(self, rect, label):
+        pygame.draw.rect(self.screen, COLORS['text'], rect, border_radius=5)
+        inner = rect.inflate(-4, -4)
+        pygame.draw.rect(self.screen, COLORS['bg'], inner, border_radius=5)
+        sf = render_text(self.small_font, label, COLORS['text'])
+        bx = rect.x + (BUTTON_W - sf.get_width())//2
+        by = rect.y + (BUTTON_H - sf.get_height())//2
+        self.screen.blit(sf, (bx, by))
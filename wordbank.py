@@ -0,0 +1,188 @@
+# wordbank.py
+
+import hashlib
+import random
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from config import WORD_LENGTH
+
+# Default dictionary source (compiled to words.<L>.pack on first use, see wordpack.py)
+WORDS_FILE = 'words.txt'
+
+# Banks larger than this keep their words in a DAWG (dawg.py) instead of
+# a tuple of str plus dict/frozenset indexes
+COMPACT_MIN_WORDS = 50_000
+
+
+def is_letter(ch: str) -> bool:
+    """True for a single A-Z letter, either case (what words may contain)."""
+    return len(ch) == 1 and ch.isascii() and ch.isalpha()
+
+
+def normalize_word(line: str) -> Optional[str]:
+    """
+    Strip and upper-case a dictionary line; None unless it's all A-Z.
+    Only the 26-letter alphabet is supported (packs, DAWGs, scoring and
+    the keyboard all index letters A=0..25), so accented words are dropped.
+    """
+    word = line.strip().upper()
+    if word and word.isascii() and word.isalpha():
+        return word
+    return None
+
+# ————————————————————————————————————————————————————————————————
+# The word bank
+# ————————————————————————————————————————————————————————————————
+
+class WordBank:
+    """
+    Immutable, indexed view of the dictionary for one word length.
+
+    Words are normalized (stripped, upper-cased, A-Z only), filtered to
+    the configured length and deduplicated. Each word gets a stable
+    integer ID: its position in the sorted word tuple. Banks loaded from
+    a compiled pack (from_pack) skip all of that and use the mapped
+    letter array as `encoded`.
+    """
+    def __init__(
+        self,
+        words: Sequence[str],
+        word_length: int = WORD_LENGTH,
+        source: Optional[str] = None
+    ):
+        normalized = {normalize_word(w) for w in words}
+        self._init(
+            tuple(sorted(w for w in normalized if w and len(w) == word_length)),
+            word_length, source
+        )
+
+    def _init(self, words, word_length, source, digest=None, encoded=None):
+        self.word_length = word_length
+        self.source      = source     # file the words came from, if any
+        self.words: Tuple[str, ...] = words
+
+        # O(1) membership and word -> ID lookup
+        self._ids: Dict[str, int] = {w: i for i, w in enumerate(self.words)}
+        self.word_set = frozenset(self._ids)
+
+        # content hash, used to key on-disk caches derived from this bank
+        self.digest = digest or hashlib.sha1(
+            f"{word_length}:{','.join(self.words)}".encode()
+        ).hexdigest()[:16]
+
+        self._encoded = encoded    # built on first use, see `encoded`
+
+    @classmethod
+    def from_file(cls, path: str = WORDS_FILE, word_length: int = WORD_LENGTH):
+        """Build a bank from a newline-separated word list."""
+        with open(path, encoding='utf-8', errors='replace') as f:
+            return cls(f, word_length, source=path)
+
+    @classmethod
+    def from_pack(cls, path: str, source: Optional[str] = None):
+        """
+        Load a compiled pack (see wordpack.py): the letters stay memory
+        mapped and the stored digest is trusted, so nothing is re-hashed.
+        `source` is what derived caches are named after (default: `path`).
+        """
+        import numpy as np
+        from wordpack import decode_letters, load_pack
+        header, letters = load_pack(path)
+        bank = cls.__new__(cls)
+        bank._init(
+            tuple(decode_letters(letters)), header.word_length, source or path,
+            digest=header.digest, encoded=letters.view(np.ndarray)
+        )
+        return bank
+
+    def __contains__(self, word) -> bool:
+        return word in self.word_set
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.words)
+
+    def __getitem__(self, word_id: int) -> str:
+        return self.words[word_id]
+
+    @property
+    def encoded(self):
+        """(N, word_length) uint8 letter array, row i = word ID i."""
+        if self._encoded is None:
+            from scoring import encode_words
+            self._encoded = encode_words(self.words)
+        return self._encoded
+
+    def id_of(self, word: str) -> Optional[int]:
+        """Return the stable ID of `word`, or None if it isn't in the bank."""
+        return self._ids.get(word)
+
+    def random_word(self, rng: Optional[random.Random] = None) -> str:
+        """Pick a uniformly random word in O(1)."""
+        return (rng or random).choice(self.words)
+
+
+# ————————————————————————————————————————————————————————————————
+# Shared instances: one bank per (file, length) per process
+# ————————————————————————————————————————————————————————————————
+
+_BANKS: Dict[Tuple[str, int], WordBank] = {}
+_BANKS_LOCK = threading.Lock()
+
+
+def get_word_bank(path: str = WORDS_FILE, word_length: int = WORD_LENGTH) -> WordBank:
+    """Return the shared WordBank, loading it on first use."""
+    key = (path, word_length)
+    bank = _BANKS.get(key)
+    if bank is None:
+        with _BANKS_LOCK:
+            bank = _BANKS.get(key)
+            if bank is None:
+                bank = _load(path, word_length)
+                _BANKS[key] = bank
+    return bank
+
+
+def _load(path: str, word_length: int) -> WordBank:
+    """From the compiled pack, (re)building it if needed; text fallback."""
+    from wordpack import ensure_pack
+    try:
+        try:
+            return _from_pack(ensure_pack(path, word_length), path)
+        except ValueError:
+            # damaged or old-format pack: recompile it once
+            return _from_pack(ensure_pack(path, word_length, rebuild=True), path)
+    except (OSError, ValueError):
+        # read-only install or a damaged pack: parse the text list directly
+        return WordBank.from_file(path, word_length)
+
+
+def _from_pack(pack: str, source: str) -> WordBank:
+    from wordpack import read_header
+    with open(pack, 'rb') as fp:
+        count = read_header(fp).count
+    if count > COMPACT_MIN_WORDS:
+        from dawg import CompactWordBank
+        return CompactWordBank.from_pack(pack, source)
+    return WordBank.from_pack(pack, source)
+
+
+def available_lengths(lengths: Iterable[int], path: str = WORDS_FILE) -> List[int]:
+    """
+    The word lengths in `lengths` that `path` has any words of. Reads
+    only pack headers, so no bank is loaded for lengths never played.
+    """
+    from wordpack import ensure_pack, read_header
+    found = []
+    for word_length in lengths:
+        try:
+            with open(ensure_pack(path, word_length), 'rb') as fp:
+                count = read_header(fp).count
+        except (OSError, ValueError):
+            count = len(get_word_bank(path, word_length))
+        if count:
+            found.append(word_length)
+    return found
@@ -0,0 +1,309 @@
+# wordpack.py
+#
+# Offline dictionary ingest: stream one or more raw word lists into
+# compiled, length-sharded packs that WordBank memory-maps at runtime.
+#
+#   python wordpack.py ingest words.txt                  # -> words.<L>.pack per length
+#   python wordpack.py ingest big1.txt big2.txt --out big --lengths 4-8
+#   python wordpack.py info words.5.pack
+#
+# Pack layout (little endian):
+#   64-byte header: magic, version, word length, word count, CRC-32 of
+#                   the payload, WordBank digest
+#   payload:        count x word_length uint8 letter indexes (A=0),
+#                   sorted and deduplicated, so row i is word ID i
+# Only A-Z words are kept; anything else (accents, other scripts) is
+# counted as rejected.
+
+import argparse
+import hashlib
+import heapq
+import os
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from functools import partial
+from typing import BinaryIO, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from wordbank import WORDS_FILE, normalize_word
+
+MAGIC       = b'WPAK'
+VERSION     = 1
+HEADER      = struct.Struct('<4sHBxQI16s')
+HEADER_SIZE = 64
+
+# Words buffered in memory (over all lengths) before a sorted run is spilled
+CHUNK_WORDS = 1_000_000
+
+# Records read/written per I/O call while merging runs
+IO_RECORDS = 8192
+
+_TO_INDEX  = bytes((b - ord('A')) & 0xFF for b in range(256))   # 'A' -> 0 ...
+
+
+class PackHeader(NamedTuple):
+    word_length: int
+    count:       int
+    crc:         int
+    digest:      str
+
+
+def pack_path(stem: str, word_length: int) -> str:
+    """`<stem>.<word_length>.pack`, e.g. words.5.pack."""
+    return f"{stem}.{word_length}.pack"
+
+
+def default_stem(source: str) -> str:
+    return os.path.splitext(source)[0]
+
+# ————————————————————————————————————————————————————————————————
+# Reading
+# ————————————————————————————————————————————————————————————————
+
+def read_header(fp: BinaryIO) -> PackHeader:
+    raw = fp.read(HEADER_SIZE)
+    if len(raw) < HEADER_SIZE:
+        raise ValueError("truncated pack header")
+    magic, version, word_length, count, crc, digest = HEADER.unpack_from(raw)
+    if magic != MAGIC:
+        raise ValueError("not a word pack")
+    if version != VERSION:
+        raise ValueError(f"unsupported pack version {version}")
+    return PackHeader(word_length, count, crc, digest.decode('ascii'))
+
+
+def load_pack(path: str, verify: bool = True):
+    """
+    Return (header, letters) where `letters` is a read-only
+    (count, word_length) uint8 memmap of the payload. `verify` checks the
+    payload size and CRC (one sequential pass over the mapped pages).
+    """
+    with open(path, 'rb') as fp:
+        header = read_header(fp)
+        size   = os.fstat(fp.fileno()).st_size
+    L, n = header.word_length, header.count
+    if size != HEADER_SIZE + n * L:
+        raise ValueError(f"{path}: payload size doesn't match header")
+    if n == 0:
+        return header, np.zeros((0, L), dtype=np.uint8)
+
+    letters = np.memmap(path, dtype=np.uint8, mode='r', offset=HEADER_SIZE, shape=(n, L))
+    if verify and zlib.crc32(letters) != header.crc:
+        raise ValueError(f"{path}: checksum mismatch")
+    return header, letters
+
+
+def decode_letters(letters: np.ndarray) -> List[str]:
+    """(N, L) letter indexes -> upper-case words."""
+    n, L = letters.shape if letters.ndim == 2 else (0, 0)
+    text = (np.asarray(letters) + ord('A')).astype(np.uint8).tobytes().decode('ascii')
+    return [text[i:i + L] for i in range(0, n * L, L)]
+
+# ————————————————————————————————————————————————————————————————
+# Ingest: normalize -> bounded in-memory runs -> k-way merge per length
+# ————————————————————————————————————————————————————————————————
+
+class IngestReport:
+    """What ingest() saw and wrote."""
+    def __init__(self):
+        self.lines    = 0
+        self.rejected = 0                    # blank, non A-Z or outside `lengths`
+        self.runs     = 0                    # sorted runs spilled to disk
+        self.counts: Dict[int, int] = {}     # word length -> unique words written
+        self.paths:  Dict[int, str] = {}     # word length -> pack file
+
+    @property
+    def words(self) -> int:
+        return sum(self.counts.values())
+
+
+def _stream_words(sources: Iterable[str], report: IngestReport, lengths) -> Iterator[bytes]:
+    for source in sources:
+        with open(source, encoding='utf-8', errors='replace') as f:
+            for line in f:
+                report.lines += 1
+                word = normalize_word(line)
+                if word is None or (lengths is not None and len(word) not in lengths):
+                    report.rejected += 1
+                    continue
+                yield word.encode('ascii')
+
+
+def _spill(run_dir: str, word_length: int, words: set, runs: List[str]):
+    path = os.path.join(run_dir, f"{word_length}.{len(runs)}.run")
+    with open(path, 'wb') as fp:
+        fp.write(b''.join(sorted(words)))
+    runs.append(path)
+
+
+def _read_run(path: str, word_length: int) -> Iterator[bytes]:
+    with open(path, 'rb') as fp:
+        for block in iter(partial(fp.read, word_length * IO_RECORDS), b''):
+            for i in range(0, len(block), word_length):
+                yield block[i:i + word_length]
+
+
+def _write_pack(path: str, word_length: int, words: Iterator[bytes]) -> int:
+    """Write sorted `words` (duplicates allowed) as a pack; returns the unique count."""
+    crc, count, last = 0, 0, None
+    digest = hashlib.sha1(f"{word_length}:".encode())   # same digest as WordBank
+    batch: List[bytes] = []
+
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp',
+                               dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, 'wb') as fp:
+            fp.write(bytes(HEADER_SIZE))      # placeholder, filled in below
+
+            def flush():
+                data = b''.join(batch).translate(_TO_INDEX)
+                fp.write(data)
+                batch.clear()
+                return zlib.crc32(data, crc)
+
+            for word in words:
+                if word == last:
+                    continue
+                digest.update(b',' + word if count else word)
+                batch.append(word)
+                last   = word
+                count += 1
+                if len(batch) >= IO_RECORDS:
+                    crc = flush()
+            crc = flush()
+
+            header = HEADER.pack(MAGIC, VERSION, word_length, count, crc,
+                                 digest.hexdigest()[:16].encode('ascii'))
+            fp.seek(0)
+            fp.write(header.ljust(HEADER_SIZE, b'\0'))
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return count
+
+
+def ingest(
+    sources: Sequence[str],
+    stem: Optional[str] = None,
+    lengths: Optional[Iterable[int]] = None,
+    chunk: int = CHUNK_WORDS
+) -> IngestReport:
+    """
+    Compile raw word lists into `<stem>.<L>.pack` files, one per word
+    length seen (or per length in `lengths`, written even if empty).
+    Memory is bounded by `chunk` buffered words: full buffers are
+    sorted, deduplicated and spilled as runs, and each length's runs are
+    merged in a single streaming pass while the pack is written.
+    """
+    stem    = stem or default_stem(sources[0])
+    lengths = None if lengths is None else frozenset(lengths)
+    report  = IngestReport()
+
+    out_dir = os.path.dirname(os.path.abspath(stem))
+    with tempfile.TemporaryDirectory(prefix='.ingest-', dir=out_dir) as run_dir:
+        buffers: Dict[int, set] = {}
+        runs:    Dict[int, List[str]] = {}
+        buffered = 0
+        for word in _stream_words(sources, report, lengths):
+            buf = buffers.setdefault(len(word), set())
+            if word not in buf:
+                buf.add(word)
+                buffered += 1
+                if buffered >= chunk:
+                    for L, full in buffers.items():
+                        if full:
+                            _spill(run_dir, L, full, runs.setdefault(L, []))
+                            report.runs += 1
+                            full.clear()
+                    buffered = 0
+
+        for L in sorted(set(buffers) | set(lengths or ())):
+            streams = [_read_run(p, L) for p in runs.get(L, [])]
+            streams.append(iter(sorted(buffers.get(L, ()))))
+            path = pack_path(stem, L)
+            report.counts[L] = _write_pack(path, L, heapq.merge(*streams))
+            report.paths[L]  = path
+            buffers.pop(L, None)
+    return report
+
+# ————————————————————————————————————————————————————————————————
+# Runtime: keep packs in sync with their text source
+# ————————————————————————————————————————————————————————————————
+
+def is_fresh(path: str, source: Optional[str]) -> bool:
+    """True if `path` exists and isn't older than `source` (if that exists)."""
+    if not os.path.exists(path):
+        return False
+    if source is None or not os.path.exists(source):
+        return True
+    return os.path.getmtime(path) >= os.path.getmtime(source)
+
+
+# The preload thread and the menu's available_lengths() may both get here
+_ENSURE_LOCK = threading.Lock()
+
+
+def ensure_pack(source: str, word_length: int, rebuild: bool = False) -> str:
+    """
+    Path of the pack for `source` at `word_length`, compiling every
+    length of `source` first if the pack is missing, older than it or
+    `rebuild` is set. One compile at a time per process.
+    Raises OSError if it can't be written (e.g. read-only install).
+    """
+    stem = default_stem(source)
+    path = pack_path(stem, word_length)
+    with _ENSURE_LOCK:
+        if rebuild or not is_fresh(path, source):
+            ingest([source], stem)
+            if not os.path.exists(path):
+                # no words of this length: still a valid (empty) pack
+                ingest([source], stem, lengths=[word_length])
+    return path
+
+# ————————————————————————————————————————————————————————————————
+# CLI
+# ————————————————————————————————————————————————————————————————
+
+def _parse_lengths(spec: str) -> List[int]:
+    lo, _, hi = spec.partition('-')
+    return list(range(int(lo), int(hi or lo) + 1))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile word lists into length-sharded packs")
+    sub = parser.add_subparsers(dest='cmd', required=True)
+
+    ing = sub.add_parser('ingest', help="stream word lists into <out>.<L>.pack files")
+    ing.add_argument('sources', nargs='*', default=[WORDS_FILE])
+    ing.add_argument('--out', help="output stem (default: first source without extension)")
+    ing.add_argument('--lengths', type=_parse_lengths, help="e.g. 5 or 4-8 (default: all)")
+    ing.add_argument('--chunk', type=int, default=CHUNK_WORDS, help="words buffered per run")
+
+    inf = sub.add_parser('info', help="print and verify a pack header")
+    inf.add_argument('paths', nargs='+')
+    args = parser.parse_args()
+
+    if args.cmd == 'ingest':
+        start  = time.perf_counter()
+        report = ingest(args.sources, args.out, args.lengths, args.chunk)
+        took   = time.perf_counter() - start
+        print(f"{report.lines} lines, {report.rejected} rejected, "
+              f"{report.words} unique words, {report.runs} runs spilled in {took:.2f}s")
+        for L, path in report.paths.items():
+            print(f"  {path}: {report.counts[L]} words")
+    else:
+        for path in args.paths:
+            header, _ = load_pack(path)
+            print(f"{path}: {header.count} words of length {header.word_length}, "
+                  f"crc {header.crc:08x}, digest {header.digest} (ok)")
+
+
+if __name__ == "__main__":
+    main()